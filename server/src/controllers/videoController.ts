@@ -53,7 +53,7 @@ export const createSummary = async (req: Request, res: Response, next: NextFunct
     }
 
     // Python betiğini kullanarak özet oluştur
-    const summaryData = await generateVideoSummary(videoUrl, language);
+    const summaryData = await generateVideoSummary(videoUrl, language, req.user?.id);
     logger.info(`Video özeti başarıyla oluşturuldu: ${videoUrl}`);
 
     // Özet nesnesini oluştur
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Kanal işleme benchmark'ı: --channel_id akışını sahte bir YouTube sunucusuna karşı
+farklı worker sayılarıyla çalıştırır ve duvar saati süresini karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_channel.py --videos 50 --latency 0.05 --workers 1 8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import video_summary  # noqa: E402
+from cache import get_cache  # noqa: E402
+from fingerprint import get_index as get_fingerprint_index  # noqa: E402
+from result_store import get_result_store  # noqa: E402
+from search_index import get_search_index  # noqa: E402
+from benchmarks.fake_youtube import FakeYouTubeServer  # noqa: E402
+
+
+def run(worker_counts, video_count, latency, rate_limit):
+    with FakeYouTubeServer(latency=latency, video_count=video_count) as server:
+        server.install(video_summary)
+        # Her çalıştırma ağa gitsin; önbellek karşılaştırmayı bozmasın
+        get_cache().enabled = False
+        get_fingerprint_index().enabled = False
+        get_result_store().enabled = False
+        get_search_index().enabled = False
+        timings = {}
+        for workers in worker_counts:
+            started = time.perf_counter()
+            results = video_summary.process_channel(
+                "UCfakechannel", video_count, 'tr', workers=workers, rate_limit=rate_limit
+            )
+            elapsed = time.perf_counter() - started
+            timings[workers] = elapsed
+            assert [r['video_id'] for r in results] == sorted(r['video_id'] for r in results), "Sıra korunmadı"
+            print(f"workers={workers:<3} videos={len(results):<4} süre={elapsed:.2f}s")
+
+        videos_calls = server.request_counts['/youtube/v3/videos']
+        print(f"videos.list çağrısı: {videos_calls} ({len(worker_counts)} çalıştırma, {video_count} video)")
+
+    baseline = timings[worker_counts[0]]
+    for workers, elapsed in timings.items():
+        print(f"workers={workers:<3} hızlanma={baseline / elapsed:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Kanal işleme eşzamanlılık benchmark\'ı')
+    parser.add_argument('--videos', type=int, default=50, help='Sahte kanaldaki video sayısı')
+    parser.add_argument('--latency', type=float, default=0.05, help='Her sahte istek için gecikme (saniye)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 8], help='Denenecek worker sayıları')
+    parser.add_argument('--rate_limit', type=float, default=0, help='Saniyedeki istek sınırı (0: sınırsız)')
+    args = parser.parse_args()
+
+    run(args.workers, args.videos, args.latency, args.rate_limit)
+
+
+if __name__ == "__main__":
+    main()
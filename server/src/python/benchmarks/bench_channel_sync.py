@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Artımlı kanal senkronizasyonu benchmark'ı: büyük bir sahte kanalı önce tamamen işler,
+ardından birkaç yeni yükleme ekleyip --since_last_run moduyla yeniden çalıştırır ve
+search sayfası, özetlenen video ve süre sayılarını karşılaştırır. Son olarak yeni
+yüklemeler max_videos'tan fazlayken ardışık --since_last_run çalıştırmalarının farkın
+tamamını kaybetmeden işlediği doğrulanır.
+
+Kullanım:
+    python benchmarks/bench_channel_sync.py --videos 200 --new 3
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import video_summary  # noqa: E402
+import sync_state  # noqa: E402
+from cache import get_cache  # noqa: E402
+from fingerprint import get_index as get_fingerprint_index  # noqa: E402
+from result_store import get_result_store  # noqa: E402
+from search_index import get_search_index  # noqa: E402
+from benchmarks.fake_youtube import FakeYouTubeServer  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Artımlı kanal senkronizasyonu benchmark\'ı')
+    parser.add_argument('--videos', type=int, default=200, help='Sahte kanaldaki video sayısı')
+    parser.add_argument('--new', type=int, default=3, help='İkinci çalıştırmadan önce eklenecek yeni video')
+    parser.add_argument('--latency', type=float, default=0.01, help='Her sahte istek için gecikme (saniye)')
+    parser.add_argument('--workers', type=int, default=8, help='Eşzamanlı video sayısı')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory, \
+            FakeYouTubeServer(latency=args.latency, video_count=args.videos) as server:
+        server.install(video_summary)
+        get_cache().enabled = False
+        get_fingerprint_index().enabled = False
+        get_result_store().enabled = False
+        get_search_index().enabled = False
+        sync_state._default_state = sync_state.ChannelSyncState(os.path.join(directory, 'sync.sqlite3'))
+
+        def run(label, since_last_run, max_videos=None):
+            searches_before = server.request_counts['/youtube/v3/search']
+            started = time.perf_counter()
+            results = video_summary.process_channel(
+                "UCfakechannel", max_videos or args.videos + args.new, 'tr', workers=args.workers, rate_limit=0,
+                since_last_run=since_last_run
+            )
+            elapsed = time.perf_counter() - started
+            searches = server.request_counts['/youtube/v3/search'] - searches_before
+            print(f"{label:<26} {len(results):>4} video, {searches:>2} search sayfası, {elapsed:6.2f}s")
+            return results
+
+        run("ilk tam senkronizasyon", False)
+        unchanged = run("değişiklik yok", True)
+        assert not unchanged, "Değişmeyen kanalda video işlendi"
+        server.upload(args.new)
+        delta = run(f"{args.new} yeni yükleme", True)
+        assert [r['video_id'] for r in delta] == [f"new{i:08d}" for i in reversed(range(args.new))], "Yanlış fark"
+        run("tam yeniden işleme", False)
+
+        # Fark max_videos'a sığmazsa kalanlar sonraki çalıştırmalarda işlenir
+        server.upload(args.new * 3)
+        expected = [f"new{i:08d}" for i in reversed(range(args.new, args.new * 4))]
+        processed = []
+        while True:
+            batch = run(f"kesilmiş fark ({args.new}'er)", True, args.new)
+            if not batch:
+                break
+            processed += [r['video_id'] for r in batch]
+        assert processed == expected, "Kesilen farkta video kayboldu"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Map-reduce özetleme benchmark'ı: çevrimdışı LocalStubBackend ile uzun bir sentetik
+transkripti özetler; ilk çalıştırmayı, önbellekten yeniden çalıştırmayı ve tek bir
+segmenti değiştirilmiş transkriptte yeniden hesaplanan parça sayısını karşılaştırır.
+
+Tek segment değiştiğinde değişen parçanın özeti ve kökten ona giden her birleştirme
+düzeyindeki grup yeniden özetlenir: en kötü durumda 1 + birleştirme düzeyi kadar çağrı.
+Çıkarımsal LocalStubBackend değişen parçadan çoğu zaman aynı cümleleri seçtiği için
+üst düzeyler önbellekten gelir; "yayılan" modda özet girdinin özetini de taşır ve her
+değişiklik köke kadar yayılır (LLM arka uçlarındaki durum).
+
+Kullanım:
+    python benchmarks/bench_chunked_summary.py --hours 6 --max_chunk_tokens 3000
+"""
+
+import argparse
+import os
+import zlib
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cache import DiskCache  # noqa: E402
+from chunked_summarizer import ChunkedSummarizer, LocalStubBackend, estimate_tokens  # noqa: E402
+from data_pipeline import TranscriptProcessor  # noqa: E402
+from benchmarks.bench_summarizer import synthetic_segments  # noqa: E402
+
+
+class CountingBackend:
+    """Arka uca yapılan çağrıları sayan sarmalayıcı"""
+
+    def __init__(self, backend, propagate=False):
+        self.backend = backend
+        self.name = backend.name
+        self.propagate = propagate
+        self.calls = 0
+
+    def summarize(self, text, max_tokens):
+        self.calls += 1
+        summary = self.backend.summarize(text, max_tokens)
+        if self.propagate:
+            # Girdideki her değişiklik özeti de değiştirir
+            summary += f" [{zlib.crc32(text.encode('utf-8')):08x}]"
+        return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Map-reduce özetleme benchmark\'ı')
+    parser.add_argument('--hours', type=float, default=6, help='Sentetik video süresi (saat)')
+    parser.add_argument('--max_chunk_tokens', type=int, default=3000, help='Parça başına token bütçesi')
+    parser.add_argument('--concurrency', type=int, default=4, help='Eşzamanlı özet çağrısı')
+    args = parser.parse_args()
+
+    processor = TranscriptProcessor()
+    segments = synthetic_segments(args.hours)
+    processed = processor.process(segments)
+    print(f"{args.hours:g} saat, ~{estimate_tokens(processed.full_text)} token")
+
+    edited_segments = [dict(segment) for segment in segments]
+    edited_segments[len(segments) // 2]['text'] = "Bu segment sonradan düzeltildi."
+    edited = processor.process(edited_segments)
+
+    for propagate in (False, True):
+        print("yayılan özet" if propagate else "çıkarımsal özet")
+        with tempfile.TemporaryDirectory() as directory:
+            backend = CountingBackend(LocalStubBackend(), propagate)
+            summarizer = ChunkedSummarizer(
+                backend, max_chunk_tokens=args.max_chunk_tokens, concurrency=args.concurrency,
+                cache=DiskCache(os.path.join(directory, 'cache.sqlite3'))
+            )
+
+            def run(label, transcript):
+                calls_before = backend.calls
+                started = time.perf_counter()
+                result = summarizer.summarize(transcript)
+                elapsed = time.perf_counter() - started
+                assert all(chunk.tokens <= args.max_chunk_tokens for chunk in result.chunks), "Bütçe aşıldı"
+                print(f"  {label:<22} {elapsed * 1000:8.0f} ms, {len(result.chunks)} parça, {result.levels} "
+                      f"birleştirme düzeyi, {backend.calls - calls_before} arka uç çağrısı")
+                return result
+
+            first = run("ilk çalıştırma", processed)
+            again = run("yeniden çalıştırma", processed)
+            assert again.summary == first.summary, "Önbellekten gelen özet farklı"
+            run("tek segment değişti", edited)
+
+
+if __name__ == "__main__":
+    main()
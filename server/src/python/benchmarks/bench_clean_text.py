@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+clean_text benchmark'ı ve eşdeğerlik kontrolü.
+
+Tek geçişlik CLEAN_PATTERN temizleyicisini önceki sıralı re.sub zinciriyle
+karşılaştırır: önce rastgele üretilmiş girdilerde çıktıların birebir aynı olduğunu
+doğrular, ardından büyük sentetik bir transkript derlemi üzerinde süreleri ölçer.
+
+Kullanım:
+    python benchmarks/bench_clean_text.py --cases 20000 --segments 200000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_pipeline import TranscriptProcessor  # noqa: E402
+
+# Rastgele girdilerde özellikle etkileşimli durumları üretecek parçalar
+FRAGMENTS = [
+    'a', 'Merhaba', 'yapay', 'zeka', 'ş', 'İ', 'ı', ' ', '  ', '\n', '\t', '\xa0', '\x85', ' ',
+    '.', '..', '...', '!?', '?!.', '&', ';', '#', '&amp;', '&lt;', '&gt;', '&quot;', '&#39;',
+    '&amp;amp;', '&amp;lt;', '&amp;#39;', '&amp;quot;', '&amp;&amp;lt;', '&#3', '&amp',
+    'http://x.y/z', 'https://q', 'http://', 'https://a&amp;b', 'http:// x', 'www.site.com', 'h',
+]
+
+
+def legacy_clean_text(text: str) -> str:
+    """Önceki sıralı re.sub zinciri (referans uygulama)"""
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'&amp;', '&', text)
+    text = re.sub(r'&lt;', '<', text)
+    text = re.sub(r'&gt;', '>', text)
+    text = re.sub(r'&quot;', '"', text)
+    text = re.sub(r'&#39;', "'", text)
+    text = re.sub(r'[.!?]{2,}', '.', text)
+    text = re.sub(r'https?://\S+', '', text)
+    return text.strip()
+
+
+def random_text(rnd: random.Random) -> str:
+    return ''.join(rnd.choice(FRAGMENTS) for _ in range(rnd.randint(0, 24)))
+
+
+def check_equivalence(cases: int, seed: int) -> None:
+    processor = TranscriptProcessor()
+    rnd = random.Random(seed)
+    for case in range(cases):
+        text = random_text(rnd)
+        expected = legacy_clean_text(text)
+        actual = processor.clean_text(text)
+        if actual != expected:
+            raise AssertionError(f"Fark bulundu (durum {case}): {text!r} -> {actual!r} != {expected!r}")
+    print(f"eşdeğerlik: {cases} rastgele durum birebir aynı")
+
+
+def synthetic_corpus(segment_count: int, seed: int):
+    rnd = random.Random(seed)
+    words = ['yapay', 'zeka', 'öğrenme', 'model', 'veri', 'the', 'and', 'learning', 'ağ', 'sistem']
+    extras = ['&#39;s', '&amp;', '&quot;', '...', '\n', 'https://example.com/x', '  ']
+    segments = []
+    for _ in range(segment_count):
+        tokens = [rnd.choice(words) for _ in range(rnd.randint(4, 12))]
+        if rnd.random() < 0.3:
+            tokens.insert(rnd.randrange(len(tokens)), rnd.choice(extras))
+        segments.append(' '.join(tokens) + rnd.choice(['.', '', '?', '\n']))
+    return segments
+
+
+def bench(segment_count: int, seed: int) -> None:
+    processor = TranscriptProcessor()
+    segments = synthetic_corpus(segment_count, seed)
+    total_chars = sum(len(segment) for segment in segments)
+
+    for name, run in (
+        ('eski (8 geçiş)', lambda: [legacy_clean_text(segment) for segment in segments]),
+        ('clean_text', lambda: [processor.clean_text(segment) for segment in segments]),
+        ('clean_texts', lambda: processor.clean_texts(segments)),
+    ):
+        started = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - started
+        print(f"{name:<16} {elapsed * 1000:8.1f} ms  {total_chars / elapsed / 1e6:6.1f} MB/s")
+
+    assert processor.clean_texts(segments) == [legacy_clean_text(segment) for segment in segments]
+    assert result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='clean_text eşdeğerlik kontrolü ve benchmark\'ı')
+    parser.add_argument('--cases', type=int, default=20000, help='Rastgele eşdeğerlik durumu sayısı')
+    parser.add_argument('--segments', type=int, default=200000, help='Sentetik derlemdeki segment sayısı')
+    parser.add_argument('--seed', type=int, default=0, help='Rastgelelik tohumu')
+    args = parser.parse_args()
+
+    check_equivalence(args.cases, args.seed)
+    bench(args.segments, args.seed)
+
+
+if __name__ == "__main__":
+    main()
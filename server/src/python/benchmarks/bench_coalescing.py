@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+İstek birleştirme yük testi: birkaç "viral" videonun özeti için aynı anda gelen
+çok sayıda isteği worker'ın serve() döngüsünden geçirir ve sahte YouTube sunucusuna
+giden istekleri birleştirme açıkken ve kapalıyken karşılaştırır.
+
+Her mod boş bir önbellek ve sonuç deposuyla başlar; böylece ani yük, ilk özet henüz
+tamamlanmadan gelen isteklerin durumunu canlandırır.
+
+Kullanım:
+    python benchmarks/bench_coalescing.py --requests 48 --videos 3 --latency 0.05
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('VIDEOBITE_DEDUP_DISABLED', '1')
+os.environ.setdefault('VIDEOBITE_DF_DISABLED', '1')
+os.environ.setdefault('VIDEOBITE_SEARCH_DISABLED', '1')
+
+import video_summary  # noqa: E402
+import cache  # noqa: E402
+import result_store  # noqa: E402
+from scheduler import JobScheduler  # noqa: E402
+from single_flight import SingleFlight  # noqa: E402
+from benchmarks.fake_youtube import FakeYouTubeServer, fake_video_id  # noqa: E402
+
+UPSTREAM_PATHS = ('/youtube/v3/videos', '/watch', '/timedtext')
+
+
+def run(server, directory, requests, videos, concurrency, coalesce):
+    cache._default_cache = cache.DiskCache(os.path.join(directory, 'cache.sqlite3'))
+    result_store._default_store = result_store.ResultStore(os.path.join(directory, 'results.sqlite3'))
+    video_summary.summary_flights = SingleFlight(enabled=coalesce)
+
+    jobs = [
+        json.dumps({"id": number, "video_id": fake_video_id(number % videos), "timings": True})
+        for number in range(requests)
+    ]
+    before = {path: server.request_counts[path] for path in UPSTREAM_PATHS}
+    output = io.StringIO()
+    scheduler = JobScheduler(workers=concurrency).start()
+    started = time.perf_counter()
+    video_summary.serve(jobs, output, scheduler=scheduler)
+    elapsed = time.perf_counter() - started
+    scheduler.shutdown()
+
+    responses = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert len(responses) == requests and all(response["ok"] for response in responses), "Başarısız iş var"
+    by_video = {}
+    for response in responses:
+        result = response["result"]
+        assert by_video.setdefault(result["videoId"], result) == result, "Aynı video için farklı sonuç"
+    coalesced = sum(response["timings"]["counters"].get("coalesced", 0) for response in responses)
+    calls = {path: server.request_counts[path] - before[path] for path in UPSTREAM_PATHS}
+    return elapsed, calls, coalesced, video_summary.summary_flights.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='İstek birleştirme yük testi')
+    parser.add_argument('--requests', type=int, default=48, help='Aynı anda gelen istek sayısı')
+    parser.add_argument('--videos', type=int, default=3, help='İsteklerin dağıldığı farklı video sayısı')
+    parser.add_argument('--concurrency', type=int, default=16, help='Worker\'ın eşzamanlı iş sayısı')
+    parser.add_argument('--latency', type=float, default=0.05, help='Her sahte istek için gecikme (saniye)')
+    args = parser.parse_args()
+
+    with FakeYouTubeServer(latency=args.latency, video_count=args.videos) as server:
+        server.install(video_summary)
+        print(f"{args.requests} istek, {args.videos} video, {args.concurrency} eşzamanlı iş")
+        print(f"{'birleştirme':<12} {'süre':>7} {'videos.list':>12} {'watch':>6} {'timedtext':>10} "
+              f"{'birleşen':>9} {'hesaplama':>10}")
+        for coalesce in (False, True):
+            with tempfile.TemporaryDirectory() as directory:
+                elapsed, calls, coalesced, stats = run(
+                    server, directory, args.requests, args.videos, args.concurrency, coalesce
+                )
+            print(f"{'açık' if coalesce else 'kapalı':<12} {elapsed:6.2f}s {calls['/youtube/v3/videos']:>12} "
+                  f"{calls['/watch']:>6} {calls['/timedtext']:>10} {int(coalesced):>9} {stats['executions']:>10}")
+
+
+if __name__ == "__main__":
+    main()
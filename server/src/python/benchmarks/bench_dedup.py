@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Kopya tespiti benchmark'ı: sentetik bir derlem (varsayılan 100k transkript) için
+parmak izlerini LSH indeksine ekler; içine yerleştirilmiş birebir ve yakın kopyaları
+arar. LSH sorgusunun süresini tüm imzaların doğrusal taranmasıyla karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_dedup.py --count 100000 --queries 200
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fingerprint import FingerprintIndex, fingerprint_text  # noqa: E402
+from benchmarks.bench_summarizer import VOCABULARY  # noqa: E402
+
+# Belgeler birbirine fazla benzemesin diye sözlük sentetik kelimelerle genişletilir
+WORDS = VOCABULARY + [f"kelime{i}" for i in range(5000)]
+
+
+def synthetic_document(rnd: random.Random, words: int = 120) -> list:
+    return [rnd.choice(WORDS) for _ in range(words)]
+
+
+def near_duplicate(rnd: random.Random, tokens: list, edits: int = 3) -> list:
+    """Birkaç kelimesi değiştirilmiş kopya (ör. farklı giriş/kapanış cümlesi)"""
+    tokens = list(tokens)
+    for _ in range(edits):
+        tokens[rnd.randrange(len(tokens))] = rnd.choice(WORDS)
+    return tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Kopya tespiti benchmark\'ı')
+    parser.add_argument('--count', type=int, default=100000, help='Derlemdeki transkript sayısı')
+    parser.add_argument('--queries', type=int, default=200, help='Yakın kopya sorgusu sayısı')
+    parser.add_argument('--edits', type=int, default=1, help='Yakın kopyalarda değiştirilen kelime sayısı')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    documents = [synthetic_document(rnd) for _ in range(args.count)]
+
+    started = time.perf_counter()
+    fingerprints = [fingerprint_text(" ".join(tokens)) for tokens in documents]
+    elapsed = time.perf_counter() - started
+    print(f"parmak izi: {args.count} belge, {elapsed:.1f}s ({elapsed / args.count * 1e6:.0f} µs/belge)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = FingerprintIndex(os.path.join(directory, 'fingerprints.sqlite3'))
+        started = time.perf_counter()
+        batch = 5000
+        for offset in range(0, args.count, batch):
+            index.add_many(
+                (f"doc{offset + i}", 'tr', fingerprints[offset + i], {"summary": f"özet {offset + i}"})
+                for i in range(min(batch, args.count - offset))
+            )
+        print(f"indeksleme: {time.perf_counter() - started:.1f}s, {index.count()} kayıt")
+
+        targets = [rnd.randrange(args.count) for _ in range(args.queries)]
+        exact_queries = [fingerprints[target] for target in targets]
+        near_queries = [fingerprint_text(" ".join(near_duplicate(rnd, documents[target], args.edits))) for target in targets]
+        unrelated_queries = [fingerprint_text(" ".join(synthetic_document(rnd))) for _ in targets]
+
+        def run(label, queries, expected):
+            started = time.perf_counter()
+            results = [index.find(query, 'tr') for query in queries]
+            elapsed = time.perf_counter() - started
+            hits = sum(1 for result, target in zip(results, expected)
+                       if result is not None and (target is None or result[0] == f"doc{target}"))
+            print(f"{label:<16} {elapsed / len(queries) * 1000:7.2f} ms/sorgu, eşleşme {hits}/{len(queries)}")
+
+        run("birebir", exact_queries, targets)
+        run("yakın kopya", near_queries, targets)
+        run("ilgisiz", unrelated_queries, [None] * len(targets))
+
+        # Karşılaştırma: LSH olmadan tüm imzalarla benzerlik hesaplamak
+        sample = near_queries[:5]
+        started = time.perf_counter()
+        for query in sample:
+            max(fingerprints, key=query.similarity)
+        linear = (time.perf_counter() - started) / len(sample)
+        print(f"doğrusal tarama  {linear * 1000:7.2f} ms/sorgu")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+data_pipeline import süresi benchmark'ı ve regresyon eşiği.
+
+Modülü `python -X importtime` ile ayrı süreçlerde birkaç kez içe aktarır, kümülatif
+süresinin medyanını raporlar ve eşik aşılırsa sıfır dışı kodla çıkar. Ayrıca import
+sırasında NLTK'nın yüklenmediğini ve hiçbir ağ bağlantısı açılmadığını doğrular.
+
+Kullanım:
+    python benchmarks/bench_import_time.py --runs 7 --threshold_ms 100
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Ağ erişimini engeller, modülü içe aktarır ve NLTK'nın tembel kaldığını doğrular
+IMPORT_SNIPPET = """
+import socket, sys
+def _blocked(*args, **kwargs):
+    raise RuntimeError("import sırasında ağ erişimi")
+socket.socket.connect = _blocked
+socket.create_connection = _blocked
+import {module}
+assert 'nltk' not in sys.modules, "nltk import sırasında yüklendi"
+"""
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+(\S+)\s*$')
+
+
+def measure(module: str) -> float:
+    """Modülün kümülatif import süresini milisaniye olarak döndürür"""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_SNIPPET.format(module=module)],
+        cwd=PYTHON_DIR, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match and match.group(2) == module:
+            return int(match.group(1)) / 1000
+    raise RuntimeError(f"{module} için importtime satırı bulunamadı")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='data_pipeline import süresi benchmark\'ı')
+    parser.add_argument('--module', type=str, default='data_pipeline', help='Ölçülecek modül')
+    parser.add_argument('--runs', type=int, default=7, help='Ölçüm sayısı')
+    parser.add_argument('--threshold_ms', type=float, default=100.0, help='Medyan için regresyon eşiği')
+    args = parser.parse_args()
+
+    timings = [measure(args.module) for _ in range(args.runs)]
+    median = statistics.median(timings)
+    print(f"{args.module}: medyan={median:.1f} ms  min={min(timings):.1f} ms  max={max(timings):.1f} ms")
+
+    if median > args.threshold_ms:
+        print(f"Regresyon: medyan import süresi {args.threshold_ms:.0f} ms eşiğini aştı", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Dil tanıma benchmark'ı: eski Türkçe karakter sezgisi ile karakter n-gram tanıyıcıyı
+örnek cümlelerde doğruluk, güven kalibrasyonu ve uzun transkriptlerde hız açısından
+karşılaştırır. Cümleler profil örneklerinde (language_samples/) geçmez.
+
+Kullanım:
+    python benchmarks/bench_language_id.py --hours 1 6
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from language_id import get_identifier  # noqa: E402
+from benchmarks.bench_summarizer import synthetic_segments  # noqa: E402
+
+HELD_OUT = {
+    'tr': [
+        "Şimdi kameramı biraz sağa çeviriyorum ki tezgahın tamamını görebilesiniz.",
+        "Bu telefonun bataryası bir günü rahatlıkla çıkarıyor ama şarj süresi biraz uzun.",
+        "Geçen yaz ailemle birlikte Karadeniz'e gittik ve yaylada üç gün kaldık.",
+        "Eğer bu adımı atlarsanız program hata verecek, o yüzden dikkatli olun.",
+        "Yorumlarda en çok sorulan soru hangi kamerayı kullandığımdı.",
+        "Sınav haftası yaklaşırken çalışma planınızı şimdiden hazırlamanızı öneririm.",
+        "Oyunun bu bölümünde haritanın kuzeyindeki kaleye gitmemiz gerekiyor.",
+        "Hamuru bir saat kadar mayalanmaya bırakıyoruz, sonra bezelere ayırıyoruz.",
+    ],
+    'en': [
+        "Now I'm turning the camera a little to the right so you can see the whole counter.",
+        "The battery on this phone easily lasts a full day, but charging takes a while.",
+        "Last summer my family and I drove up the coast and stayed in a cabin for three days.",
+        "If you skip this step the program will throw an error, so be careful.",
+        "The most common question in the comments was which camera I use.",
+        "With exam week coming up, I'd suggest putting together a study plan right now.",
+        "In this part of the game we need to reach the castle in the north of the map.",
+        "We let the dough rise for about an hour and then divide it into balls.",
+    ],
+    'de': [
+        "Jetzt drehe ich die Kamera ein bisschen nach rechts, damit ihr die ganze Arbeitsfläche seht.",
+        "Der Akku dieses Handys hält locker einen ganzen Tag, aber das Laden dauert etwas.",
+        "Letzten Sommer sind wir mit der Familie an die Küste gefahren und drei Tage geblieben.",
+        "Wenn ihr diesen Schritt überspringt, gibt das Programm einen Fehler aus, also passt auf.",
+        "Die häufigste Frage in den Kommentaren war, welche Kamera ich benutze.",
+        "Weil die Prüfungswoche näher rückt, solltet ihr jetzt schon einen Lernplan machen.",
+        "In diesem Abschnitt des Spiels müssen wir zur Burg im Norden der Karte.",
+        "Den Teig lassen wir etwa eine Stunde gehen und teilen ihn dann in Kugeln.",
+    ],
+    'fr': [
+        "Là je tourne un peu la caméra vers la droite pour que vous voyiez tout le plan de travail.",
+        "La batterie de ce téléphone tient facilement une journée, mais la recharge est un peu longue.",
+        "L'été dernier on est partis en famille au bord de la mer et on est restés trois jours.",
+        "Si vous sautez cette étape, le programme va afficher une erreur, donc faites attention.",
+        "La question qu'on m'a le plus posée dans les commentaires, c'est quelle caméra j'utilise.",
+        "Avec la semaine des examens qui approche, je vous conseille de préparer un planning dès maintenant.",
+        "Dans cette partie du jeu, il faut rejoindre le château au nord de la carte.",
+        "On laisse reposer la pâte environ une heure, puis on la divise en boules.",
+    ],
+    'es': [
+        "Ahora giro un poco la cámara hacia la derecha para que vean toda la encimera.",
+        "La batería de este teléfono dura fácilmente un día entero, pero tarda bastante en cargar.",
+        "El verano pasado fuimos con mi familia a la costa y nos quedamos tres días.",
+        "Si se saltan este paso el programa va a dar un error, así que tengan cuidado.",
+        "La pregunta más repetida en los comentarios fue qué cámara uso.",
+        "Ya que se acerca la semana de exámenes, les recomiendo preparar un plan de estudio desde ahora.",
+        "En esta parte del juego tenemos que llegar al castillo que está al norte del mapa.",
+        "Dejamos reposar la masa alrededor de una hora y después la dividimos en bolitas.",
+    ],
+    'it': [
+        "Adesso giro un po' la telecamera verso destra così vedete tutto il piano di lavoro.",
+        "La batteria di questo telefono dura tranquillamente una giornata, ma la ricarica è un po' lenta.",
+        "L'estate scorsa siamo andati al mare con la famiglia e ci siamo fermati tre giorni.",
+        "Se saltate questo passaggio il programma vi darà un errore, quindi fate attenzione.",
+        "La domanda più frequente nei commenti era quale fotocamera uso.",
+        "Visto che si avvicina la settimana degli esami, vi consiglio di preparare subito un piano di studio.",
+        "In questa parte del gioco dobbiamo raggiungere il castello a nord della mappa.",
+        "Lasciamo lievitare l'impasto per circa un'ora e poi lo dividiamo in palline.",
+    ],
+    'pt': [
+        "Agora vou virar a câmera um pouco para a direita para vocês verem a bancada inteira.",
+        "A bateria deste celular dura tranquilamente um dia inteiro, mas demora um pouco para carregar.",
+        "No verão passado fomos com a família para o litoral e ficamos três dias.",
+        "Se vocês pularem essa etapa o programa vai dar erro, então tomem cuidado.",
+        "A pergunta mais frequente nos comentários foi qual câmera eu uso.",
+        "Como a semana de provas está chegando, recomendo montar um plano de estudos desde já.",
+        "Nessa parte do jogo precisamos chegar ao castelo que fica ao norte do mapa.",
+        "Deixamos a massa descansar por cerca de uma hora e depois dividimos em bolinhas.",
+    ],
+    'nl': [
+        "Nu draai ik de camera een beetje naar rechts zodat jullie het hele aanrecht kunnen zien.",
+        "De batterij van deze telefoon gaat makkelijk een hele dag mee, maar opladen duurt even.",
+        "Afgelopen zomer zijn we met de familie naar de kust gereden en drie dagen gebleven.",
+        "Als je deze stap overslaat geeft het programma een foutmelding, dus let goed op.",
+        "De vraag die het vaakst in de reacties stond was welke camera ik gebruik.",
+        "Nu de tentamenweek eraan komt, raad ik aan om nu al een studieplanning te maken.",
+        "In dit deel van het spel moeten we naar het kasteel in het noorden van de kaart.",
+        "We laten het deeg ongeveer een uur rijzen en verdelen het daarna in bolletjes.",
+    ],
+    'ru': [
+        "Сейчас я немного поверну камеру вправо, чтобы вы видели всю столешницу.",
+        "Батареи этого телефона спокойно хватает на целый день, но заряжается он долго.",
+        "Прошлым летом мы всей семьёй поехали на побережье и провели там три дня.",
+        "Если пропустить этот шаг, программа выдаст ошибку, так что будьте внимательны.",
+        "Чаще всего в комментариях спрашивали, какой камерой я снимаю.",
+        "Раз уж приближается неделя экзаменов, советую уже сейчас составить план занятий.",
+        "В этой части игры нам нужно добраться до замка на севере карты.",
+        "Оставляем тесто подходить примерно на час, а потом делим его на шарики.",
+    ],
+    'pl': [
+        "Teraz obrócę kamerę trochę w prawo, żebyście widzieli cały blat.",
+        "Bateria w tym telefonie spokojnie wytrzymuje cały dzień, ale ładowanie trochę trwa.",
+        "Zeszłego lata pojechaliśmy z rodziną nad morze i zostaliśmy tam trzy dni.",
+        "Jeśli pominiecie ten krok, program wyrzuci błąd, więc uważajcie.",
+        "Najczęstsze pytanie w komentarzach dotyczyło tego, jakiej kamery używam.",
+        "Skoro zbliża się sesja, radzę już teraz przygotować plan nauki.",
+        "W tej części gry musimy dotrzeć do zamku na północy mapy.",
+        "Zostawiamy ciasto do wyrośnięcia na około godzinę, a potem dzielimy je na kulki.",
+    ],
+}
+
+TURKISH_CHARS_PATTERN = re.compile(r'[ğĞüÜşŞıİöÖçÇ]')
+
+
+def legacy_detect(text: str) -> str:
+    """Önceki TranscriptProcessor.detect_language sezgisi"""
+    if len(TURKISH_CHARS_PATTERN.findall(text)) > len(text) * 0.01:
+        return 'tr'
+    return 'en'
+
+
+def evaluate(label, detect, samples):
+    correct = sum(1 for language, text in samples if detect(text) == language)
+    print(f"  {label:<14} {correct}/{len(samples)} ({100 * correct / len(samples):.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dil tanıma benchmark\'ı')
+    parser.add_argument('--hours', type=float, nargs='+', default=[1, 6], help='Hız ölçümü için transkript süreleri')
+    parser.add_argument('--words', type=int, nargs='+', default=[0, 5, 3], help='Kırpılmış örnek uzunlukları (0: tam cümle)')
+    parser.add_argument('--repeat', type=int, default=5, help='Hız ölçümünün tekrar sayısı')
+    args = parser.parse_args()
+
+    identifier = get_identifier()
+    guesses = []
+    for words in args.words:
+        samples = [
+            (language, " ".join(text.split()[:words]) if words else text)
+            for language, texts in HELD_OUT.items() for text in texts
+        ]
+        print(f"{'tam cümle' if not words else f'ilk {words} kelime'}: {len(samples)} örnek, {len(HELD_OUT)} dil")
+        evaluate("eski sezgi", legacy_detect, samples)
+        evaluate("n-gram", lambda text: identifier.identify(text).language, samples)
+        tr_en = [(language, text) for language, text in samples if language in ('tr', 'en')]
+        evaluate("eski (tr/en)", legacy_detect, tr_en)
+        evaluate("n-gram (tr/en)", lambda text: identifier.identify(text).language, tr_en)
+        guesses.extend((identifier.identify(text), language) for language, text in samples)
+
+    # Kalibrasyon: güven aralığındaki ortalama güven doğruluğa yakın olmalı
+    print("\ngüven aralığı   örnek  ort. güven  doğruluk")
+    for low, high in ((0.0, 0.5), (0.5, 0.8), (0.8, 0.95), (0.95, 1.01)):
+        bucket = [(guess, language) for guess, language in guesses if low <= guess.confidence < high]
+        if bucket:
+            mean = sum(guess.confidence for guess, _ in bucket) / len(bucket)
+            accuracy = sum(1 for guess, language in bucket if guess.language == language) / len(bucket)
+            print(f"  [{low:.2f}, {min(high, 1):.2f}) {len(bucket):>6}  {mean:10.3f}  {accuracy:8.3f}")
+
+    print()
+    for hours in args.hours:
+        text = " ".join(segment['text'] for segment in synthetic_segments(hours))
+        for label, detect in (("eski sezgi", legacy_detect), ("n-gram", identifier.identify)):
+            best = float('inf')
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                detect(text)
+                best = min(best, time.perf_counter() - started)
+            print(f"{hours:g} saat ({len(text) / 1e6:.1f} MB) {label:<12} {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
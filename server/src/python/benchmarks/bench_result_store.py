@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sonuç deposu benchmark'ı: generate_summary'nin soğuk çalıştırması (transkript işleme,
+özetleme, TF-IDF) ile depodaki kayıttan yeniden üretimini karşılaştırır; kayıt
+boyutunu ham JSON ile, toplu okumayı da kayıt kayıt okumayla kıyaslar.
+
+Kullanım:
+    python benchmarks/bench_result_store.py --minutes 10 60 360 --records 500
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('VIDEOBITE_DEDUP_DISABLED', '1')
+os.environ.setdefault('VIDEOBITE_DF_DISABLED', '1')
+os.environ.setdefault('VIDEOBITE_SEARCH_DISABLED', '1')
+
+import video_summary  # noqa: E402
+import result_store  # noqa: E402
+from benchmarks.synthetic import synthetic_transcript  # noqa: E402
+
+DETAILS = {
+    'title': "Benchmark videosu", 'channel_title': "Benchmark", 'description': "",
+    'tags': [], 'view_count': "0", 'like_count': "0",
+}
+
+
+def best_of(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sonuç deposu benchmark\'ı')
+    parser.add_argument('--minutes', type=float, nargs='+', default=[10, 60, 360], help='Sentetik video süreleri')
+    parser.add_argument('--records', type=int, default=500, help='Toplu okuma için depodaki kayıt sayısı')
+    parser.add_argument('--repeat', type=int, default=3, help='Her ölçümün tekrar sayısı')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = result_store.ResultStore(os.path.join(directory, 'results.sqlite3'))
+        result_store._default_store = store
+
+        print(f"{'süre':>6} {'soğuk ms':>10} {'depodan ms':>11} {'hızlanma':>9} {'ham JSON KiB':>13} {'kayıt KiB':>10}")
+        for minutes in args.minutes:
+            video_id = f"bench{int(minutes):05d}"
+            segments = synthetic_transcript(minutes, 'tr')
+            transcript = video_summary.transcript_result(segments)
+
+            store.enabled = False
+            cold = best_of(lambda: video_summary.generate_summary(DETAILS, transcript, video_id, 'tr'), args.repeat)
+            store.enabled = True
+            expected = video_summary.generate_summary(DETAILS, transcript, video_id, 'tr')
+
+            def warm():
+                record = store.get(video_id, 'tr')
+                return video_summary.generate_summary(DETAILS, None, video_id, 'tr', record)
+
+            assert warm() == expected, "Depodan üretilen sonuç farklı"
+            stored = best_of(warm, args.repeat)
+
+            raw = len(json.dumps({"segments": segments, "result": expected}, ensure_ascii=False).encode('utf-8'))
+            size = store._connection().execute(
+                'SELECT LENGTH(result) + LENGTH(artifacts) FROM results WHERE video_id = ?', (video_id,)
+            ).fetchone()[0]
+            print(f"{minutes:5.0f}m {cold * 1000:10.1f} {stored * 1000:11.1f} {cold / stored:8.1f}x "
+                  f"{raw / 1024:13.0f} {size / 1024:10.0f}")
+
+        # Listeleme: çok sayıda kısa videonun özetleri
+        transcript = video_summary.transcript_result(synthetic_transcript(2, 'tr'))
+        video_ids = [f"list{i:05d}" for i in range(args.records)]
+        for video_id in video_ids:
+            video_summary.generate_summary(DETAILS, transcript, video_id, 'tr')
+
+        bulk = best_of(lambda: video_summary.stored_summaries(video_ids, 'tr'), args.repeat)
+        single = best_of(lambda: [store.get(video_id, 'tr') for video_id in video_ids], args.repeat)
+        assert len(video_summary.stored_summaries(video_ids, 'tr')) == args.records
+        print(f"\n{args.records} özet: toplu okuma {bulk * 1000:.1f} ms, kayıt kayıt tam okuma {single * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+İş zamanlayıcısı yük testi: worker'a aynı anda birkaç büyük kanal çalıştırması
+(toplu iş) gönderilir, ardından birkaç kullanıcıdan düzenli aralıklarla tek video
+istekleri (etkileşimli) gelir. Etkileşimli isteklerin yanıt süreleri ve kanal
+işlerinin bitiş süresi iki modda ölçülür:
+
+- fifo: tüm işler tek sınıf ve tek anahtarla (geliş sırasıyla) çalışır
+- öncelikli: JobScheduler'ın varsayılan sınıfları, toplu slot sınırı ve adaleti
+
+Önbellek, sonuç deposu ve istek birleştirme kapalıdır; her iş gerçekten çalışır.
+
+Kullanım:
+    python benchmarks/bench_scheduler.py --channels 6 --channel_videos 20 --interactive 30
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('VIDEOBITE_CACHE_DISABLED', '1')
+os.environ.setdefault('VIDEOBITE_RESULTS_DISABLED', '1')
+os.environ.setdefault('VIDEOBITE_DEDUP_DISABLED', '1')
+os.environ.setdefault('VIDEOBITE_DF_DISABLED', '1')
+os.environ.setdefault('VIDEOBITE_SEARCH_DISABLED', '1')
+
+import video_summary  # noqa: E402
+from scheduler import INTERACTIVE, JobScheduler  # noqa: E402
+from benchmarks.fake_youtube import FakeYouTubeServer, fake_video_id  # noqa: E402
+
+
+class TimedOutput:
+    """serve()'ün yazdığı yanıtların geliş zamanlarını iş ID'sine göre kaydeder"""
+
+    def __init__(self):
+        self.received = {}
+        self.responses = {}
+        self._lock = threading.Lock()
+
+    def write(self, data):
+        now = time.perf_counter()
+        for line in data.splitlines():
+            response = json.loads(line)
+            with self._lock:
+                self.received[response["id"]] = now
+                self.responses[response["id"]] = response
+
+    def flush(self):
+        pass
+
+
+def workload(args, submitted):
+    """Önce kanal işlerini, sonra aralıklı etkileşimli işleri üretir; gönderim zamanlarını kaydeder"""
+    for number in range(args.channels):
+        job_id = f"channel-{number}"
+        submitted[job_id] = time.perf_counter()
+        yield json.dumps({
+            "id": job_id, "channel_id": f"UCfake{number}", "max_videos": args.channel_videos,
+            "workers": 2, "rate_limit": 0,
+        })
+    for number in range(args.interactive):
+        time.sleep(args.interval)
+        job_id = f"video-{number}"
+        submitted[job_id] = time.perf_counter()
+        yield json.dumps({
+            "id": job_id, "video_id": fake_video_id(number % args.channel_videos),
+            "user": f"user{number % args.users}",
+        })
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run(args, fifo):
+    scheduler = JobScheduler(workers=args.workers, batch_slots=args.batch_slots or None,
+                             latency_target=args.latency_target)
+    if fifo:
+        # Karşılaştırma için tüm işler tek kuyrukta, geliş sırasıyla
+        submit = scheduler.submit
+        scheduler.submit = lambda function, priority, key: submit(function, INTERACTIVE, '')
+    scheduler.start()
+
+    submitted = {}
+    output = TimedOutput()
+    started = time.perf_counter()
+    video_summary.serve(workload(args, submitted), output, scheduler=scheduler)
+    stats = scheduler.stats()
+    scheduler.shutdown()
+
+    failed = [job_id for job_id, response in output.responses.items() if not response["ok"]]
+    assert not failed, f"Başarısız işler: {failed}"
+    interactive = [output.received[job_id] - submitted[job_id] for job_id in submitted if job_id.startswith('video-')]
+    channels = [output.received[job_id] - started for job_id in submitted if job_id.startswith('channel-')]
+    return interactive, channels, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='İş zamanlayıcısı yük testi')
+    parser.add_argument('--channels', type=int, default=6, help='Aynı anda gönderilen kanal çalıştırması')
+    parser.add_argument('--channel_videos', type=int, default=20, help='Kanal başına video sayısı')
+    parser.add_argument('--interactive', type=int, default=30, help='Etkileşimli tek video isteği sayısı')
+    parser.add_argument('--users', type=int, default=5, help='Etkileşimli istekleri gönderen kullanıcı sayısı')
+    parser.add_argument('--interval', type=float, default=0.1, help='Etkileşimli istekler arası süre (saniye)')
+    parser.add_argument('--workers', type=int, default=4, help='Worker eşzamanlılığı')
+    parser.add_argument('--batch_slots', type=int, default=0, help='Toplu iş slotu, 0 workers\'ın yarısı')
+    parser.add_argument('--latency_target', type=float, default=0.5, help='Etkileşimli hedef kuyruk beklemesi (saniye)')
+    parser.add_argument('--latency', type=float, default=0.02, help='Her sahte istek için gecikme (saniye)')
+    args = parser.parse_args()
+
+    with FakeYouTubeServer(latency=args.latency, video_count=args.channel_videos) as server:
+        server.install(video_summary)
+        print(f"{args.channels} kanal x {args.channel_videos} video, {args.interactive} etkileşimli istek, "
+              f"{args.workers} worker")
+        print(f"{'mod':<11} {'etkileşimli p50':>16} {'p90':>7} {'en kötü':>8} {'kanallar bitti':>15} "
+              f"{'ertelenen':>10}")
+        for fifo in (True, False):
+            interactive, channels, stats = run(args, fifo)
+            print(f"{'fifo' if fifo else 'öncelikli':<11} {percentile(interactive, 0.5):15.2f}s "
+                  f"{percentile(interactive, 0.9):6.2f}s {max(interactive):7.2f}s {max(channels):14.2f}s "
+                  f"{stats['batch']['deferred']:>10}")
+
+
+if __name__ == "__main__":
+    main()
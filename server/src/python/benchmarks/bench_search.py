@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Transkript arama indeksi benchmark'ı: Zipf dağılımlı sözde kelimelerden üretilen
+sentetik transkriptlerle (varsayılan 100 bin video) indeksi kurar; kurulum süresini,
+disk boyutunu, nadir/yaygın/çok kelimeli sorguların p50/p99 gecikmesini ve kurulu
+indekse tek video ekleyip yazmanın maliyetini ölçer.
+
+benchmarks/synthetic.py'nin sözlüğü birkaç yüz kelimelik olduğundan burada gerçek
+dildeki gibi uzun kuyruklu bir sözlük üretilir. Transkriptler TranscriptProcessor'dan
+geçirilmez; indeks yalnızca segmentleri kullandığından ProcessedTranscript doğrudan kurulur.
+
+Kullanım:
+    python benchmarks/bench_search.py --documents 100000 --segments 20
+"""
+
+import argparse
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_pipeline import ProcessedTranscript, SegmentStore, get_stop_words  # noqa: E402
+from search_index import SearchIndex  # noqa: E402
+
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "ta", "be", "si", "do", "za", "pe", "gu", "la", "ve", "ro",
+             "ni", "sa", "ku", "de", "mo"]
+SEGMENT_SECONDS = 4.0
+
+
+def build_vocabulary(rnd, size):
+    stop_words = get_stop_words()
+    words = set()
+    while len(words) < size:
+        word = ''.join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(2, 4)))
+        if word not in stop_words:
+            words.add(word)
+    vocabulary = sorted(words)
+    rnd.shuffle(vocabulary)
+    return vocabulary
+
+
+def synthetic_document(rnd, vocabulary, cumulative, segments, words_per_segment):
+    store = SegmentStore()
+    for index in range(segments):
+        text = ' '.join(rnd.choices(vocabulary, cum_weights=cumulative, k=words_per_segment))
+        store.add(text, index * SEGMENT_SECONDS, SEGMENT_SECONDS)
+    store.freeze()
+    return ProcessedTranscript(
+        full_text=store.buffer, segments=store, sentences=[], language='tr', word_count=0,
+        duration=segments * SEGMENT_SECONDS, important_terms=[], paragraphs=[],
+    )
+
+
+def percentiles(timings):
+    ordered = sorted(timings)
+    return (ordered[len(ordered) // 2] * 1000,
+            ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000)
+
+
+def measure(index, queries, limit):
+    timings = []
+    hits = 0
+    for query in queries:
+        started = time.perf_counter()
+        results = index.search(query, limit)
+        timings.append(time.perf_counter() - started)
+        hits += bool(results)
+    return percentiles(timings), hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Transkript arama indeksi benchmark\'ı')
+    parser.add_argument('--documents', type=int, default=100000, help='İndekslenecek sentetik video sayısı')
+    parser.add_argument('--segments', type=int, default=20, help='Video başına segment sayısı')
+    parser.add_argument('--words', type=int, default=10, help='Segment başına kelime sayısı')
+    parser.add_argument('--vocabulary', type=int, default=50000, help='Sözlükteki farklı kelime sayısı')
+    parser.add_argument('--queries', type=int, default=200, help='Sorgu türü başına sorgu sayısı')
+    parser.add_argument('--limit', type=int, default=10, help='Sorgu başına döndürülecek video sayısı')
+    parser.add_argument('--seed', type=int, default=0, help='Rastgele üreteç tohumu')
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    vocabulary = build_vocabulary(rnd, args.vocabulary)
+    # Zipf: r. sıradaki kelimenin ağırlığı 1/r
+    cumulative = list(itertools.accumulate(1.0 / rank for rank in range(1, len(vocabulary) + 1)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = SearchIndex(directory)
+        started = time.perf_counter()
+        for number in range(args.documents):
+            document = synthetic_document(rnd, vocabulary, cumulative, args.segments, args.words)
+            index.add(f"video{number:07d}", document)
+        index.flush()
+        build = time.perf_counter() - started
+        stats = index.stats()
+        words = args.documents * args.segments * args.words
+        print(f"kurulum: {args.documents} video, {words / 1e6:.1f}M kelime, {build:.1f}s "
+              f"({words / build / 1000:.0f}K kelime/s), {stats['parts']} parça, {stats['bytes'] / 2**20:.1f} MiB")
+
+        started = time.perf_counter()
+        index.optimize()
+        print(f"tek parçaya birleştirme: {time.perf_counter() - started:.2f}s, "
+              f"{index.stats()['bytes'] / 2**20:.1f} MiB")
+
+        # Yeni bir örnek dosyaları yeniden açar (mmap; sözlük belleğe yüklenmez)
+        started = time.perf_counter()
+        reader = SearchIndex(directory)
+        reader.search(vocabulary[0])
+        print(f"soğuk açılış + ilk sorgu: {(time.perf_counter() - started) * 1000:.1f}ms")
+
+        head = vocabulary[:20]
+        middle = vocabulary[200:2000]
+        tail = vocabulary[-5000:]
+        query_sets = [
+            ("nadir (kuyruk)", [rnd.choice(tail) for _ in range(args.queries)]),
+            ("orta sıklık", [rnd.choice(middle) for _ in range(args.queries)]),
+            ("yaygın (ilk 20)", [rnd.choice(head) for _ in range(args.queries)]),
+            ("2 kelime", [f"{rnd.choice(middle)} {rnd.choice(tail)}" for _ in range(args.queries)]),
+            ("3 kelime + yaygın", [f"{rnd.choice(head)} {rnd.choice(middle)} {rnd.choice(tail)}"
+                                   for _ in range(args.queries)]),
+        ]
+        print(f"{'sorgu':<20} {'p50 ms':>8} {'p99 ms':>8} {'sonuçlu':>8}")
+        for label, queries in query_sets:
+            (p50, p99), hits = measure(reader, queries, args.limit)
+            print(f"{label:<20} {p50:8.2f} {p99:8.2f} {hits:>4}/{len(queries)}")
+
+        timings = []
+        for number in range(20):
+            document = synthetic_document(rnd, vocabulary, cumulative, args.segments, args.words)
+            started = time.perf_counter()
+            index.add(f"extra{number:04d}", document)
+            index.flush()
+            timings.append(time.perf_counter() - started)
+        p50, p99 = percentiles(timings)
+        print(f"tek video ekle + yaz: p50 {p50:.2f}ms, en kötü {max(timings) * 1000:.2f}ms "
+              f"({index.stats()['parts']} parça)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Segment belleği benchmark'ı: sentetik uzun bir transkriptte eski dataclass listesi ile
+SegmentStore'un tuttuğu belleği tracemalloc ile karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_segment_memory.py --hours 6
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_pipeline import SegmentStore, TranscriptProcessor  # noqa: E402
+from benchmarks.bench_summarizer import synthetic_segments  # noqa: E402
+
+
+@dataclass
+class LegacySegment:
+    """Değişiklik öncesi, örnek başına __dict__ taşıyan segment sınıfı"""
+    text: str
+    start: float
+    duration: float
+
+
+def retained(build):
+    """build() sonucunun tuttuğu bellek ve oluşturma sırasındaki tepe değer (bayt)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak
+
+
+def mib(size):
+    return f"{size / (1024 * 1024):7.2f} MiB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Segment belleği benchmark\'ı')
+    parser.add_argument('--hours', type=float, default=6, help='Sentetik video süresi (saat)')
+    args = parser.parse_args()
+
+    raw_segments = synthetic_segments(args.hours)
+    processor = TranscriptProcessor()
+    print(f"{args.hours:g} saat, {len(raw_segments)} segment")
+
+    def fresh_texts():
+        # clean_text değişmeyen dizeyi aynen döndürür; JSON'dan yeni okunmuş gibi kopyalanır
+        return processor.clean_texts((item['text'] + ' ')[:-1] for item in raw_segments)
+
+    # Her iki yapı da temizlenmiş metinleri kendisi üretir ve sahiplenir
+    def legacy():
+        texts = fresh_texts()
+        return [LegacySegment(text, item['start'], item['duration']) for text, item in zip(texts, raw_segments)]
+
+    def columnar():
+        store = SegmentStore()
+        for text, item in zip(fresh_texts(), raw_segments):
+            store.add(text, item['start'], item['duration'])
+        store.freeze()
+        return store
+
+    legacy_list, legacy_bytes, legacy_peak = retained(legacy)
+    store, store_bytes, store_peak = retained(columnar)
+    assert [(s.text, s.start, s.duration) for s in store] == [(s.text, s.start, s.duration) for s in legacy_list]
+    print(f"dataclass listesi: {mib(legacy_bytes)} (tepe {mib(legacy_peak)})")
+    print(f"SegmentStore:      {mib(store_bytes)} (tepe {mib(store_peak)}), "
+          f"{legacy_bytes / store_bytes:.1f}x daha az")
+
+    # NLTK ve dur kelimeleri ölçüme girmesin diye önce bir kez ısıtılır
+    processor.process(raw_segments[:10])
+    processed, processed_bytes, processed_peak = retained(lambda: processor.process(raw_segments))
+    shared = processed.segments.buffer is processed.full_text
+    column_bytes = sum(column.itemsize * len(column) for column in
+                       (processed.segments.starts, processed.segments.durations, processed.segments._offsets))
+    print(f"ProcessedTranscript: {mib(processed_bytes)} (tepe {mib(processed_peak)}); segment tamponu "
+          f"full_text ile {'paylaşılıyor, segmentlerin ek maliyeti ' + mib(column_bytes).strip() if shared else 'ayrı'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Terim çıkarma benchmark'ı: ham sıklığa dayalı extract_important_terms ile TF-IDF
+TermExtractor'ı sentetik transkriptlerde süre ve sıralama açısından karşılaştırır.
+Derlemdeki tüm videolarda geçen ortak kelimeler TF-IDF sıralamasında geri planda kalmalıdır.
+
+Kullanım:
+    python benchmarks/bench_terms.py --hours 1 6 --corpus 50
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_pipeline import TranscriptProcessor  # noqa: E402
+from term_extractor import DocumentFrequencyTable, TermExtractor  # noqa: E402
+from benchmarks.bench_summarizer import synthetic_segments  # noqa: E402
+
+# Her videoda geçen, bilgi taşımayan kanal kelimeleri
+COMMON_WORDS = "merhaba arkadaşlar kanalıma abone olmayı unutmayın".split()
+TOPICS = ["kuantum bilgisayar", "fotosentez klorofil", "blokzincir madenci", "volkan magma", "opera arya"]
+
+
+def topical_segments(hours: float, seed: int):
+    """Sentetik transkripte ortak kelimeler ve videoya özgü bir konu ekler"""
+    rnd = random.Random(seed)
+    topic = TOPICS[seed % len(TOPICS)]
+    segments = synthetic_segments(hours, seed)
+    for segment in segments:
+        extra = rnd.sample(COMMON_WORDS, 3)
+        if rnd.random() < 0.1:
+            extra.append(topic)
+        segment['text'] = " ".join(extra) + " " + segment['text']
+    return segments
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TF-IDF terim çıkarma benchmark\'ı')
+    parser.add_argument('--hours', type=float, nargs='+', default=[1, 6], help='Sentetik video süreleri (saat)')
+    parser.add_argument('--corpus', type=int, default=50, help='DF tablosuna önceden eklenecek video sayısı')
+    parser.add_argument('--repeat', type=int, default=3, help='Her ölçümün tekrar sayısı')
+    args = parser.parse_args()
+
+    processor = TranscriptProcessor()
+    with tempfile.TemporaryDirectory() as directory:
+        extractor = TermExtractor(DocumentFrequencyTable(os.path.join(directory, 'df.sqlite3')))
+
+        started = time.perf_counter()
+        for seed in range(args.corpus):
+            extractor.rank(processor.process(topical_segments(0.1, seed)), document_id=f"corpus{seed}")
+        print(f"derlem: {args.corpus} video, {time.perf_counter() - started:.2f}s")
+
+        for hours in args.hours:
+            processed = processor.process(topical_segments(hours, args.corpus))
+            timings = {}
+            for label, function in (
+                ("sıklık (eski)", lambda: processor.extract_important_terms(processed.full_text)),
+                ("tf-idf", lambda: extractor.rank(processed)),
+            ):
+                best = float('inf')
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    result = function()
+                    best = min(best, time.perf_counter() - started)
+                timings[label] = (best, result)
+
+            print(f"\n{hours:g} saat, {processed.word_count} kelime")
+            for label, (elapsed, result) in timings.items():
+                terms = [item[0] if isinstance(item, tuple) else item.term for item in result[:6]]
+                print(f"  {label:<14} {elapsed * 1000:8.1f} ms  {', '.join(terms)}")
+
+
+if __name__ == "__main__":
+    main()
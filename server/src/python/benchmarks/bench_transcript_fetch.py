@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Transkript çekici benchmark'ı: sahte sunucuya gecikme ve rastgele 429/503 hataları
+enjekte eder; videoları tek tek çekmeyi AsyncTranscriptFetcher ile eşzamanlı çekmeyle
+karşılaştırır ve yeniden denemelerle tüm transkriptlerin alındığını doğrular.
+
+Kullanım:
+    python benchmarks/bench_transcript_fetch.py --videos 40 --latency 0.05 --error_rate 0.2
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import instrumentation  # noqa: E402
+from transcript_fetcher import AsyncTranscriptFetcher, PooledSession, fetch_transcript  # noqa: E402
+from benchmarks.fake_youtube import FakeYouTubeServer, fake_video_id  # noqa: E402
+
+
+def run(video_count, latency, error_rate, concurrency):
+    video_ids = [fake_video_id(i) for i in range(video_count)]
+    with FakeYouTubeServer(latency=latency, video_count=video_count, error_rate=error_rate) as server:
+        server.install_transcripts()
+        # Benchmark süresini kısa tutmak için geri çekilme tabanı küçültülür
+        session = PooledSession(pool_size=concurrency, per_host_limit=concurrency, max_retries=8,
+                                backoff_base=0.02, backoff_max=0.5)
+
+        recorder = instrumentation.Recorder()
+        with instrumentation.recording(recorder):
+            started = time.perf_counter()
+            sequential = {video_id: fetch_transcript(session, video_id, 'tr') for video_id in video_ids}
+            sequential_elapsed = time.perf_counter() - started
+
+            started = time.perf_counter()
+            concurrent = AsyncTranscriptFetcher(session, concurrency).fetch_many(video_ids, 'tr')
+            concurrent_elapsed = time.perf_counter() - started
+
+        failures = [video_id for video_id, outcome in concurrent.items() if isinstance(outcome, Exception)]
+        assert not failures, f"Yeniden denemeye rağmen alınamayan transkriptler: {failures[:5]}"
+        assert all(concurrent[video_id] == sequential[video_id] for video_id in video_ids), "Sonuçlar farklı"
+
+        print(f"sıralı:    {video_count} video, {sequential_elapsed:.2f}s")
+        print(f"eşzamanlı: {video_count} video, {concurrent_elapsed:.2f}s "
+              f"(concurrency={concurrency}, hızlanma={sequential_elapsed / concurrent_elapsed:.1f}x)")
+        print(f"enjekte edilen hata: {server.request_counts['errors']}, "
+              f"yeniden deneme: {recorder.counters.get('retries', 0):g}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Transkript çekici benchmark\'ı')
+    parser.add_argument('--videos', type=int, default=40, help='Çekilecek video sayısı')
+    parser.add_argument('--latency', type=float, default=0.05, help='Her sahte istek için gecikme (saniye)')
+    parser.add_argument('--error_rate', type=float, default=0.2, help='Hata döndürülen isteklerin oranı')
+    parser.add_argument('--concurrency', type=int, default=8, help='Eşzamanlı video sayısı')
+    args = parser.parse_args()
+
+    run(args.videos, args.latency, args.error_rate, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
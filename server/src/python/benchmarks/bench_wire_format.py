@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Aktarım biçimi benchmark'ı: get_transcript.py'nin ham transkript ve --processed
+(format_transcript_for_openai) çıktılarını tek JSON belgesi ile ikili çerçeve
+(wire_format) arasında boyut, kodlama ve çözme süresi açısından karşılaştırır.
+msgpack kuruluysa msgpack başlıklı çerçeve de ölçülür.
+
+Kullanım:
+    python benchmarks/bench_wire_format.py --minutes 10 60 360
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_pipeline import TranscriptProcessor, format_transcript_for_openai  # noqa: E402
+from wire_format import decode_frame, encode_frame  # noqa: E402
+from benchmarks.synthetic import synthetic_transcript  # noqa: E402
+
+
+def best_of(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def raw_payload(segments):
+    """get_transcript.get_transcript çıktısının biçimi"""
+    return {
+        'fullTranscript': ' '.join(item['text'] for item in segments),
+        'segments': [
+            {'text': item['text'], 'duration': item['duration'], 'offset': item['start']}
+            for item in segments
+        ],
+    }
+
+
+def codecs():
+    available = ['json']
+    try:
+        import msgpack  # noqa: F401
+        available.append('msgpack')
+    except ImportError:
+        pass
+    return available
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Aktarım biçimi benchmark\'ı')
+    parser.add_argument('--minutes', type=float, nargs='+', default=[10, 60, 360], help='Sentetik video süreleri')
+    parser.add_argument('--repeat', type=int, default=5, help='Her ölçümün tekrar sayısı')
+    args = parser.parse_args()
+
+    processor = TranscriptProcessor()
+    print(f"{'yük':<16} {'biçim':<14} {'KiB':>8} {'kodlama ms':>11} {'çözme ms':>9}")
+    for minutes in args.minutes:
+        segments = synthetic_transcript(minutes, 'tr')
+        payloads = [
+            (f"ham-{minutes:.0f}m", raw_payload(segments), 'fullTranscript'),
+            (f"işlenmiş-{minutes:.0f}m", format_transcript_for_openai(processor.process(segments)), 'full_text'),
+        ]
+        for label, payload, text_key in payloads:
+            encoded = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            assert json.loads(encoded) == payload
+            encode = best_of(lambda: json.dumps(payload, ensure_ascii=False).encode('utf-8'), args.repeat)
+            decode = best_of(lambda: json.loads(encoded), args.repeat)
+            print(f"{label:<16} {'json':<14} {len(encoded) / 1024:8.0f} {encode * 1000:11.2f} {decode * 1000:9.2f}")
+
+            for codec in codecs():
+                frame = encode_frame(payload, payload[text_key], codec)
+                assert decode_frame(frame)[0] == payload, "Çerçeve gidiş-dönüşü farklı"
+                encode = best_of(lambda: encode_frame(payload, payload[text_key], codec), args.repeat)
+                decode = best_of(lambda: decode_frame(frame), args.repeat)
+                print(f"{label:<16} {'çerçeve/' + codec:<14} {len(frame) / 1024:8.0f} "
+                      f"{encode * 1000:11.2f} {decode * 1000:9.2f}")
+
+
+if __name__ == "__main__":
+    main()
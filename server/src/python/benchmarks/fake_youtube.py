@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark'lar için yerel sahte YouTube sunucusu.
+Data API (search, videos), izleme sayfası ve transkript XML uç noktalarını
+yapay gecikme ve isteğe bağlı rastgele 429/5xx hataları ile taklit eder; gerçek ağa
+çıkmadan uçtan uca ölçüm yapılabilir.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from xml.sax.saxutils import escape
+
+SAMPLE_SENTENCES = [
+    "Merhaba arkadaşlar, bugün size yapay zeka konusunda bilgiler vereceğim.",
+    "Yapay zeka, insan zekasını taklit eden sistemlerdir.",
+    "Makine öğrenmesi, yapay zekanın bir alt dalıdır.",
+    "Derin öğrenme modelleri büyük veri setleri ile eğitilir.",
+    "Bu yöntemler görüntü ve ses tanımada başarılı sonuçlar verir.",
+]
+
+
+def fake_video_id(index: int) -> str:
+    """Sıra numarasından 11 karakterlik sahte bir video ID'si üretir"""
+    return f"vid{index:08d}"
+
+
+class FakeYouTubeServer:
+    """Arka planda çalışan sahte YouTube HTTP sunucusu
+
+    Kullanım:
+        with FakeYouTubeServer(latency=0.05, video_count=50) as server:
+            server.install(video_summary)
+    """
+
+    def __init__(self, latency: float = 0.05, video_count: int = 50, segments_per_video: int = 60,
+                 error_rate: float = 0.0, error_statuses=(429, 503), seed: int = 0):
+        self.latency = latency
+        self.video_count = video_count
+        self.segments_per_video = segments_per_video
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.new_uploads = 0
+        # Kayıtlı videos.list öğeleri ve bunlara ait (dil, segmentler) transkriptleri
+        self.fixture_items = {}
+        self.fixture_transcripts = {}
+        self.request_counts = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_base_url(self) -> str:
+        return f"{self.base_url}/youtube/v3"
+
+    @property
+    def watch_url(self) -> str:
+        return f"{self.base_url}/watch?v={{video_id}}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def count(self, path: str) -> None:
+        with self._lock:
+            self.request_counts[path] += 1
+
+    def injected_error(self):
+        """error_rate olasılığıyla döndürülecek hata kodunu, aksi halde None verir"""
+        with self._lock:
+            if self.error_rate and self._random.random() < self.error_rate:
+                status = self._random.choice(self.error_statuses)
+                self.request_counts['errors'] += 1
+                return status
+        return None
+
+    def install(self, video_summary_module) -> None:
+        """video_summary modülünü ve transkript kütüphanesini bu sunucuya yönlendirir"""
+        video_summary_module.YOUTUBE_API_KEY = "fake-key"
+        video_summary_module.YOUTUBE_API_BASE_URL = self.api_base_url
+        self.install_transcripts()
+
+    def install_transcripts(self) -> None:
+        """Yalnızca transkript kütüphanesinin izleme sayfası adresini bu sunucuya yönlendirir"""
+        from youtube_transcript_api import _transcripts
+
+        _transcripts.WATCH_URL = self.watch_url
+
+    def load_fixtures(self, path: str) -> list:
+        """Kayıtlı bir videos.list yanıtındaki videoları sunar
+
+        Her videonun transkripti, contentDetails.duration ve snippet.defaultAudioLanguage
+        alanlarına göre benchmarks.synthetic ile deterministik olarak üretilir.
+
+        Returns:
+            Yüklenen video ID'leri
+        """
+        from benchmarks.synthetic import synthetic_transcript
+
+        with open(path, encoding='utf-8') as f:
+            items = json.load(f)['items']
+        for seed, item in enumerate(items):
+            language = item['snippet'].get('defaultAudioLanguage', 'tr')
+            match = re.fullmatch(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', item['contentDetails']['duration'])
+            hours, minutes, seconds = (int(value or 0) for value in match.groups())
+            segments = synthetic_transcript(hours * 60 + minutes + seconds / 60, language, seed)
+            self.fixture_items[item['id']] = item
+            self.fixture_transcripts[item['id']] = (language, segments)
+        return [item['id'] for item in items]
+
+    def upload(self, count: int = 1) -> None:
+        """Kanala yeni videolar ekler; search sonuçlarının en başında (en yeni) listelenirler"""
+        with self._lock:
+            self.new_uploads += count
+
+    # --- Yanıt gövdeleri ---
+
+    def search_item(self, position: int) -> dict:
+        if position < self.new_uploads:
+            number = self.new_uploads - 1 - position
+            video_id = f"new{number:08d}"
+            published_at = f"2024-02-01T{number // 60 % 24:02d}:{number % 60:02d}:00Z"
+        else:
+            i = position - self.new_uploads
+            video_id = fake_video_id(i)
+            published_at = f"2024-01-{(i % 28) + 1:02d}T00:00:00Z"
+        return {
+            "id": {"kind": "youtube#video", "videoId": video_id},
+            "snippet": {
+                "title": f"Sahte video {video_id}",
+                "publishedAt": published_at,
+                "channelTitle": "Sahte Kanal",
+            },
+        }
+
+    def search_body(self, query) -> dict:
+        max_results = int(query.get('maxResults', ['50'])[0])
+        offset = int(query.get('pageToken', ['0'])[0] or 0)
+        total = self.new_uploads + self.video_count
+        end = min(total, offset + max_results)
+        body = {"items": [self.search_item(position) for position in range(offset, end)]}
+        if end < total:
+            body["nextPageToken"] = str(end)
+        return body
+
+    def videos_body(self, query) -> dict:
+        ids = query.get('id', [''])[0].split(',')
+        items = [
+            {
+                "id": video_id,
+                "snippet": {
+                    "title": f"Sahte video {video_id}",
+                    "channelTitle": "Sahte Kanal",
+                    "description": "Bu video yapay zeka hakkında bir açıklamadır. " * 3,
+                    "publishedAt": "2024-01-01T00:00:00Z",
+                    "tags": ["yapay zeka", "makine öğrenmesi"],
+                    "categoryId": "28",
+                },
+                "contentDetails": {"duration": "PT10M"},
+                "statistics": {"viewCount": "12345", "likeCount": "678"},
+            }
+            for video_id in ids if video_id and video_id not in self.fixture_items
+        ]
+        items += [self.fixture_items[video_id] for video_id in ids if video_id in self.fixture_items]
+        return {"items": items}
+
+    def watch_body(self, video_id: str) -> str:
+        language = self.fixture_transcripts.get(video_id, ('tr',))[0]
+        captions = {
+            "playerCaptionsTracklistRenderer": {
+                "captionTracks": [
+                    {
+                        "baseUrl": f"{self.base_url}/timedtext?v={video_id}&lang={language}",
+                        "name": {"simpleText": language},
+                        "languageCode": language,
+                        "isTranslatable": True,
+                    }
+                ],
+                "translationLanguages": [
+                    {"languageCode": "en", "languageName": {"simpleText": "English"}}
+                ],
+            }
+        }
+        return f'<html><script>var ytInitialPlayerResponse = {{"captions":{json.dumps(captions)},"videoDetails":{{}}}};</script></html>'
+
+    def timedtext_body(self, video_id: str = '') -> str:
+        lines = []
+        if video_id in self.fixture_transcripts:
+            for segment in self.fixture_transcripts[video_id][1]:
+                lines.append(
+                    f'<text start="{segment["start"]}" dur="{segment["duration"]}">{escape(segment["text"])}</text>'
+                )
+        for i in range(0 if lines else self.segments_per_video):
+            text = escape(SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)])
+            lines.append(f'<text start="{i * 4.0}" dur="4.0">{text}</text>')
+        return '<?xml version="1.0" encoding="utf-8" ?><transcript>' + ''.join(lines) + '</transcript>'
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body: str, content_type: str) -> None:
+                data = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                server.count(parsed.path)
+                time.sleep(server.latency)
+
+                status = server.injected_error()
+                if status is not None:
+                    self.send_error(status)
+                    return
+
+                if parsed.path == '/youtube/v3/search':
+                    self._send(json.dumps(server.search_body(query)), 'application/json')
+                elif parsed.path == '/youtube/v3/videos':
+                    self._send(json.dumps(server.videos_body(query)), 'application/json')
+                elif parsed.path == '/watch':
+                    self._send(server.watch_body(query.get('v', [''])[0]), 'text/html')
+                elif parsed.path == '/timedtext':
+                    self._send(server.timedtext_body(query.get('v', [''])[0]), 'text/xml')
+                else:
+                    self.send_error(404)
+
+        return Handler
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Python pipeline'ı için benchmark ve regresyon paketi.
+
+10 dakikalık, 1 saatlik ve 6 saatlik Türkçe ve İngilizce sentetik transkriptlerde
+clean_texts, process, generate_summary ve format_transcript_for_openai aşamalarını;
+kayıtlı videos.list fikstürlerini (fixtures/videos.json) sunan yerel sahte YouTube
+sunucusuna karşı da uçtan uca video_summary.main'i ölçer. Her durum için gecikme
+yüzdelikleri (p50/p90/p99), p50 üzerinden metin işleme hızı ve tracemalloc ile
+ayrı bir çalıştırmada ölçülen tepe bellek raporlanır.
+
+Paylaşılan makinelerde CPU hızı saniyeler içinde dalgalanabildiği için her ölçülen
+çalıştırmanın hemen ardından sabit bir saf Python referans iş yükü de çalıştırılır.
+Regresyon kontrolü mutlak süreye değil, durumun en iyi süresinin referansın en iyi
+süresine oranına (göreli maliyet) bakar; böylece makinenin anlık yavaşlığı sadeleşir.
+Tabanı aşan durum --retries kez yeniden ölçülür ve en iyi sonucu tutulur; gürültü
+ölçümü yalnızca yavaşlatabildiğinden kalıcı olmayan aşımlar bu şekilde elenir.
+Sonuçlar baselines.json'daki kayıtlı değerlerle karşılaştırılır; göreli maliyeti veya
+tepe belleği toleransı aşan durum varsa çıkış kodu 1'dir. Farklı bir Python sürümünde
+veya makinede önce --update_baselines ile yeniden kaydedin.
+
+Kullanım:
+    python benchmarks/suite.py                    # tüm durumlar, tabanlarla karşılaştır
+    python benchmarks/suite.py --quick            # 6 saatlik transkriptleri atla
+    python benchmarks/suite.py --filter process   # adı eşleşen durumlar
+    python benchmarks/suite.py --update_baselines # mevcut sonuçları taban olarak kaydet
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Önbellekler ve kalıcı indeksler ölçümü bozmasın; kullanıcının dizinlerine de yazılmasın
+_state_dir = tempfile.mkdtemp(prefix='videobite-bench-')
+os.environ.setdefault('VIDEOBITE_CACHE_DISABLED', '1')
+os.environ.setdefault('VIDEOBITE_DEDUP_DISABLED', '1')
+os.environ.setdefault('VIDEOBITE_DF_DISABLED', '1')
+os.environ.setdefault('VIDEOBITE_RESULTS_DISABLED', '1')
+os.environ.setdefault('VIDEOBITE_SEARCH_DISABLED', '1')
+os.environ.setdefault('VIDEOBITE_SYNC_STATE_PATH', os.path.join(_state_dir, 'sync_state.sqlite3'))
+
+import video_summary  # noqa: E402
+from data_pipeline import TranscriptProcessor, format_transcript_for_openai  # noqa: E402
+from benchmarks.fake_youtube import FakeYouTubeServer  # noqa: E402
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_PATH = os.path.join(BENCHMARK_DIR, 'fixtures', 'videos.json')
+BASELINES_PATH = os.path.join(BENCHMARK_DIR, 'baselines.json')
+
+# Fikstürdeki video ID'lerinin son ekleri
+SIZES = {'10min': '10m', '1hour': '1h', '6hour': '6h'}
+
+
+def percentile(samples, fraction):
+    """En yakın sıra yöntemiyle yüzdelik"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered) + 0.5) - 1))]
+
+
+REFERENCE_TEXT = " ".join(f"kelime{i % 997} örnek metin" for i in range(20000))
+
+
+def reference_workload():
+    """Makine hızının ölçüsü olarak kullanılan sabit iş yükü (düzenli ifade ve sayma)"""
+    Counter(re.findall(r'\w+', REFERENCE_TEXT.lower()))
+
+
+def timed(function):
+    started = time.perf_counter()
+    function()
+    return time.perf_counter() - started
+
+
+def measure(function, repeat):
+    """Bir ısınma çalıştırmasından sonra süreleri, ardından ayrı bir çalıştırmada tepe belleği ölçer
+
+    Returns:
+        (durum süreleri, her durum çalıştırmasının ardından ölçülen referans süreleri, tepe bayt)
+    """
+    function()
+    timings = []
+    reference_timings = []
+    for _ in range(repeat):
+        timings.append(timed(function))
+        reference_timings.append(timed(reference_workload))
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return timings, reference_timings, peak
+
+
+def run_main(argv):
+    """video_summary.main'i verilen argümanlarla çalıştırır ve JSON çıktısını döndürür"""
+    saved_argv = sys.argv
+    sys.argv = ['video_summary.py'] + argv
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            video_summary.main()
+    except SystemExit as e:
+        if e.code not in (0, None):
+            raise RuntimeError(f"video_summary.main çıkış kodu {e.code}")
+    finally:
+        sys.argv = saved_argv
+    return json.loads(output.getvalue())
+
+
+def build_cases(server, video_ids, quick):
+    """(ad, fonksiyon, metin bayt sayısı) üçlülerini döndürür"""
+    processor = TranscriptProcessor()
+    cases = []
+    for video_id in video_ids:
+        language, segments = server.fixture_transcripts[video_id]
+        size = next(label for suffix, label in SIZES.items() if video_id.endswith(suffix))
+        if quick and size == '6h':
+            continue
+        label = f"{language}-{size}"
+        texts = [segment['text'] for segment in segments]
+        details = video_summary.parse_video_item(server.fixture_items[video_id])
+        transcript = video_summary.transcript_result(segments)
+        processed = processor.process(segments)
+        text_bytes = len(transcript['text'].encode('utf-8'))
+
+        cases += [
+            (f"clean_text[{label}]", lambda texts=texts: processor.clean_texts(texts), text_bytes),
+            (f"process[{label}]", lambda segments=segments: processor.process(segments), text_bytes),
+            (
+                f"generate_summary[{label}]",
+                lambda details=details, transcript=transcript, video_id=video_id, language=language:
+                    video_summary.generate_summary(details, transcript, video_id, language),
+                text_bytes,
+            ),
+            (
+                f"format_for_openai[{label}]",
+                lambda processed=processed, title=details['title']: format_transcript_for_openai(processed, title),
+                text_bytes,
+            ),
+            (
+                f"end_to_end[{label}]",
+                lambda video_id=video_id, language=language:
+                    run_main(['--video_id', video_id, '--language', language]),
+                text_bytes,
+            ),
+        ]
+    return cases
+
+
+# Mikro saniyelik durumlarda gürültünün regresyon sayılmaması için mutlak paylar
+TIME_SLACK_MS = 0.5
+MEMORY_SLACK_KIB = 64
+
+
+def run_case(function, text_bytes, repeat):
+    """Durumu ölçer ve rapor satırını döndürür"""
+    timings, reference_timings, peak = measure(function, repeat)
+    p50 = percentile(timings, 0.5)
+    return {
+        'relative': round(min(timings) / min(reference_timings), 4),
+        'reference_ms': round(min(reference_timings) * 1000, 3),
+        'min_ms': round(min(timings) * 1000, 3),
+        'p50_ms': round(p50 * 1000, 3),
+        'p90_ms': round(percentile(timings, 0.9) * 1000, 3),
+        'p99_ms': round(percentile(timings, 0.99) * 1000, 3),
+        'throughput_mb_s': round(text_bytes / p50 / 1e6, 2),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def compare(name, result, baseline, time_tolerance, memory_tolerance):
+    """Durum tabanı aşıyorsa açıklamaları döndürür"""
+    regressions = []
+    # Mutlak pay göreli birime referansın o anki süresiyle çevrilir
+    slack = TIME_SLACK_MS / result['reference_ms']
+    if result['relative'] > baseline['relative'] * (1 + time_tolerance) + slack:
+        regressions.append(
+            f"{name}: göreli maliyet {baseline['relative']:.3f} -> {result['relative']:.3f} "
+            f"(en iyi süre {result['min_ms']:.2f} ms)"
+        )
+    if result['peak_kib'] > baseline['peak_kib'] * (1 + memory_tolerance) + MEMORY_SLACK_KIB:
+        regressions.append(f"{name}: tepe bellek {baseline['peak_kib']:.0f} -> {result['peak_kib']:.0f} KiB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Python pipeline benchmark ve regresyon paketi')
+    parser.add_argument('--repeat', type=int, default=5, help='Durum başına ölçülen çalıştırma sayısı')
+    parser.add_argument('--quick', action='store_true', help='6 saatlik transkriptleri atla')
+    parser.add_argument('--filter', type=str, default='', help='Yalnızca adında bu metin geçen durumlar')
+    parser.add_argument('--baselines', type=str, default=BASELINES_PATH, help='Taban dosyası')
+    parser.add_argument('--update_baselines', action='store_true', help='Sonuçları taban dosyasına yaz')
+    parser.add_argument('--time_tolerance', type=float, default=0.3, help='Göreli maliyet için izin verilen artış oranı')
+    parser.add_argument('--memory_tolerance', type=float, default=0.2, help='Tepe bellek için izin verilen artış oranı')
+    parser.add_argument('--retries', type=int, default=2, help='Tabanı aşan durumun yeniden ölçülme sayısı')
+    parser.add_argument('--json', type=str, default='', help='Sonuçların yazılacağı JSON dosyası')
+    args = parser.parse_args()
+
+    baselines = {}
+    if os.path.exists(args.baselines):
+        with open(args.baselines, encoding='utf-8') as f:
+            baselines = json.load(f).get('cases', {})
+
+    results = {}
+    regressions = []
+    with FakeYouTubeServer(latency=0.0) as server:
+        server.install(video_summary)
+        video_ids = server.load_fixtures(FIXTURES_PATH)
+        cases = [case for case in build_cases(server, video_ids, args.quick) if args.filter in case[0]]
+
+        print(f"{'durum':<28} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'MB/s':>8} {'tepe KiB':>10} {'taban':>8}")
+        for name, function, text_bytes in cases:
+            result = run_case(function, text_bytes, args.repeat)
+            baseline = None if args.update_baselines else baselines.get(name)
+            if baseline is not None:
+                # Gürültü ölçümü yalnızca yavaşlatır; kalıcı olmayan aşımlar yeniden ölçülerek elenir
+                failures = compare(name, result, baseline, args.time_tolerance, args.memory_tolerance)
+                for _ in range(args.retries if failures else 0):
+                    retry = run_case(function, text_bytes, args.repeat)
+                    if retry['relative'] < result['relative']:
+                        result = dict(retry, peak_kib=min(retry['peak_kib'], result['peak_kib']))
+                    failures = compare(name, result, baseline, args.time_tolerance, args.memory_tolerance)
+                    if not failures:
+                        break
+                regressions += failures
+            results[name] = result
+            delta = f"{(result['relative'] / baseline['relative'] - 1) * 100:+.0f}%" if baseline else "-"
+            print(f"{name:<28} {result['p50_ms']:9.2f} {result['p90_ms']:9.2f} {result['p99_ms']:9.2f} "
+                  f"{result['throughput_mb_s']:8.2f} {result['peak_kib']:10.0f} {delta:>8}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baselines:
+        merged = dict(baselines)
+        merged.update({
+            name: {'relative': r['relative'], 'min_ms': r['min_ms'], 'peak_kib': r['peak_kib']}
+            for name, r in results.items()
+        })
+        with open(args.baselines, 'w', encoding='utf-8') as f:
+            json.dump({
+                'machine': f"{platform.machine()} {platform.processor() or platform.system()}",
+                'python': platform.python_version(),
+                'cases': dict(sorted(merged.items())),
+            }, f, indent=2)
+            f.write("\n")
+        print(f"\n{len(results)} durum tabanı kaydedildi: {args.baselines}")
+        return
+
+    if regressions:
+        print("\nRegresyonlar:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    if baselines:
+        print("\nRegresyon yok.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark'lar için deterministik sentetik transkript üreticisi.
+Türkçe ve İngilizce şablon cümlelerden, gerçek altyazılar gibi cümle ortasında bölünen
+segmentler üretir. Konuşma hızı ~150 kelime/dakikadır; metne ara sıra HTML varlıkları,
+tekrarlı noktalama ve URL'ler karıştırılır ki clean_text gerçekçi bir yük görsün.
+"""
+
+import random
+from typing import Any, Dict, List
+
+WORDS_PER_SECOND = 2.5
+
+VOCABULARY = {
+    'tr': {
+        'openers': ["Şimdi", "Yani", "Aslında", "Bakın", "Ayrıca", "Sonuç olarak", "Öncelikle", "Bu arada"],
+        'subjects': ["bu model", "yapay zeka", "eğitim verisi", "ilk katman", "ekibimiz", "bu yöntem",
+                     "kullanıcılar", "sistem", "tarif", "oyuncu", "takım", "öğrenciler"],
+        'objects': ["sonuçları", "hataları", "veriyi", "parametreleri", "performansı", "hamuru",
+                    "haritayı", "soruları", "grafikleri", "kodu", "ayarları", "örnekleri"],
+        'verbs': ["iyileştiriyor", "analiz ediyor", "hızlandırıyor", "kontrol ediyor", "değiştiriyor",
+                  "öğreniyor", "ölçüyor", "hazırlıyor", "karşılaştırıyor", "gösteriyor"],
+        'modifiers': ["çok daha hızlı", "adım adım", "dikkatlice", "her seferinde", "gerçek zamanlı",
+                      "beklenenden iyi", "oldukça kolay", "tekrar tekrar"],
+    },
+    'en': {
+        'openers': ["Now", "So", "Actually", "Look", "Also", "In the end", "First of all", "By the way"],
+        'subjects': ["this model", "the network", "our training data", "the first layer", "the team",
+                     "this method", "users", "the system", "the recipe", "the player", "students"],
+        'objects': ["the results", "the errors", "the data", "the parameters", "performance", "the dough",
+                    "the map", "the questions", "the charts", "the code", "the settings", "examples"],
+        'verbs': ["improves", "analyzes", "speeds up", "checks", "changes", "learns", "measures",
+                  "prepares", "compares", "shows"],
+        'modifiers': ["much faster", "step by step", "carefully", "every time", "in real time",
+                      "better than expected", "pretty easily", "again and again"],
+    },
+}
+
+NOISE = ["&amp;", "&#39;", "&quot;", "...", "!?", "https://example.com/link", "&gt;"]
+
+
+def synthetic_sentence(rnd: random.Random, language: str) -> str:
+    words = VOCABULARY[language]
+    parts = [rnd.choice(words['openers']) + ",", rnd.choice(words['subjects'])]
+    if language == 'tr':
+        parts += [rnd.choice(words['objects']), rnd.choice(words['modifiers']), rnd.choice(words['verbs'])]
+    else:
+        parts += [rnd.choice(words['verbs']), rnd.choice(words['objects']), rnd.choice(words['modifiers'])]
+    if rnd.random() < 0.05:
+        parts.insert(rnd.randrange(1, len(parts)), rnd.choice(NOISE))
+    return " ".join(parts) + rnd.choice(['.', '.', '.', '?', '!'])
+
+
+def synthetic_transcript(minutes: float, language: str = 'tr', seed: int = 0) -> List[Dict[str, Any]]:
+    """Verilen uzunlukta altyazı segmentleri üretir
+
+    Args:
+        minutes: Video süresi (dakika)
+        language: 'tr' veya 'en'
+        seed: Aynı girdiler için aynı transkripti üreten tohum
+
+    Returns:
+        'text', 'start' ve 'duration' anahtarlı segmentler
+    """
+    rnd = random.Random(f"{language}:{seed}")
+    total_words = int(minutes * 60 * WORDS_PER_SECOND)
+    words: List[str] = []
+    while len(words) < total_words:
+        words.extend(synthetic_sentence(rnd, language).split())
+
+    segments = []
+    start = 0.0
+    position = 0
+    while position < total_words:
+        count = rnd.randint(6, 12)
+        chunk = words[position:position + count]
+        position += count
+        duration = round(len(chunk) / WORDS_PER_SECOND, 2)
+        segments.append({'text': " ".join(chunk), 'start': round(start, 2), 'duration': duration})
+        start += duration
+    return segments
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite Disk Önbelleği
+Transkriptleri, video detaylarını ve parça özetlerini (video_id, dil, tür) anahtarıyla SQLite'ta saklar.
+Türe göre TTL, boyut sınırı ile LRU tahliyesi ve isabet/ıskalama sayaçları içerir.
+video_summary.py ve get_transcript.py aynı önbelleği paylaşır.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import instrumentation
+
+# Türe göre varsayılan yaşam süreleri (saniye)
+DEFAULT_TTLS = {
+    'transcript': 7 * 24 * 3600,
+    'details': 6 * 3600,
+    'chunk_summary': 30 * 24 * 3600,
+}
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'videobite', 'cache.sqlite3')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def cache_key(kind: str, video_id: str, language: str = '') -> str:
+    """(tür, video_id, dil) üçlüsünden içerik adresli anahtar üretir"""
+    return hashlib.sha256(f"{kind}\0{video_id}\0{language}".encode('utf-8')).hexdigest()
+
+
+class DiskCache:
+    """SQLite tabanlı, TTL ve LRU tahliyeli önbellek"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttls: Optional[Dict[str, float]] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES, enabled: bool = True):
+        """
+        Args:
+            path: SQLite dosya yolu
+            ttls: Tür -> saniye cinsinden TTL eşlemesi (DEFAULT_TTLS ile birleştirilir)
+            max_bytes: Saklanan değerlerin toplam boyut sınırı
+            enabled: False ise önbellek tamamen atlanır
+        """
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            # Birden fazla süreç (worker, get_transcript.py) aynı dosyayı okuyabilsin
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                ' key TEXT PRIMARY KEY,'
+                ' kind TEXT NOT NULL,'
+                ' video_id TEXT NOT NULL,'
+                ' language TEXT NOT NULL,'
+                ' value BLOB NOT NULL,'
+                ' size INTEGER NOT NULL,'
+                ' created_at REAL NOT NULL,'
+                ' accessed_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)')
+            # Toplam boyut her yazmada tabloyu taramamak için tek satırlık tabloda tutulur;
+            # tetikleyiciler tüm süreçlerin ekleme, güncelleme ve silmelerini yansıtır
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS meta ('
+                ' id INTEGER PRIMARY KEY CHECK (id = 0),'
+                ' total_size INTEGER NOT NULL)'
+            )
+            conn.execute(
+                'CREATE TRIGGER IF NOT EXISTS entries_size_insert AFTER INSERT ON entries BEGIN'
+                ' UPDATE meta SET total_size = total_size + NEW.size WHERE id = 0; END'
+            )
+            conn.execute(
+                'CREATE TRIGGER IF NOT EXISTS entries_size_update AFTER UPDATE OF size ON entries BEGIN'
+                ' UPDATE meta SET total_size = total_size + NEW.size - OLD.size WHERE id = 0; END'
+            )
+            conn.execute(
+                'CREATE TRIGGER IF NOT EXISTS entries_size_delete AFTER DELETE ON entries BEGIN'
+                ' UPDATE meta SET total_size = total_size - OLD.size WHERE id = 0; END'
+            )
+            # Eski sürümde oluşturulmuş dosyalarda toplam bir kez hesaplanır
+            if conn.execute('SELECT 1 FROM meta WHERE id = 0').fetchone() is None:
+                conn.execute('INSERT OR IGNORE INTO meta SELECT 0, COALESCE(SUM(size), 0) FROM entries')
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, kind: str, video_id: str, language: str = '') -> Optional[Any]:
+        """Önbellekteki değeri döndürür; yoksa veya süresi dolduysa None
+
+        Args:
+            kind: Kayıt türü ('transcript', 'details' ...)
+            video_id: YouTube video ID'si
+            language: Dil kodu (türe bağlı değilse boş)
+
+        Returns:
+            JSON'dan çözülmüş değer veya None
+        """
+        if not self.enabled:
+            return None
+
+        key = cache_key(kind, video_id, language)
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute('SELECT value, created_at FROM entries WHERE key = ?', (key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    instrumentation.count('cache_misses')
+                    return None
+
+                value, created_at = row
+                if now - created_at > self.ttls.get(kind, 0):
+                    conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+                    conn.commit()
+                    self.misses += 1
+                    instrumentation.count('cache_misses')
+                    return None
+
+                conn.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (now, key))
+                conn.commit()
+                self.hits += 1
+            instrumentation.count('cache_hits')
+            return json.loads(value)
+        except sqlite3.Error as e:
+            print(f"Önbellek okunurken hata: {str(e)}", file=sys.stderr)
+            return None
+
+    def set(self, kind: str, video_id: str, value: Any, language: str = '') -> None:
+        """Değeri önbelleğe yazar ve gerekirse en eski kullanılan kayıtları tahliye eder
+
+        Args:
+            kind: Kayıt türü
+            video_id: YouTube video ID'si
+            value: JSON'a çevrilebilir değer
+            language: Dil kodu
+        """
+        if not self.enabled:
+            return
+
+        data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        if len(data) > self.max_bytes:
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                # INSERT OR REPLACE'in örtük silmesi tetikleyicileri çalıştırmaz; upsert güncelleme tetikleyicisini çalıştırır
+                conn.execute(
+                    'INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)'
+                    ' ON CONFLICT (key) DO UPDATE SET value = excluded.value, size = excluded.size,'
+                    ' created_at = excluded.created_at, accessed_at = excluded.accessed_at',
+                    (cache_key(kind, video_id, language), kind, video_id, language, data, len(data), now, now)
+                )
+                self._evict(conn)
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Önbelleğe yazılırken hata: {str(e)}", file=sys.stderr)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute('SELECT total_size FROM meta WHERE id = 0').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # En uzun süredir erişilmeyen kayıtları sınırın altına inene kadar sil
+        expired_keys = []
+        for key, size in conn.execute('SELECT key, size FROM entries ORDER BY accessed_at'):
+            expired_keys.append((key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+        conn.executemany('DELETE FROM entries WHERE key = ?', expired_keys)
+
+    def clear(self) -> None:
+        """Tüm kayıtları siler"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute('DELETE FROM entries')
+            conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """İsabet/ıskalama sayaçlarını ve disk kullanımını döndürür"""
+        result = {"enabled": self.enabled, "hits": self.hits, "misses": self.misses, "entries": 0, "bytes": 0}
+        if self.enabled:
+            with self._lock:
+                entries, size = self._connection().execute(
+                    'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries'
+                ).fetchone()
+            result.update(entries=entries, bytes=size)
+        return result
+
+
+_default_cache = None
+
+
+def get_cache() -> DiskCache:
+    """Ortam değişkenlerinden yapılandırılan paylaşılan önbellek örneğini döndürür
+
+    VIDEOBITE_CACHE_PATH, VIDEOBITE_CACHE_MAX_BYTES ve VIDEOBITE_CACHE_DISABLED
+    (1 ise önbellek atlanır) okunur.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = DiskCache(
+            path=os.getenv('VIDEOBITE_CACHE_PATH', DEFAULT_CACHE_PATH),
+            max_bytes=int(os.getenv('VIDEOBITE_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES)),
+            enabled=os.getenv('VIDEOBITE_CACHE_DISABLED', '') not in ('1', 'true'),
+        )
+    return _default_cache
+
+
+if __name__ == "__main__":
+    # Kullanım: python cache.py [stats|clear]
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    cache = get_cache()
+    if command == 'clear':
+        cache.clear()
+    print(json.dumps(cache.stats(), ensure_ascii=False))
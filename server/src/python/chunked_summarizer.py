@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite Parçalı (Map-Reduce) Özetleyici
+Modelin bağlam penceresini aşan transkriptleri paragraf/cümle sınırlarından token
+bütçeli parçalara böler. Parçalar sınırlı bir havuzda eşzamanlı özetlenir (map),
+ardından özetler bütçeye sığana kadar kademeli olarak birleştirilir (reduce).
+
+Özetleme arka ucu değiştirilebilir: LocalStubBackend çevrimdışı ve deterministiktir,
+OpenAIBackend openai paketini yalnızca kullanıldığında içe aktarır. Parça özetleri
+içerik adresli olarak önbelleğe alınır; yeniden çalıştırmada yalnızca değişen parçalar
+ve girdisi değişen birleştirme grupları yeniden özetlenir. Tek parça değiştiğinde en
+fazla 1 + birleştirme düzeyi kadar arka uç çağrısı yapılır.
+"""
+
+import hashlib
+import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import instrumentation
+from cache import get_cache
+from data_pipeline import ProcessedTranscript, TranscriptProcessor, sent_tokenize
+from summarizer import ExtractiveSummarizer
+
+# Token sayısı için kaba tahmin: ortalama 4 karakter ≈ 1 token
+CHARS_PER_TOKEN = 4
+
+# Prompt veya birleştirme biçimi değiştiğinde eski önbellek kayıtlarını geçersiz kılar
+CHUNK_CACHE_VERSION = '1'
+
+
+def estimate_tokens(text: str) -> int:
+    """Metnin yaklaşık token sayısını döndürür"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass
+class TranscriptChunk:
+    """Token bütçesine sığan ardışık transkript metni"""
+    index: int
+    text: str
+    tokens: int
+
+
+@dataclass
+class ChunkedSummary:
+    """Map-reduce özetleme sonucu"""
+    summary: str
+    chunk_summaries: List[str]
+    levels: int
+    cache_hits: int = 0
+    chunks: List[TranscriptChunk] = field(default_factory=list)
+
+
+class LocalStubBackend:
+    """Çevrimdışı, deterministik özetleme arka ucu
+
+    Metni ExtractiveSummarizer ile özetler; testlerde ve API anahtarı olmadan kullanılır.
+    """
+
+    name = 'local-extractive'
+
+    def __init__(self, sentences: int = 3):
+        self.sentences = sentences
+        self._processor = TranscriptProcessor()
+        self._summarizer = ExtractiveSummarizer(min_sentence_chars=0)
+
+    def summarize(self, text: str, max_tokens: int) -> str:
+        processed = self._processor.process([{'text': text, 'start': 0, 'duration': 0}])
+        summary, _ = self._summarizer.summarize(processed, self.sentences)
+        summary = summary or " ".join(processed.sentences[:self.sentences])
+        return summary[:max_tokens * CHARS_PER_TOKEN]
+
+
+class OpenAIBackend:
+    """OpenAI Chat Completions arka ucu (OPENAI_API_KEY ve OPENAI_MODEL ortam değişkenleri)"""
+
+    def __init__(self, model: Optional[str] = None, language: str = 'tr'):
+        self.model = model or os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
+        self.language = language
+        self.name = f'openai:{self.model}'
+        self._client = None
+
+    def summarize(self, text: str, max_tokens: int) -> str:
+        if self._client is None:
+            from openai import OpenAI
+            self._client = OpenAI()
+        response = self._client.chat.completions.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=0,
+            messages=[
+                {"role": "system", "content": f"Aşağıdaki video transkripti bölümünü '{self.language}' dilinde, "
+                                              "önemli bilgileri koruyarak kısaca özetle."},
+                {"role": "user", "content": text},
+            ],
+        )
+        return (response.choices[0].message.content or '').strip()
+
+
+def get_backend(name: str, language: str = 'tr'):
+    """Komut satırı adından özetleme arka ucunu oluşturur ('local' veya 'openai')"""
+    if name == 'local':
+        return LocalStubBackend()
+    if name == 'openai':
+        return OpenAIBackend(language=language)
+    raise ValueError(f"Bilinmeyen özetleme arka ucu: {name}")
+
+
+def _split_to_budget(text: str, max_tokens: int) -> List[str]:
+    """Bütçeyi aşan metni cümlelerden, tek cümle de aşıyorsa kelimelerden böler"""
+    if estimate_tokens(text) <= max_tokens:
+        return [text]
+
+    units = sent_tokenize(text)
+    if len(units) <= 1:
+        units = text.split()
+    pieces = []
+    current = []
+    current_tokens = 0
+    for unit in units:
+        unit_tokens = estimate_tokens(unit) + 1
+        if current and current_tokens + unit_tokens > max_tokens:
+            pieces.append(" ".join(current))
+            current = []
+            current_tokens = 0
+        if unit_tokens > max_tokens and len(units) > 1 and ' ' in unit:
+            pieces.extend(_split_to_budget(unit, max_tokens))
+            continue
+        current.append(unit)
+        current_tokens += unit_tokens
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def pack_texts(texts: List[str], max_tokens: int, boundary_every: int = 4) -> List[TranscriptChunk]:
+    """Metinleri sırayla, her parça bütçeyi aşmayacak şekilde birleştirir
+
+    Parça sınırları içerikten belirlenir: bütçenin yarısı dolduktan sonra sağlama toplamı
+    boundary_every'ye bölünen metinde parça kapanır. Böylece bir paragraftaki değişiklik
+    sonraki tüm sınırları kaydırmaz ve önbellekteki parça özetleri geçerli kalır.
+
+    Args:
+        texts: Paragraflar veya özetler
+        max_tokens: Parça başına token bütçesi
+        boundary_every: İçerik tabanlı sınır sıklığı (0: yalnızca bütçe dolunca kapat)
+
+    Returns:
+        Parçalar listesi
+    """
+    chunks: List[TranscriptChunk] = []
+    current: List[str] = []
+    current_tokens = 0
+
+    def flush():
+        nonlocal current, current_tokens
+        if current:
+            text = "\n\n".join(current)
+            chunks.append(TranscriptChunk(index=len(chunks), text=text, tokens=estimate_tokens(text)))
+            current = []
+            current_tokens = 0
+
+    for text in texts:
+        for piece in _split_to_budget(text, max_tokens):
+            piece_tokens = estimate_tokens(piece) + 1
+            if current and current_tokens + piece_tokens > max_tokens:
+                flush()
+            current.append(piece)
+            current_tokens += piece_tokens
+            if (boundary_every and current_tokens >= max_tokens // 2
+                    and zlib.crc32(piece.encode('utf-8')) % boundary_every == 0):
+                flush()
+    flush()
+    return chunks
+
+
+class ChunkedSummarizer:
+    """Token bütçeli map-reduce özetleyici"""
+
+    def __init__(self, backend=None, max_chunk_tokens: int = 3000, summary_tokens: int = 400,
+                 concurrency: int = 4, cache=None):
+        """
+        Args:
+            backend: summarize(text, max_tokens) ve name sunan arka uç (varsayılan: LocalStubBackend)
+            max_chunk_tokens: Arka uca tek çağrıda gönderilecek en fazla token
+            summary_tokens: Her özet çağrısı için çıktı token sınırı
+            concurrency: Aynı anda çalışan en fazla özet çağrısı
+            cache: Parça özetlerinin saklanacağı DiskCache (varsayılan: paylaşılan önbellek)
+        """
+        self.backend = backend if backend is not None else LocalStubBackend()
+        self.max_chunk_tokens = max_chunk_tokens
+        # Birleştirme adımında bir parçaya en az iki özet sığsın diye özetler bütçenin üçte birini aşamaz
+        self.summary_tokens = max(1, min(summary_tokens, max_chunk_tokens // 3))
+        self.concurrency = max(1, concurrency)
+        self.cache = cache if cache is not None else get_cache()
+
+    def chunk(self, processed: ProcessedTranscript) -> List[TranscriptChunk]:
+        """Transkripti paragraf sınırlarından (gerekirse cümle sınırlarından) parçalara böler"""
+        return pack_texts(processed.paragraphs or processed.sentences, self.max_chunk_tokens)
+
+    def _summarize_one(self, text: str) -> tuple:
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        variant = f"{self.backend.name}:{self.summary_tokens}:{CHUNK_CACHE_VERSION}"
+        cached = self.cache.get('chunk_summary', digest, variant)
+        if cached is not None:
+            return cached, True
+
+        summary = self.backend.summarize(text, self.summary_tokens)
+        self.cache.set('chunk_summary', digest, summary, variant)
+        return summary, False
+
+    def _summarize_all(self, texts: List[str], executor: ThreadPoolExecutor) -> tuple:
+        outcomes = list(executor.map(instrumentation.propagate(self._summarize_one), texts))
+        return [summary for summary, _ in outcomes], sum(1 for _, hit in outcomes if hit)
+
+    def summarize(self, processed: ProcessedTranscript) -> ChunkedSummary:
+        """Transkripti map-reduce ile özetler
+
+        Args:
+            processed: İşlenmiş transkript
+
+        Returns:
+            Nihai özet, parça özetleri ve birleştirme düzeyi sayısı
+        """
+        chunks = self.chunk(processed)
+        if not chunks:
+            return ChunkedSummary(summary="", chunk_summaries=[], levels=0)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            with instrumentation.stage('summarize.map'):
+                chunk_summaries, cache_hits = self._summarize_all([chunk.text for chunk in chunks], executor)
+
+            # Özetler tek bir bütçeye sığana kadar gruplanıp yeniden özetlenir
+            summaries = chunk_summaries
+            levels = 0
+            with instrumentation.stage('summarize.reduce'):
+                while len(summaries) > 1:
+                    groups = [group.text for group in pack_texts(summaries, self.max_chunk_tokens)]
+                    if len(groups) >= len(summaries):
+                        # Arka uç çıktı sınırını aştıysa en azından ikişer ikişer birleştir
+                        groups = ["\n\n".join(summaries[i:i + 2]) for i in range(0, len(summaries), 2)]
+                    summaries, hits = self._summarize_all(groups, executor)
+                    cache_hits += hits
+                    levels += 1
+
+        return ChunkedSummary(
+            summary=summaries[0],
+            chunk_summaries=chunk_summaries,
+            levels=levels,
+            cache_hits=cache_hits,
+            chunks=chunks,
+        )
@@ -7,46 +7,446 @@ Bu modül, YouTube transkriptlerini işlemek için bir pipeline sağlar.
 """
 
 import re
-import nltk
+import os
 import json
-from typing import Dict, List, Any, Optional, Tuple
-from collections import Counter
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+from collections import Counter, deque
+from itertools import islice
 from dataclasses import dataclass
 import logging
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
 
-# NLTK verilerini yükle (ilk çalıştırmada gerekli)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
+import instrumentation
+from language_id import LanguageGuess, identify_language
 
-try:
-    from nltk.corpus import stopwords
-    STOP_WORDS = set(stopwords.words('english') + stopwords.words('turkish'))
-except:
-    STOP_WORDS = set()
+# NLTK ve verileri ilk kullanımda yüklenir; import sırasında ağ erişimi veya korpus okuma yapılmaz.
+# Paketle birlikte gelen yerel veri dizini arama yoluna ilk sırada eklenir.
+NLTK_DATA_DIR = os.getenv('VIDEOBITE_NLTK_DATA', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nltk_data'))
+
+# 1 ise eksik NLTK verileri ilk kullanımda NLTK_DATA_DIR'e indirilir (varsayılan: kapalı)
+NLTK_DOWNLOAD = os.getenv('VIDEOBITE_NLTK_DOWNLOAD', '') == '1'
+
+_nltk_module = None
+_punkt_checked = False
+_stop_words = None
+
+
+def _nltk():
+    """NLTK'yı ilk çağrıda içe aktarır ve yerel veri dizinini arama yoluna ekler"""
+    global _nltk_module
+    if _nltk_module is None:
+        import nltk
+        if NLTK_DATA_DIR not in nltk.data.path:
+            nltk.data.path.insert(0, NLTK_DATA_DIR)
+        _nltk_module = nltk
+    return _nltk_module
+
+
+def _ensure_resource(resource_path: str, package: str) -> None:
+    """Veri bulunamazsa ve indirme açıkça etkinse NLTK_DATA_DIR'e indirir"""
+    nltk = _nltk()
+    try:
+        nltk.data.find(resource_path)
+    except LookupError:
+        if NLTK_DOWNLOAD:
+            nltk.download(package, download_dir=NLTK_DATA_DIR, quiet=True)
+
+
+def get_stop_words() -> set:
+    """İngilizce ve Türkçe dur kelimelerini ilk çağrıda yükler ve önbelleğe alır
+    
+    Returns:
+        Dur kelimeleri kümesi (veri yoksa boş küme)
+    """
+    global _stop_words
+    if _stop_words is None:
+        try:
+            _ensure_resource('corpora/stopwords', 'stopwords')
+            from nltk.corpus import stopwords
+            _stop_words = set(stopwords.words('english') + stopwords.words('turkish'))
+        except Exception:
+            _stop_words = set()
+    return _stop_words
+
+
+# Punkt verisi yoksa kullanılan basit cümle sınırı (noktalama + boşluk)
+SENTENCE_FALLBACK_PATTERN = re.compile(r'(?<=[.!?])\s+')
+_punkt_available = True
+
+
+def sent_tokenize(text: str) -> List[str]:
+    """Punkt ile cümlelere ayırır; NLTK ilk çağrıda yüklenir
+    
+    Punkt verisi bulunamazsa (ör. çevrimdışı konteyner) noktalama tabanlı basit bölmeye düşer.
+    """
+    global _punkt_checked, _punkt_available
+    if not _punkt_checked:
+        _ensure_resource('tokenizers/punkt', 'punkt')
+        _punkt_checked = True
+    if _punkt_available:
+        try:
+            return _nltk().sent_tokenize(text)
+        except LookupError:
+            _punkt_available = False
+            logging.getLogger(__name__).warning("Punkt verisi bulunamadı; basit cümle bölme kullanılıyor")
+    return [sentence for sentence in SENTENCE_FALLBACK_PATTERN.split(text.strip()) if sentence]
+
+
+def preload(data_dir: Optional[str] = None) -> None:
+    """NLTK verilerini önceden belleğe alır (ör. worker başlangıcında)
+    
+    Args:
+        data_dir: Önce aranacak yerel NLTK veri dizini (varsayılan: NLTK_DATA_DIR)
+    """
+    if data_dir:
+        nltk = _nltk()
+        if data_dir not in nltk.data.path:
+            nltk.data.path.insert(0, data_dir)
+    get_stop_words()
+    sent_tokenize("Hazır.")
+
+
+def __getattr__(name: str) -> Any:
+    # STOP_WORDS geriye dönük uyumluluk için tembel bir modül özniteliğidir
+    if name == 'STOP_WORDS':
+        return get_stop_words()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# clean_text kurallarının tek geçişlik birleşik hali. Sıralı re.sub zincirinin etkileşimleri
+# korunur: &amp; önce çözüldüğü için "&amp;lt;" gibi çift kodlanmış varlıklar da tek eşleşmedir,
+# URL'ler boşluğa kadar her şeyi (varlıklar ve noktalama dahil) yutar ve yalnızca
+# değişmesi gereken boşluklar (tek ' ' dışındaki her şey) eşleşir.
+CLEAN_PATTERN = re.compile(
+    r'(?P<url>https?://\S+)'
+    r'|(?P<ws>\s{2,}|[^\S ])'
+    r'|(?P<entity>&amp;(?:lt;|gt;|quot;|#39;)?|&lt;|&gt;|&quot;|&#39;)'
+    r'|(?P<punct>[.!?]{2,})'
+)
+
+HTML_ENTITIES = {
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&#39;': "'",
+    '&amp;lt;': '<',
+    '&amp;gt;': '>',
+    '&amp;quot;': '"',
+    '&amp;#39;': "'",
+}
+
+CLEAN_REPLACEMENTS = {'url': '', 'ws': ' ', 'punct': '.'}
+
+
+def _clean_match(match: re.Match) -> str:
+    kind = match.lastgroup
+    if kind == 'entity':
+        return HTML_ENTITIES[match.group()]
+    return CLEAN_REPLACEMENTS[kind]
+
+# Terim çıkarma için kelime deseni
+TERM_PATTERN = re.compile(r'\b[a-zA-ZğĞüÜşŞıİöÖçÇ]{3,}\b')
+
+# Akış modunda cümle bölmenin çalıştırılacağı minimum tampon boyutu (karakter)
+SENTENCE_CHUNK_CHARS = 64 * 1024
 
 
 @dataclass
 class TranscriptSegment:
     """Transkript segment sınıfı"""
+    __slots__ = ('text', 'start', 'duration')
     text: str
     start: float
     duration: float
 
 
+class SegmentStore(Sequence):
+    """Segmentleri sütunlu olarak saklayan salt okunur dizi
+    
+    Metinler tek bir tamponda boşlukla birleştirilir, sınırları bir ofset dizisinde
+    tutulur; başlangıç ve süreler array('d') sütunlarıdır. TranscriptSegment nesneleri
+    yalnızca erişildiğinde üretilir. Segment metinleri tam metinle aynıysa tampon
+    olarak full_text paylaşılır ve metin bellekte ikinci kez tutulmaz.
+    """
+    
+    def __init__(self):
+        self.starts = array('d')
+        self.durations = array('d')
+        # i. segment metni: _text[_offsets[i]:_offsets[i + 1] - 1]
+        self._offsets = array('q', [0])
+        self._text = ''
+        self._pending: List[str] = []
+    
+    def add(self, text: str, start: float, duration: float) -> None:
+        """Sona yeni bir segment ekler"""
+        self._pending.append(text)
+        self._offsets.append(self._offsets[-1] + len(text) + 1)
+        self.starts.append(start)
+        self.durations.append(duration)
+    
+    def append(self, segment: TranscriptSegment) -> None:
+        self.add(segment.text, segment.start, segment.duration)
+    
+    def freeze(self, text: Optional[str] = None) -> None:
+        """Bekleyen metinleri tampona yazar
+        
+        Args:
+            text: Segment metinlerinin boşlukla birleşimine eşit olduğu bilinen hazır metin
+                (ör. full_text); verilirse ayrı bir tampon oluşturulmaz
+        """
+        if text is not None:
+            self._text = text
+        elif self._pending:
+            self._text = " ".join(([self._text] if self._text else []) + self._pending)
+        self._pending = []
+    
+    @property
+    def buffer(self) -> str:
+        """Tüm segment metinlerinin boşlukla birleştirilmiş hali"""
+        if self._pending:
+            self.freeze()
+        return self._text
+    
+    def text(self, index: int) -> str:
+        """index. segmentin metnini döndürür"""
+        offsets = self._offsets
+        return self.buffer[offsets[index]:offsets[index + 1] - 1]
+    
+    def texts(self) -> Iterator[str]:
+        buffer = self.buffer
+        offsets = self._offsets
+        for i in range(len(self.starts)):
+            yield buffer[offsets[i]:offsets[i + 1] - 1]
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+        return TranscriptSegment(text=self.text(index), start=self.starts[index], duration=self.durations[index])
+    
+    def __iter__(self) -> Iterator[TranscriptSegment]:
+        for text, start, duration in zip(self.texts(), self.starts, self.durations):
+            yield TranscriptSegment(text=text, start=start, duration=duration)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SegmentStore):
+            return (self.starts == other.starts and self.durations == other.durations
+                    and self._offsets == other._offsets and self.buffer == other.buffer)
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"SegmentStore({len(self)} segment)"
+    
+    def __getstate__(self):
+        # Süreçler arası aktarımda yalnızca tampon ve sütunlar gönderilir
+        if self._pending:
+            self.freeze()
+        return self.__dict__
+
+
 @dataclass
 class ProcessedTranscript:
     """İşlenmiş transkript veri sınıfı"""
     full_text: str
-    segments: List[TranscriptSegment]
+    segments: SegmentStore
     sentences: List[str]
     language: str
     word_count: int
     duration: float
     important_terms: List[Tuple[str, int]]
     paragraphs: List[str]
+    language_confidence: float = 0.0
+    
+    def ranked_terms(self, top_n: int = 20, document_id: Optional[str] = None) -> list:
+        """Tek ve iki kelimelik terimleri derlem genelinde TF-IDF ile sıralar
+    
+        important_terms ham sıklığa göre sıralıdır; bu sıralama her videoda geçen
+        genel kelimeleri geri plana iter (bkz. term_extractor.TermExtractor).
+    
+        Args:
+            top_n: Döndürülecek terim sayısı
+            document_id: Verilirse transkript kalıcı belge frekansı tablosuna bir kez eklenir
+    
+        Returns:
+            Puanı azalan sırada RankedTerm listesi
+        """
+        # term_extractor bu modülü içe aktarır; döngüsel içe aktarmayı önlemek için burada yüklenir
+        from term_extractor import get_extractor
+        return get_extractor().rank(self, top_n, document_id)
+
+
+class SegmentTimeIndex:
+    """Segment başlangıç zamanları üzerinde bisect tabanlı aralık indeksi
+    
+    Başlangıçlar sıralı tutulur; bitişlerin önek maksimumu da monoton olduğundan
+    nokta ve aralık sorgularında aday bölge iki ikili aramayla bulunur. Sorgu maliyeti
+    O(log n + k) olup k, aday bölgedeki (üst üste binen) segment sayısıdır.
+    """
+    
+    def __init__(self, starts: Sequence, durations: Sequence):
+        """
+        Args:
+            starts: Segment başlangıçları (saniye)
+            durations: Segment süreleri (saniye)
+        """
+        count = len(starts)
+        if all(starts[i] <= starts[i + 1] for i in range(count - 1)):
+            self._order = None
+            sorted_starts = array('d', starts)
+            ends = array('d', (start + duration for start, duration in zip(starts, durations)))
+        else:
+            # YouTube segmentleri normalde sıralıdır; değilse sıralı konumdan segment indeksine eşleme tutulur
+            self._order = array('q', sorted(range(count), key=starts.__getitem__))
+            sorted_starts = array('d', (starts[i] for i in self._order))
+            ends = array('d', (starts[i] + durations[i] for i in self._order))
+        
+        self._starts = sorted_starts
+        self._ends = ends
+        self._max_ends = array('d', ends)
+        for position in range(1, count):
+            if self._max_ends[position] < self._max_ends[position - 1]:
+                self._max_ends[position] = self._max_ends[position - 1]
+    
+    def __len__(self) -> int:
+        return len(self._starts)
+    
+    def _segment(self, position: int) -> int:
+        return position if self._order is None else self._order[position]
+    
+    def _contains(self, position: int, time: float) -> bool:
+        # Süresi sıfır olan segment yalnızca kendi başlangıç anını kapsar
+        return self._ends[position] > time or self._starts[position] == time
+    
+    def segment_at(self, time: float) -> Optional[int]:
+        """time anını kapsayan segmentin indeksini döndürür
+        
+        Birden fazla segment kapsıyorsa en son başlayan seçilir.
+        
+        Args:
+            time: Saniye cinsinden zaman
+            
+        Returns:
+            Segment indeksi veya (boşluğa denk geliyorsa) None
+        """
+        upper = bisect_right(self._starts, time)
+        lower = bisect_right(self._max_ends, time)
+        for position in range(upper - 1, lower - 1, -1):
+            if self._contains(position, time):
+                return self._segment(position)
+        # Sıfır süreli segmentler önek maksimumunu aşmaz; başlangıcı tam time olanlara bak
+        if upper and self._starts[upper - 1] == time:
+            return self._segment(upper - 1)
+        return None
+    
+    def segments_between(self, start: float, end: float) -> List[int]:
+        """[start, end) aralığıyla kesişen segmentlerin indekslerini sırayla döndürür
+        
+        Args:
+            start: Aralık başı (saniye)
+            end: Aralık sonu (saniye)
+            
+        Returns:
+            Segment indeksleri
+        """
+        if end <= start:
+            segment = self.segment_at(start)
+            return [] if segment is None else [segment]
+        
+        upper = bisect_left(self._starts, end)
+        lower = bisect_right(self._max_ends, start)
+        # Sıfır süreli segmentler önek maksimumunda görünmeyebilir; aralık başından itibaren de tara
+        lower = min(lower, bisect_left(self._starts, start))
+        segments = [
+            self._segment(position) for position in range(lower, upper)
+            if self._ends[position] > start or self._starts[position] >= start
+        ]
+        if self._order is not None:
+            segments.sort()
+        return segments
+
+
+class TranscriptTimeIndex(SegmentTimeIndex):
+    """İşlenmiş bir transkript için zaman indeksi
+    
+    Segment sorgularına ek olarak cümle ve paragraf indekslerini, kapsadıkları
+    segmentlerin zaman aralığına eşler.
+    """
+    
+    def __init__(self, processed: ProcessedTranscript, processor: Optional["TranscriptProcessor"] = None):
+        """
+        Args:
+            processed: İşlenmiş transkript
+            processor: Segment metinleri tam metinden farklıysa parçaları yeniden temizlemek için işleyici
+        """
+        segments = processed.segments
+        super().__init__(segments.starts, segments.durations)
+        self.processed = processed
+        
+        # Tam metindeki segment parçalarının başlangıç ofsetleri
+        if segments.buffer is processed.full_text:
+            text_offsets = segments._offsets
+        else:
+            processor = processor or TranscriptProcessor()
+            text_offsets = array('q', [0])
+            for piece in processor.clean_texts(segments.texts()):
+                text_offsets.append(text_offsets[-1] + len(piece) + 1)
+        
+        # Cümleler tam metnin alt dizeleridir; sırayla aranarak konumlanır
+        self._sentence_segments = array('q')
+        full_text = processed.full_text
+        cursor = 0
+        for sentence in processed.sentences:
+            found = full_text.find(sentence, cursor)
+            start = cursor if found < 0 else found
+            end = start + len(sentence) if found >= 0 else cursor
+            self._sentence_segments.append(max(0, bisect_right(text_offsets, start) - 1))
+            self._sentence_segments.append(max(0, bisect_right(text_offsets, max(start, end - 1)) - 1))
+            cursor = end
+        
+        # Paragraflar ardışık segment metinlerinin boşlukla birleşimidir
+        self._paragraph_segments = array('q')
+        offsets = segments._offsets
+        first = 0
+        for paragraph in processed.paragraphs:
+            last = bisect_left(offsets, offsets[first] + len(paragraph) + 1) - 1
+            self._paragraph_segments.append(first)
+            self._paragraph_segments.append(max(first, last))
+            first = last + 1
+    
+    def _span_time(self, first: int, last: int) -> Tuple[float, float]:
+        segments = self.processed.segments
+        if not segments:
+            return 0.0, 0.0
+        start = min(segments.starts[first:last + 1])
+        end = max(s + d for s, d in zip(segments.starts[first:last + 1], segments.durations[first:last + 1]))
+        return start, end
+    
+    def sentence_time(self, index: int) -> Tuple[float, float]:
+        """index. cümlenin (başlangıç, bitiş) zamanını döndürür"""
+        return self._span_time(self._sentence_segments[2 * index], self._sentence_segments[2 * index + 1])
+    
+    def paragraph_time(self, index: int) -> Tuple[float, float]:
+        """index. paragrafın (başlangıç, bitiş) zamanını döndürür"""
+        return self._span_time(self._paragraph_segments[2 * index], self._paragraph_segments[2 * index + 1])
+    
+    def sentence_segments(self, index: int) -> Tuple[int, int]:
+        """index. cümlenin kapsadığı ilk ve son segment indeksleri"""
+        return self._sentence_segments[2 * index], self._sentence_segments[2 * index + 1]
+    
+    def text_between(self, start: float, end: float) -> str:
+        """[start, end) aralığında söylenenleri segment metinlerinden birleştirir"""
+        segments = self.processed.segments
+        return " ".join(segments.text(index) for index in self.segments_between(start, end))
 
 
 class TranscriptProcessor:
@@ -59,35 +459,32 @@ class TranscriptProcessor:
     def clean_text(self, text: str) -> str:
         """Metni temizler
         
+        Fazla boşlukları tek boşluğa indirir, HTML varlıklarını çözer, tekrar eden
+        noktalama işaretlerini tek noktaya indirir ve URL'leri kaldırır. Tüm kurallar
+        CLEAN_PATTERN ile tek geçişte uygulanır.
+        
         Args:
             text: Temizlenecek metin
             
         Returns:
             Temizlenmiş metin
         """
-        # Fazla boşlukları kaldır
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Özel karakterleri düzelt
-        text = re.sub(r'&amp;', '&', text)
-        text = re.sub(r'&lt;', '<', text)
-        text = re.sub(r'&gt;', '>', text)
-        text = re.sub(r'&quot;', '"', text)
-        text = re.sub(r'&#39;', "'", text)
-        
-        # Gereksiz tekrar eden noktalama işaretlerini kaldır
-        text = re.sub(r'[.!?]{2,}', '.', text)
-        
-        # URL'leri kaldır
-        text = re.sub(r'https?://\S+', '', text)
-        
-        # Diğer düzenlemeler
-        text = text.strip()
+        return CLEAN_PATTERN.sub(_clean_match, text).strip()
+    
+    def clean_texts(self, texts: Iterable[str]) -> List[str]:
+        """Bir segment listesini toplu olarak temizler
         
-        return text
+        Args:
+            texts: Temizlenecek metinler
+            
+        Returns:
+            Aynı sırada temizlenmiş metinler
+        """
+        sub = CLEAN_PATTERN.sub
+        return [sub(_clean_match, text).strip() for text in texts]
     
     def detect_language(self, text: str) -> str:
-        """Metinlerin dilini tespit eder (basit yöntem)
+        """Metinlerin dilini tespit eder
         
         Args:
             text: Dili tespit edilecek metin
@@ -95,14 +492,20 @@ class TranscriptProcessor:
         Returns:
             Dil kodu (örn. 'tr', 'en')
         """
-        # Bu basit bir dil tespiti. Daha gelişmiş bir yöntem için
-        # langdetect veya langid gibi kütüphaneler kullanılabilir
-        turkish_chars = re.findall(r'[ğĞüÜşŞıİöÖçÇ]', text)
+        return identify_language(text).language
+    
+    def identify_language(self, text: str) -> LanguageGuess:
+        """Metnin dilini karakter n-gram profilleriyle güven skoruyla birlikte tahmin eder
         
-        # Türkçe karakter oranı
-        if len(turkish_chars) > len(text) * 0.01:
-            return 'tr'
-        return 'en'
+        Uzun metinlerin tamamı değil, sınırlı bir örneği taranır (bkz. language_id).
+        
+        Args:
+            text: Dili tespit edilecek metin
+            
+        Returns:
+            Dil kodu ve 0-1 arası güven skoru
+        """
+        return identify_language(text)
     
     def extract_paragraphs(self, segments: List[TranscriptSegment], 
                             min_segment_chars: int = 200) -> List[str]:
@@ -143,10 +546,11 @@ class TranscriptProcessor:
             (terim, sıklık) tuple'larından oluşan liste
         """
         # Metni küçük harfe çevir ve kelimelere ayır
-        words = re.findall(r'\b[a-zA-ZğĞüÜşŞıİöÖçÇ]{3,}\b', text.lower())
+        words = TERM_PATTERN.findall(text.lower())
         
         # Dur kelimeleri çıkar
-        filtered_words = [word for word in words if word not in STOP_WORDS]
+        stop_words = get_stop_words()
+        filtered_words = [word for word in words if word not in stop_words]
         
         # En sık geçen terimleri bul
         word_counts = Counter(filtered_words)
@@ -161,7 +565,43 @@ class TranscriptProcessor:
         Returns:
             Cümleler listesi
         """
-        return nltk.sent_tokenize(text)
+        return sent_tokenize(text)
+    
+    def time_index(self, processed: ProcessedTranscript) -> TranscriptTimeIndex:
+        """İşlenmiş transkript için zaman indeksi oluşturur
+        
+        Args:
+            processed: İşlenmiş transkript
+            
+        Returns:
+            Nokta/aralık sorguları ve cümle/paragraf zamanlarını sunan indeks
+        """
+        return TranscriptTimeIndex(processed, self)
+    
+    def stream(self) -> "TranscriptStream":
+        """Segment segment beslenebilen artımlı bir işleyici oluşturur
+        
+        Returns:
+            feed()/finalize() çiftini sunan TranscriptStream
+        """
+        return TranscriptStream(self)
+    
+    def process_iter(self, transcript: Iterable[Dict[str, Any]]) -> ProcessedTranscript:
+        """Transkripti tek geçişte, segmentleri geldikçe işler
+        
+        Args:
+            transcript: Segment sözlükleri üreten herhangi bir iterable (liste, generator...)
+            
+        Returns:
+            İşlenmiş transkript
+        """
+        self.logger.info("Transkript işleniyor...")
+        
+        with instrumentation.stage('pipeline.process'):
+            stream = self.stream()
+            for item in transcript:
+                stream.feed(item)
+            return stream.finalize()
     
     def process(self, transcript: List[Dict[str, Any]]) -> ProcessedTranscript:
         """Ana işleme fonksiyonu
@@ -172,52 +612,206 @@ class TranscriptProcessor:
         Returns:
             İşlenmiş transkript
         """
-        self.logger.info("Transkript işleniyor...")
+        return self.process_iter(transcript)
+    
+    def process_many(self, transcripts: Iterable[List[Dict[str, Any]]], workers: Optional[int] = None,
+                     chunksize: int = 8) -> Iterator[ProcessedTranscript]:
+        """Çok sayıda transkripti süreç havuzunda, birden fazla CPU çekirdeğiyle işler
+        
+        Girdi parça parça (chunksize) gönderilir ve aynı anda en fazla workers * 2 parça
+        işlemde tutulur; böylece generator'dan beslenirken bellek kullanımı sınırlı kalır.
+        
+        Args:
+            transcripts: Transkriptler (liste veya generator)
+            workers: Süreç sayısı (varsayılan: CPU sayısı)
+            chunksize: Tek görevde gönderilecek transkript sayısı
+            
+        Returns:
+            Girdi sırasıyla işlenmiş transkriptler üreten iterator
+        """
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, chunksize)
         
-        # Segmentleri oluştur
-        segments = []
-        full_text = ""
-        total_duration = 0
+        if workers == 1:
+            for transcript in transcripts:
+                yield self.process(transcript)
+            return
         
-        for item in transcript:
-            text = self.clean_text(item.get('text', ''))
-            start = item.get('start', 0)
-            duration = item.get('duration', 0)
+        from concurrent.futures import ProcessPoolExecutor
+        
+        iterator = iter(transcripts)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_process_worker,
+            initargs=(self.min_segment_char_length,)
+        ) as executor:
+            pending = deque()
+            
+            def submit_next() -> bool:
+                chunk = list(islice(iterator, chunksize))
+                if not chunk:
+                    return False
+                pending.append(executor.submit(_process_chunk, chunk))
+                return True
+            
+            while len(pending) < workers * 2 and submit_next():
+                pass
             
-            if text:
-                segments.append(TranscriptSegment(text=text, start=start, duration=duration))
-                full_text += text + " "
-                total_duration += duration
+            while pending:
+                results = pending.popleft().result()
+                submit_next()
+                yield from results
+
+
+# Süreç havuzundaki her worker'ın kendi işleyicisi
+_worker_processor: Optional[TranscriptProcessor] = None
+
+
+def _init_process_worker(min_segment_char_length: int) -> None:
+    """Worker süreci başlarken işleyiciyi kurar ve NLTK verilerini bir kez yükler"""
+    global _worker_processor
+    _worker_processor = TranscriptProcessor(min_segment_char_length)
+    # Dur kelimeleri ve punkt modeli ilk görevden önce belleğe alınır
+    preload()
+
+
+def _process_chunk(chunk: List[List[Dict[str, Any]]]) -> List[ProcessedTranscript]:
+    return [_worker_processor.process(transcript) for transcript in chunk]
+
+
+class TranscriptStream:
+    """Artımlı transkript işleyici
+    
+    Her segment geldiğinde temizlenir ve SegmentStore'a eklenir; terim sayıları,
+    paragraflar, kelime sayısı, süre ve dil istatistikleri güncellenir. Cümle bölme, tampon SENTENCE_CHUNK_CHARS
+    boyutunu aştıkça parça parça yapılır. finalize() TranscriptProcessor.process ile
+    aynı ProcessedTranscript'i O(n) sürede üretir.
+    """
+    
+    def __init__(self, processor: TranscriptProcessor):
+        self.processor = processor
+        self.segments = SegmentStore()
+        # Segment metinleri tam metin parçalarıyla aynı kaldıkça tampon paylaşılabilir
+        self._segments_share_text = True
+        self.total_duration = 0
+        self.word_count = 0
+        self.term_counts = Counter()
+        self._stop_words = get_stop_words()
+        self.paragraphs: List[str] = []
+        self.sentences: List[str] = []
+        
+        # Tam metnin parçaları (sonda tek seferde birleştirilir)
+        self._pieces: List[str] = []
+        
+        # Henüz tamamlanmamış paragraf
+        self._paragraph_parts: List[str] = []
+        self._paragraph_length = 0
+        
+        # Henüz cümlelere bölünmemiş metin
+        self._sentence_parts: List[str] = []
+        self._sentence_length = 0
+        self._sentence_flush_at = SENTENCE_CHUNK_CHARS
+    
+    def feed(self, item: Dict[str, Any]) -> None:
+        """Tek bir transkript segmentini işler
+        
+        Args:
+            item: 'text', 'start' ve 'duration' anahtarlarını içeren segment
+        """
+        text = self.processor.clean_text(item.get('text', ''))
+        if not text:
+            return
+        
+        duration = item.get('duration', 0)
+        self.segments.add(text, item.get('start', 0), duration)
+        self.total_duration += duration
         
-        # Temiz tam metni oluştur
-        full_text = self.clean_text(full_text)
+        self._add_to_paragraph(text)
         
-        # Dili tespit et
-        language = self.detect_language(full_text)
+        # Tam metin, segmentlerin boşlukla birleştirilip tekrar temizlenmiş halidir;
+        # tüm temizleme kuralları boşluk sınırında yerel olduğundan segment bazında uygulanabilir
+        piece = self.processor.clean_text(text)
+        if piece != text:
+            self._segments_share_text = False
+        self._pieces.append(piece)
+        self.word_count += len(piece.split())
+        stop_words = self._stop_words
+        self.term_counts.update(
+            word for word in TERM_PATTERN.findall(piece.lower()) if word not in stop_words
+        )
+        
+        self._sentence_parts.append(piece)
+        self._sentence_length += len(piece) + 1
+        if self._sentence_length >= self._sentence_flush_at:
+            self._flush_sentences(final=False)
+    
+    def _add_to_paragraph(self, text: str) -> None:
+        self._paragraph_parts.append(text)
+        self._paragraph_length += len(text) + 1
         
-        # Cümlelere ayır
-        sentences = self.segment_to_sentences(full_text)
+        # Yeterli uzunluktaysa ve cümle sonu varsa paragrafı tamamla
+        if self._paragraph_length >= self.processor.min_segment_char_length and text.endswith(('.', '!', '?')):
+            self.paragraphs.append(" ".join(self._paragraph_parts))
+            self._paragraph_parts = []
+            self._paragraph_length = 0
+    
+    def _flush_sentences(self, final: bool) -> None:
+        if not self._sentence_parts:
+            return
         
-        # Paragrafları oluştur
-        paragraphs = self.extract_paragraphs(segments, self.min_segment_char_length)
+        buffer = " ".join(self._sentence_parts)
+        with instrumentation.stage('pipeline.tokenize'):
+            sentences = self.processor.segment_to_sentences(buffer)
+        if final:
+            self.sentences.extend(sentences)
+            self._sentence_parts = []
+            self._sentence_length = 0
+            return
         
-        # Önemli terimleri çıkar
-        important_terms = self.extract_important_terms(full_text)
+        if len(sentences) < 2:
+            # Cümle sınırı yok; tamponu her segmentte yeniden bölmemek için eşiği büyüt
+            self._sentence_parts = [buffer]
+            self._sentence_flush_at = self._sentence_length * 2
+            return
         
-        # Kelime sayısı
-        word_count = len(full_text.split())
+        # Son cümle devam ediyor olabilir; bir sonraki parçayla birlikte yeniden bölünür
+        self.sentences.extend(sentences[:-1])
+        pending = buffer[buffer.rfind(sentences[-1]):]
+        self._sentence_parts = [pending]
+        self._sentence_length = len(pending) + 1
+        self._sentence_flush_at = max(SENTENCE_CHUNK_CHARS, self._sentence_length * 2)
+    
+    def finalize(self) -> ProcessedTranscript:
+        """Kalan tamponları boşaltır ve sonucu döndürür
         
-        self.logger.info(f"Transkript işlendi: {word_count} kelime, {len(sentences)} cümle, {len(paragraphs)} paragraf")
+        Returns:
+            İşlenmiş transkript
+        """
+        self._flush_sentences(final=True)
+        if self._paragraph_parts:
+            self.paragraphs.append(" ".join(self._paragraph_parts))
+            self._paragraph_parts = []
+            self._paragraph_length = 0
+        
+        full_text = " ".join(self._pieces)
+        self.segments.freeze(full_text if self._segments_share_text else None)
+        language = self.processor.identify_language(full_text)
+        important_terms = self.term_counts.most_common(20)
+        
+        self.processor.logger.info(
+            f"Transkript işlendi: {self.word_count} kelime, {len(self.sentences)} cümle, {len(self.paragraphs)} paragraf"
+        )
         
         return ProcessedTranscript(
             full_text=full_text,
-            segments=segments,
-            sentences=sentences,
-            language=language,
-            word_count=word_count,
-            duration=total_duration,
+            segments=self.segments,
+            sentences=self.sentences,
+            language=language.language,
+            language_confidence=language.confidence,
+            word_count=self.word_count,
+            duration=self.total_duration,
             important_terms=important_terms,
-            paragraphs=paragraphs
+            paragraphs=self.paragraphs
         )
 
 
@@ -238,7 +832,8 @@ def format_transcript_for_openai(processed_transcript: ProcessedTranscript, vide
         "duration_minutes": round(processed_transcript.duration / 60, 2),
         "sentence_count": len(processed_transcript.sentences),
         "paragraph_count": len(processed_transcript.paragraphs),
-        "language": processed_transcript.language
+        "language": processed_transcript.language,
+        "language_confidence": processed_transcript.language_confidence
     }
     
     # Önemli terimler
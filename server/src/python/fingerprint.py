@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite Transkript Parmak İzleri
+Yeniden yüklenen, derleme veya aynı kaynaktan gelen videoları tespit etmek için
+temizlenmiş metinden birebir içerik özeti, MinHash ve SimHash imzaları üretir.
+
+MinHash imzası tek permütasyonlu hash (one permutation hashing) ile tek geçişte
+hesaplanır: her shingle bir kez hash'lenir ve hash değerine göre seçilen kutudaki
+minimum tutulur. FingerprintIndex imzaları SQLite'ta LSH bantlarıyla saklar; bir
+yakın kopya sorgusu tüm derlemi taramak yerine yalnızca aynı kovadaki adaylara bakar.
+Adaylar önce SimHash Hamming uzaklığıyla elenir; MinHash imzası yalnızca kalanlar
+için açılıp karşılaştırılır.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple
+
+from data_pipeline import ProcessedTranscript
+
+# İmza boyutu ve LSH bantlaması: 32 bant x 4 satır, Jaccard ~0.5 civarında eşik eğrisi verir
+MINHASH_BINS = 128
+LSH_BANDS = 32
+LSH_ROWS = MINHASH_BINS // LSH_BANDS
+
+# Parmak izindeki kelimeler; terim çıkarmadan farklı olarak sayılar ve kısa kelimeler de sayılır
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Shingle uzunluğu (kelime)
+SHINGLE_WORDS = 5
+
+# Yakın kopya sayılmak için gereken tahmini Jaccard benzerliği
+DEFAULT_THRESHOLD = 0.8
+
+# LSH adayının MinHash karşılaştırmasına geçmesi için en fazla SimHash uzaklığı (64 bitte);
+# eşik üstü yakın kopyalar ~10 bit içinde kalır, ilgisiz transkriptler ~32 bit uzaktadır
+SIMHASH_MAX_DISTANCE = 16
+
+_MAX_HASH = (1 << 64) - 1
+_GOLDEN_RATIO_64 = 0x9E3779B97F4A7C15
+
+# SimHash sayaçlarının şerit genişliği; 2^32 kelimeye kadar taşma olmaz
+_LANE_BITS = 32
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'videobite', 'fingerprints.sqlite3')
+
+
+def _hash64(data: str) -> int:
+    return int.from_bytes(hashlib.blake2b(data.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _signed64(value: int) -> int:
+    # SQLite INTEGER işaretli 64 bittir
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _tokens(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+@dataclass
+class TranscriptFingerprint:
+    """Bir transkriptin birebir ve yaklaşık eşleşme imzaları"""
+    content_hash: str
+    minhash: Tuple[int, ...]
+    simhash: int
+    shingle_count: int
+
+    def similarity(self, other: "TranscriptFingerprint") -> float:
+        """MinHash imzalarından tahmini Jaccard benzerliği"""
+        if self.content_hash == other.content_hash:
+            return 1.0
+        matches = sum(1 for a, b in zip(self.minhash, other.minhash) if a == b)
+        return matches / len(self.minhash)
+
+    def simhash_distance(self, other: "TranscriptFingerprint") -> int:
+        """SimHash imzaları arasındaki Hamming uzaklığı"""
+        return bin(self.simhash ^ other.simhash).count('1')
+
+
+def minhash_signature(shingle_hashes: set) -> Tuple[int, ...]:
+    """Tek permütasyonlu MinHash imzası üretir
+
+    Boş kalan kutular sağdaki ilk dolu kutunun değeriyle doldurulur (densification),
+    böylece kısa metinlerde de tüm bantlar karşılaştırılabilir olur.
+    """
+    bins = [_MAX_HASH] * MINHASH_BINS
+    for value in shingle_hashes:
+        position = value % MINHASH_BINS
+        rest = value // MINHASH_BINS
+        if rest < bins[position]:
+            bins[position] = rest
+
+    if all(value == _MAX_HASH for value in bins):
+        return tuple(bins)
+    for position in range(MINHASH_BINS):
+        offset = 1
+        while bins[position] == _MAX_HASH:
+            candidate = bins[(position + offset) % MINHASH_BINS]
+            if candidate != _MAX_HASH:
+                # Ödünç alınan değer kutu uzaklığıyla karıştırılır ki kopyalar birbirine eşitlenmesin
+                bins[position] = ((candidate + offset) * _GOLDEN_RATIO_64 & _MAX_HASH) // MINHASH_BINS
+            offset += 1
+    return tuple(bins)
+
+
+@lru_cache(maxsize=1 << 16)
+def _simhash_lanes(token: str) -> int:
+    """Token hash'inin her bitini ayrı bir _LANE_BITS genişliğinde şeride yayar"""
+    value = _hash64(token)
+    return sum(1 << (_LANE_BITS * bit) for bit in range(64) if value >> bit & 1)
+
+
+def simhash_signature(tokens: List[str]) -> int:
+    """Kelime sıklıklarıyla ağırlıklandırılmış 64 bitlik SimHash
+
+    64 bit sayacı tek bir büyük tamsayının şeritlerinde tutulur; her farklı kelime için
+    64 ayrı toplama yerine tek çarpma-toplama yapılır.
+    """
+    lanes = 0
+    for token, weight in Counter(tokens).items():
+        lanes += weight * _simhash_lanes(token)
+
+    total_weight = len(tokens)
+    mask = (1 << _LANE_BITS) - 1
+    result = 0
+    for bit in range(64):
+        # Bit, bu biti taşıyan kelimelerin ağırlığı diğerlerininkini aşıyorsa 1'dir
+        if 2 * ((lanes >> (_LANE_BITS * bit)) & mask) > total_weight:
+            result |= 1 << bit
+    return result
+
+
+def compute_fingerprint(processed: ProcessedTranscript) -> TranscriptFingerprint:
+    """İşlenmiş transkriptin parmak izini hesaplar
+
+    Args:
+        processed: İşlenmiş transkript
+
+    Returns:
+        Birebir içerik özeti, MinHash ve SimHash imzaları
+    """
+    return fingerprint_text(processed.full_text)
+
+
+def fingerprint_text(text: str) -> TranscriptFingerprint:
+    """Temizlenmiş metnin parmak izini hesaplar (bkz. compute_fingerprint)"""
+    tokens = _tokens(text)
+    normalized = " ".join(tokens)
+    content_hash = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    if len(tokens) < SHINGLE_WORDS:
+        shingles = {normalized} if normalized else set()
+    else:
+        shingles = {" ".join(tokens[i:i + SHINGLE_WORDS]) for i in range(len(tokens) - SHINGLE_WORDS + 1)}
+
+    return TranscriptFingerprint(
+        content_hash=content_hash,
+        minhash=minhash_signature({_hash64(shingle) for shingle in shingles}),
+        simhash=simhash_signature(tokens),
+        shingle_count=len(shingles),
+    )
+
+
+def _band_keys(signature: Tuple[int, ...]) -> List[Tuple[int, int]]:
+    keys = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        keys.append((band, _signed64(_hash64(",".join(map(str, rows))))))
+    return keys
+
+
+class FingerprintIndex:
+    """Parmak izlerini ve bunlara ait özetleri saklayan LSH indeksi (SQLite)"""
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH, threshold: float = DEFAULT_THRESHOLD, enabled: bool = True):
+        """
+        Args:
+            path: SQLite dosya yolu
+            threshold: Yakın kopya kabulü için minimum tahmini Jaccard benzerliği
+            enabled: False ise sorgular boş döner, kayıt yapılmaz
+        """
+        self.path = path
+        self.threshold = threshold
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS fingerprints ('
+                ' id INTEGER PRIMARY KEY,'
+                ' video_id TEXT NOT NULL,'
+                ' language TEXT NOT NULL,'
+                ' content_hash TEXT NOT NULL,'
+                ' minhash BLOB NOT NULL,'
+                ' simhash INTEGER NOT NULL,'
+                ' payload TEXT,'
+                ' created_at REAL NOT NULL,'
+                ' UNIQUE (video_id, language))'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS fingerprints_content ON fingerprints (content_hash, language)')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS lsh_buckets ('
+                ' band INTEGER NOT NULL,'
+                ' bucket INTEGER NOT NULL,'
+                ' fingerprint_id INTEGER NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS lsh_buckets_lookup ON lsh_buckets (band, bucket)')
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def add(self, video_id: str, language: str, fingerprint: TranscriptFingerprint, payload: Any = None) -> None:
+        """Parmak izini ve ilişkili sonucu (ör. özet) indekse ekler
+
+        Args:
+            video_id: YouTube video ID'si
+            language: Transkript dili
+            fingerprint: Transkriptin parmak izi
+            payload: JSON'a çevrilebilir, kopya bulunduğunda yeniden kullanılacak sonuç
+        """
+        self.add_many([(video_id, language, fingerprint, payload)])
+
+    def add_many(self, entries: Iterable[Tuple[str, str, TranscriptFingerprint, Any]]) -> None:
+        """Birden fazla kaydı tek işlemde ekler; aynı (video_id, dil) kaydı varsa değiştirilir
+
+        Args:
+            entries: (video_id, dil, parmak izi, payload) dörtlüleri
+        """
+        if not self.enabled:
+            return
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                for video_id, language, fingerprint, payload in entries:
+                    row = conn.execute(
+                        'SELECT id FROM fingerprints WHERE video_id = ? AND language = ?', (video_id, language)
+                    ).fetchone()
+                    if row is not None:
+                        conn.execute('DELETE FROM lsh_buckets WHERE fingerprint_id = ?', (row[0],))
+                        conn.execute('DELETE FROM fingerprints WHERE id = ?', (row[0],))
+                    cursor = conn.execute(
+                        'INSERT INTO fingerprints (video_id, language, content_hash, minhash, simhash, payload, created_at)'
+                        ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+                        (video_id, language, fingerprint.content_hash, array('Q', fingerprint.minhash).tobytes(),
+                         _signed64(fingerprint.simhash), json.dumps(payload, ensure_ascii=False), time.time())
+                    )
+                    conn.executemany(
+                        'INSERT INTO lsh_buckets VALUES (?, ?, ?)',
+                        [(band, bucket, cursor.lastrowid) for band, bucket in _band_keys(fingerprint.minhash)]
+                    )
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Parmak izi kaydedilirken hata: {str(e)}", file=sys.stderr)
+
+    def find(self, fingerprint: TranscriptFingerprint, language: str,
+             exclude_video_id: Optional[str] = None) -> Optional[Tuple[str, float, Any]]:
+        """Birebir veya yakın kopyayı arar
+
+        Önce içerik özeti ile birebir eşleşme, ardından LSH kovalarındaki adaylar
+        arasında en benzer kayıt aranır. SimHash uzaklığı SIMHASH_MAX_DISTANCE'ı aşan
+        adayların MinHash imzası karşılaştırılmaz.
+
+        Args:
+            fingerprint: Aranan transkriptin parmak izi
+            language: Transkript dili (yalnızca aynı dildeki kayıtlar eşleşir)
+            exclude_video_id: Sonuçtan hariç tutulacak video (ör. kendisi)
+
+        Returns:
+            (video_id, benzerlik, payload) veya eşik üstünde kayıt yoksa None
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    'SELECT video_id, payload FROM fingerprints'
+                    ' WHERE content_hash = ? AND language = ? AND video_id != ? LIMIT 1',
+                    (fingerprint.content_hash, language, exclude_video_id or '')
+                ).fetchone()
+                if row is not None:
+                    return row[0], 1.0, json.loads(row[1])
+
+                candidate_ids = set()
+                for band, bucket in _band_keys(fingerprint.minhash):
+                    candidate_ids.update(
+                        fingerprint_id for (fingerprint_id,) in conn.execute(
+                            'SELECT fingerprint_id FROM lsh_buckets WHERE band = ? AND bucket = ?', (band, bucket)
+                        )
+                    )
+
+                best = None
+                for fingerprint_id in candidate_ids:
+                    video_id, candidate_language, simhash, signature, payload = conn.execute(
+                        'SELECT video_id, language, simhash, minhash, payload FROM fingerprints WHERE id = ?',
+                        (fingerprint_id,)
+                    ).fetchone()
+                    if candidate_language != language or video_id == exclude_video_id:
+                        continue
+                    if bin((fingerprint.simhash ^ simhash) & _MAX_HASH).count('1') > SIMHASH_MAX_DISTANCE:
+                        continue
+                    minhash = array('Q')
+                    minhash.frombytes(signature)
+                    similarity = sum(1 for a, b in zip(fingerprint.minhash, minhash) if a == b) / MINHASH_BINS
+                    if similarity >= self.threshold and (best is None or similarity > best[1]):
+                        best = (video_id, similarity, payload)
+        except sqlite3.Error as e:
+            print(f"Parmak izi aranırken hata: {str(e)}", file=sys.stderr)
+            return None
+
+        if best is None:
+            return None
+        return best[0], best[1], json.loads(best[2])
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection().execute('SELECT COUNT(*) FROM fingerprints').fetchone()[0]
+
+
+_default_index = None
+
+
+def get_index() -> FingerprintIndex:
+    """Ortam değişkenlerinden yapılandırılan paylaşılan indeksi döndürür
+
+    VIDEOBITE_FINGERPRINT_PATH, VIDEOBITE_DEDUP_THRESHOLD ve VIDEOBITE_DEDUP_DISABLED
+    (1 ise kopya tespiti atlanır) okunur.
+    """
+    global _default_index
+    if _default_index is None:
+        _default_index = FingerprintIndex(
+            path=os.getenv('VIDEOBITE_FINGERPRINT_PATH', DEFAULT_INDEX_PATH),
+            threshold=float(os.getenv('VIDEOBITE_DEDUP_THRESHOLD', DEFAULT_THRESHOLD)),
+            enabled=os.getenv('VIDEOBITE_DEDUP_DISABLED', '') not in ('1', 'true'),
+        )
+    return _default_index
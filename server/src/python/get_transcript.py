@@ -4,24 +4,39 @@
 import sys
 import json
 from youtube_transcript_api import YouTubeTranscriptApi
+from cache import get_cache
+from data_pipeline import SegmentTimeIndex, TranscriptProcessor, format_transcript_for_openai
+from wire_format import CODECS, WireFormatError, write_frame
 
-def get_transcript(video_id, language='tr'):
+def load_transcript(video_id, language='tr'):
+    """Transkript segmentlerini önce paylaşılan önbellekten, yoksa YouTube'dan alır"""
+    cache = get_cache()
+    transcript_list = cache.get('transcript', video_id, language)
+    if transcript_list is None:
+        transcript_list = YouTubeTranscriptApi.get_transcript(video_id, languages=[language])
+        if transcript_list:
+            cache.set('transcript', video_id, transcript_list, language)
+    
+    if not transcript_list:
+        raise Exception("Belirtilen dilde transkript bulunamadı")
+    return transcript_list
+
+def get_transcript(video_id, language='tr', at=None, start=None, end=None):
     """
     YouTube videosu için transkripti al ve JSON formatında döndür
     
     Args:
         video_id (str): YouTube video ID
         language (str): Transkript dili (varsayılan: 'tr')
+        at (float): Verilirse bu anı kapsayan segment 'match' alanında döndürülür
+        start (float): Verilirse [start, end) aralığındaki segmentler 'match' alanında döndürülür
+        end (float): Aralık sonu (verilmezse transkriptin sonu)
     
     Returns:
         dict: Transkript bilgileri içeren sözlük
     """
     try:
-        # Transkript al
-        transcript_list = YouTubeTranscriptApi.get_transcript(video_id, languages=[language])
-        
-        if not transcript_list:
-            raise Exception("Belirtilen dilde transkript bulunamadı")
+        transcript_list = load_transcript(video_id, language)
         
         # Tam transkripti birleştir
         full_transcript = ' '.join([item['text'] for item in transcript_list])
@@ -36,11 +51,31 @@ def get_transcript(video_id, language='tr'):
             for item in transcript_list
         ]
         
-        return {
+        result = {
             'fullTranscript': full_transcript,
             'segments': segments
         }
         
+        # Zaman sorguları segment başlangıçları üzerinde ikili arama ile yanıtlanır
+        if at is not None or start is not None:
+            time_index = SegmentTimeIndex(
+                [item['start'] for item in transcript_list],
+                [item['duration'] for item in transcript_list]
+            )
+            if at is not None:
+                result['match'] = {'at': at, 'segment': time_index.segment_at(at)}
+            else:
+                end = end if end is not None else float('inf')
+                indices = time_index.segments_between(start, end)
+                result['match'] = {
+                    'from': start,
+                    'to': None if end == float('inf') else end,
+                    'segments': indices,
+                    'text': ' '.join(transcript_list[index]['text'] for index in indices)
+                }
+        
+        return result
+        
     except Exception as e:
         return {
             'error': str(e),
@@ -48,17 +83,65 @@ def get_transcript(video_id, language='tr'):
             'segments': []
         }
 
+def get_processed_transcript(video_id, language='tr'):
+    """
+    Transkripti işler ve format_transcript_for_openai biçiminde döndürür
+    (istatistikler, önemli terimler, tam metin ve paragraflar).
+    """
+    try:
+        processed = TranscriptProcessor().process(load_transcript(video_id, language))
+        return format_transcript_for_openai(processed)
+    except Exception as e:
+        return {
+            'error': str(e),
+            'full_text': '',
+            'paragraphs': []
+        }
+
 if __name__ == "__main__":
-    # Komut satırı argümanlarını al
-    if len(sys.argv) < 2:
-        sys.stderr.write("Kullanım: python get_transcript.py <video_id> [language]\n")
+    # Komut satırı argümanlarını al (--at, --from ve --to saniye değeri alır)
+    usage = ("Kullanım: python get_transcript.py <video_id> [language] [--no_cache] [--processed]"
+             " [--output_format json|binary] [--codec json|msgpack] [--at SN | --from SN [--to SN]]\n")
+    args = []
+    times = {}
+    options = {'--output_format': 'json', '--codec': 'json'}
+    argv = iter(sys.argv[1:])
+    for arg in argv:
+        if arg in ('--at', '--from', '--to'):
+            try:
+                times[arg] = float(next(argv))
+            except (StopIteration, ValueError):
+                sys.stderr.write(usage)
+                sys.exit(1)
+        elif arg in options:
+            options[arg] = next(argv, '')
+        elif arg not in ('--no_cache', '--processed'):
+            args.append(arg)
+    if len(args) < 1 or options['--output_format'] not in ('json', 'binary') or options['--codec'] not in CODECS:
+        sys.stderr.write(usage)
         sys.exit(1)
     
-    video_id = sys.argv[1]
-    language = sys.argv[2] if len(sys.argv) > 2 else 'tr'
+    if '--no_cache' in sys.argv:
+        get_cache().enabled = False
+    
+    video_id = args[0]
+    language = args[1] if len(args) > 1 else 'tr'
     
-    # Transkripti al
-    result = get_transcript(video_id, language)
+    # Transkripti al (--processed ile işlenmiş haliyle)
+    if '--processed' in sys.argv:
+        result = get_processed_transcript(video_id, language)
+        shared_text = result['full_text']
+    else:
+        result = get_transcript(video_id, language, times.get('--at'), times.get('--from'), times.get('--to'))
+        shared_text = result['fullTranscript']
     
-    # JSON formatında çıktı ver
-    print(json.dumps(result, ensure_ascii=False)) 
\ No newline at end of file
+    if options['--output_format'] == 'binary':
+        # Tam metin bir kez yazılır; paragraflar ve segment metinleri ona ofsetle işaret eder
+        try:
+            write_frame(sys.stdout.buffer, result, shared_text, options['--codec'])
+        except WireFormatError as e:
+            sys.stderr.write(f"{str(e)}\n")
+            sys.exit(1)
+    else:
+        # JSON formatında çıktı ver
+        print(json.dumps(result, ensure_ascii=False)) 
\ No newline at end of file
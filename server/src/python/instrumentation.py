@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite Ölçümleme Katmanı
+Özetleme pipeline'ının aşamaları için duvar saati ve CPU süresi, indirilen bayt,
+önbellek isabetleri ve yeniden deneme sayılarını toplar.
+
+Etkin bir Recorder yoksa stage() paylaşılan boş bir bağlam döndürür ve count()
+hiçbir şey yapmaz; ölçümleme kapalıyken maliyet tek bir ContextVar okumasıdır.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+_current: ContextVar[Optional["Recorder"]] = ContextVar('videobite_instrumentation', default=None)
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('recorder', 'name', 'wall', 'cpu')
+
+    def __init__(self, recorder: "Recorder", name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc):
+        self.recorder.add_stage(self.name, time.perf_counter() - self.wall, time.thread_time() - self.cpu)
+        return False
+
+
+class Recorder:
+    """Tek bir iş (video, kanal çalıştırması) için aşama süreleri ve sayaçlar"""
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def stage(self, name: str) -> _Stage:
+        return _Stage(self, name)
+
+    def add_stage(self, name: str, wall: float, cpu: float) -> None:
+        with self._lock:
+            entry = self.stages.get(name)
+            if entry is None:
+                entry = self.stages[name] = {"calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0}
+            entry["calls"] += 1
+            entry["wall_ms"] += wall * 1000
+            entry["cpu_ms"] += cpu * 1000
+
+    def count(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def merge(self, snapshot: Dict[str, Any]) -> None:
+        """Başka bir kayıtçının snapshot() çıktısını toplamlara ekler"""
+        with self._lock:
+            for name, entry in snapshot["stages"].items():
+                total = self.stages.setdefault(name, {"calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0})
+                total["calls"] += entry["calls"]
+                total["wall_ms"] += entry["wall_ms"]
+                total["cpu_ms"] += entry["cpu_ms"]
+            for name, value in snapshot["counters"].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON çıktısına eklenecek zamanlama bloğunu döndürür
+
+        Aşama süreleri kapsayıcıdır: iç içe aşamaların süresi dıştakine de dahildir.
+        """
+        with self._lock:
+            return {
+                "stages": {
+                    name: {
+                        "calls": entry["calls"],
+                        "wall_ms": round(entry["wall_ms"], 3),
+                        "cpu_ms": round(entry["cpu_ms"], 3),
+                    }
+                    for name, entry in self.stages.items()
+                },
+                "counters": dict(self.counters),
+            }
+
+
+def stage(name: str):
+    """Etkin kayıtçı varsa aşamayı ölçen, yoksa boş bir bağlam yöneticisi döndürür"""
+    recorder = _current.get()
+    if recorder is None:
+        return _NULL_STAGE
+    return recorder.stage(name)
+
+
+def count(name: str, value: float = 1) -> None:
+    """Etkin kayıtçı varsa sayacı artırır"""
+    recorder = _current.get()
+    if recorder is not None:
+        recorder.count(name, value)
+
+
+def enabled() -> bool:
+    return _current.get() is not None
+
+
+@contextmanager
+def recording(recorder: Optional[Recorder]):
+    """Blok boyunca verilen kayıtçıyı etkin yapar (None ölçümlemeyi kapatır)"""
+    token = _current.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current.reset(token)
+
+
+def propagate(function: Callable) -> Callable:
+    """Fonksiyonu, çağıran bağlamdaki kayıtçıyla birlikte başka bir thread'de çalışacak şekilde sarar"""
+    recorder = _current.get()
+    if recorder is None:
+        return function
+
+    def wrapper(*args, **kwargs):
+        with recording(recorder):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+class MetricsSink:
+    """Ölçümleri Node sunucusunun okuyabileceği bir dosyaya yazar
+
+    'jsonl' biçiminde her iş bir satır olarak eklenir. 'prom' biçiminde süreç boyunca
+    birikmiş toplamlar Prometheus metin biçiminde dosyaya atomik olarak yeniden yazılır.
+    """
+
+    def __init__(self, path: str, fmt: str = 'jsonl'):
+        if fmt not in ('jsonl', 'prom'):
+            raise ValueError(f"Desteklenmeyen metrik biçimi: {fmt}")
+        self.path = path
+        self.format = fmt
+        self._totals = Recorder()
+        self._lock = threading.Lock()
+
+    def record(self, snapshot: Dict[str, Any], **labels: Any) -> None:
+        """Tek bir işin zamanlama bloğunu kaydeder
+
+        Args:
+            snapshot: Recorder.snapshot() çıktısı
+            labels: JSON-lines kaydına eklenecek alanlar (ör. video_id)
+        """
+        with self._lock:
+            if self.format == 'jsonl':
+                record = {"ts": time.time(), **labels, **snapshot}
+                with open(self.path, 'a', encoding='utf-8') as metrics_file:
+                    metrics_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                return
+
+            self._totals.merge(snapshot)
+            self._totals.count('jobs')
+            self._write_prometheus()
+
+    def _write_prometheus(self) -> None:
+        stages = sorted(self._totals.stages.items())
+        lines = ["# TYPE videobite_stage_calls_total counter"]
+        for name, entry in stages:
+            lines.append(f'videobite_stage_calls_total{{stage="{name}"}} {entry["calls"]}')
+        lines.append("# TYPE videobite_stage_seconds_total counter")
+        for name, entry in stages:
+            lines.append(f'videobite_stage_seconds_total{{stage="{name}",clock="wall"}} {entry["wall_ms"] / 1000:.6f}')
+            lines.append(f'videobite_stage_seconds_total{{stage="{name}",clock="cpu"}} {entry["cpu_ms"] / 1000:.6f}')
+        lines.append("# TYPE videobite_events_total counter")
+        for name, value in sorted(self._totals.counters.items()):
+            lines.append(f'videobite_events_total{{name="{name}"}} {value}')
+
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as metrics_file:
+            metrics_file.write("\n".join(lines) + "\n")
+        os.replace(temporary_path, self.path)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite Dil Tanıma
+Karakter n-gram (1-3) profilleriyle naive Bayes dil tanıma. Profiller paketle gelen
+language_profiles.json dosyasından yüklenir ve language_samples/ altındaki örnek
+metinlerden bu modül komut satırından yeniden üretilebilir:
+
+    python language_id.py --build language_samples --output language_profiles.json
+
+Uzun metinlerin tamamı taranmaz: metin SAMPLE_CHARS karakterden uzunsa, metne eşit
+aralıklarla yayılmış SAMPLE_WINDOWS pencere örneklenir. Böylece maliyet metin
+uzunluğundan bağımsızdır ve konuşmanın ortasında dil değişse bile örnekte temsil edilir.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+PROFILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'language_profiles.json')
+
+# Harf dizileri; rakamlar ve alt çizgi n-gramlara katılmaz
+WORD_PATTERN = re.compile(r'[^\W\d_]+')
+
+MAX_NGRAM = 3
+
+# Profil başına saklanan en sık n-gram sayısı
+PROFILE_SIZE = 500
+
+# Örnekleme: bu uzunluğa kadar metnin tamamı, daha uzunsa eşit aralıklı pencereler
+SAMPLE_CHARS = 1024
+SAMPLE_WINDOWS = 8
+
+# Toplam log-olabilirlik farkları n-gramların bağımsızlık varsayımı yüzünden aşırı keskindir;
+# güven skoru softmax(skor * CALIBRATION) ile yumuşatılır (benchmarks/bench_language_id.py)
+CALIBRATION = 0.3
+
+# Metinde hiç harf yoksa döndürülen dil (eski sezgiyle uyumlu)
+DEFAULT_LANGUAGE = 'en'
+
+
+@dataclass
+class LanguageGuess:
+    """Dil tahmini ve 0-1 arası güven skoru"""
+    language: str
+    confidence: float
+
+
+def extract_ngrams(text: str) -> List[str]:
+    """Kelimeleri boşlukla çevreleyip 1-3 karakterlik n-gramlarını döndürür"""
+    ngrams = []
+    for word in WORD_PATTERN.findall(text.lower()):
+        padded = f" {word} "
+        length = len(padded)
+        for size in range(1, MAX_NGRAM + 1):
+            ngrams.extend(padded[i:i + size] for i in range(length - size + 1))
+    return ngrams
+
+
+def sample_text(text: str, sample_chars: int = SAMPLE_CHARS, windows: int = SAMPLE_WINDOWS) -> str:
+    """Metnin sınırlı bir örneğini döndürür
+
+    Args:
+        text: Kaynak metin
+        sample_chars: Örneğin toplam uzunluk sınırı
+        windows: Uzun metinlerde örneklenecek eşit aralıklı pencere sayısı
+
+    Returns:
+        Metnin kendisi veya pencerelerin boşlukla birleşimi
+    """
+    if len(text) <= sample_chars:
+        return text
+    width = sample_chars // windows
+    stride = (len(text) - width) // max(1, windows - 1)
+    # Pencere kenarlarındaki yarım kelimeler yanlış n-gram üretmesin diye atılır
+    return " ".join(
+        text[offset:offset + width].split(' ', 1)[-1].rsplit(' ', 1)[0]
+        for offset in range(0, stride * windows, stride)
+    )
+
+
+def build_profiles(texts: Dict[str, str], profile_size: int = PROFILE_SIZE) -> Dict[str, dict]:
+    """Dil başına örnek metinlerden n-gram log-olasılık profilleri üretir
+
+    Args:
+        texts: Dil kodu -> örnek metin
+        profile_size: Profil başına saklanacak en sık n-gram sayısı
+
+    Returns:
+        Dil kodu -> {"unseen": log-olasılık, "ngrams": {n-gram: log-olasılık}}
+    """
+    profiles = {}
+    for language, text in sorted(texts.items()):
+        counts = Counter(extract_ngrams(text))
+        total = sum(counts.values())
+        # Laplace yumuşatma; profilde olmayan n-gramlar "unseen" olasılığını alır
+        denominator = total + len(counts) + 1
+        profiles[language] = {
+            "unseen": round(math.log(1 / denominator), 3),
+            "ngrams": {
+                ngram: round(math.log((count + 1) / denominator), 3)
+                for ngram, count in counts.most_common(profile_size)
+            },
+        }
+    return profiles
+
+
+class LanguageIdentifier:
+    """Karakter n-gram profilleriyle dil tanıyıcı"""
+
+    def __init__(self, profiles: Dict[str, dict], calibration: float = CALIBRATION):
+        """
+        Args:
+            profiles: build_profiles çıktısı
+            calibration: Güven skorundaki softmax ölçeği
+        """
+        self.languages = sorted(profiles)
+        self.calibration = calibration
+        # n-gram -> dil sırasıyla log-olasılıklar; herhangi bir profilde geçmeyen n-gramlar ayırt edici değildir
+        unseen = [profiles[language]["unseen"] for language in self.languages]
+        self._table: Dict[str, tuple] = {}
+        for position, language in enumerate(self.languages):
+            for ngram, log_probability in profiles[language]["ngrams"].items():
+                row = self._table.get(ngram)
+                if row is None:
+                    row = list(unseen)
+                    self._table[ngram] = row
+                row[position] = log_probability
+        self._table = {ngram: tuple(row) for ngram, row in self._table.items()}
+
+    @classmethod
+    def load(cls, path: str = PROFILE_PATH) -> "LanguageIdentifier":
+        """Profilleri JSON dosyasından yükler"""
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """Örneklenmiş metnin dil başına toplam log-olabilirliğini döndürür"""
+        table = self._table
+        rows = [table[ngram] for ngram in extract_ngrams(sample_text(text)) if ngram in table]
+        if not rows:
+            return {}
+        return dict(zip(self.languages, map(sum, zip(*rows))))
+
+    def identify(self, text: str) -> LanguageGuess:
+        """Metnin dilini ve güven skorunu döndürür
+
+        Args:
+            text: Dili tespit edilecek metin (uzunsa yalnızca örneklenir)
+
+        Returns:
+            En olası dil ve softmax güven skoru (metinde harf yoksa DEFAULT_LANGUAGE, 0.0)
+        """
+        scores = self.scores(text)
+        if not scores:
+            return LanguageGuess(DEFAULT_LANGUAGE, 0.0)
+        best = max(scores, key=scores.get)
+        best_score = scores[best]
+        normalizer = sum(math.exp((score - best_score) * self.calibration) for score in scores.values())
+        return LanguageGuess(best, round(1 / normalizer, 4))
+
+
+_default_identifier: Optional[LanguageIdentifier] = None
+
+
+def get_identifier() -> LanguageIdentifier:
+    """Paketle gelen profillerle paylaşılan tanıyıcıyı döndürür"""
+    global _default_identifier
+    if _default_identifier is None:
+        _default_identifier = LanguageIdentifier.load()
+    return _default_identifier
+
+
+def identify_language(text: str) -> LanguageGuess:
+    """Paylaşılan tanıyıcıyla metnin dilini tahmin eder"""
+    return get_identifier().identify(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Karakter n-gram dil tanıma')
+    parser.add_argument('--build', type=str, default='', help='<dil>.txt örnek metinlerini içeren dizin')
+    parser.add_argument('--output', type=str, default=PROFILE_PATH, help='Yazılacak profil dosyası')
+    parser.add_argument('text', nargs='?', default=None, help='Dili tespit edilecek metin (varsayılan: stdin)')
+    args = parser.parse_args()
+
+    if args.build:
+        texts = {}
+        for name in sorted(os.listdir(args.build)):
+            if name.endswith('.txt'):
+                with open(os.path.join(args.build, name), encoding='utf-8') as f:
+                    texts[name[:-4]] = f.read()
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(build_profiles(texts), f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+        print(f"{len(texts)} dil profili yazıldı: {args.output}")
+        return
+
+    guess = identify_language(args.text if args.text is not None else sys.stdin.read())
+    print(json.dumps({"language": guess.language, "confidence": guess.confidence}))
+
+
+if __name__ == "__main__":
+    main()
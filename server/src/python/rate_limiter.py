@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite Hız Sınırlayıcı
+YouTube API çağrılarını sabit beklemeler yerine token bucket ile sınırlar.
+"""
+
+import threading
+import time
+
+import instrumentation
+
+
+class TokenBucket:
+    """Thread-safe token bucket hız sınırlayıcı"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: Saniyede eklenen token sayısı (<= 0 ise sınırlama yapılmaz)
+            capacity: Kovada birikebilecek maksimum token (ani yük kapasitesi)
+        """
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Yeterli token birikene kadar bekler ve token'ları tüketir
+
+        Args:
+            tokens: Tüketilecek token sayısı
+        """
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            instrumentation.count('rate_limit_wait_ms', wait * 1000)
+            time.sleep(wait)
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite Özet Sonuç Deposu
+generate_summary çıktısını ve onu üreten türetilmiş yapıları (ProcessedTranscript,
+özet/anahtar nokta seçimi, TF-IDF terimleri) video başına SQLite'ta saklar. Aynı
+videonun yeniden istenmesinde veya yeniden görüntülenmesinde transkript işleme,
+özetleme ve terim sıralama adımları tekrarlanmaz.
+
+Kayıtlar (video_id, varyant, pipeline sürümü) anahtarlıdır. Pipeline sürümü, çıktıyı
+etkileyen modüllerin kaynak kodundan ve dil profillerinden hesaplanan bir özettir;
+kod değiştiğinde eski sürümün kayıtları bağlantı açılırken silinir.
+
+Her kayıtta iki sütun vardır: listeleme için küçük JSON sonuç (result) ve zlib ile
+sıkıştırılmış türetilmiş yapılar (artifacts). Cümleler ve paragraflar metnin kopyası
+yerine tam metin içindeki (başlangıç, bitiş) ofsetleri olarak saklanır. Toplu okuma
+(get_many) yalnızca sonuç sütununu tek sorguyla okur.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from data_pipeline import ProcessedTranscript, SegmentStore
+from term_extractor import RankedTerm
+
+PYTHON_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Sürüm özetine katılan, özet çıktısını etkileyen dosyalar
+PIPELINE_FILES = (
+    'data_pipeline.py',
+    'summarizer.py',
+    'chunked_summarizer.py',
+    'fingerprint.py',
+    'term_extractor.py',
+    'language_id.py',
+    'language_profiles.json',
+    'video_summary.py',
+)
+
+# Serileştirme biçimi değişirse artırılır; sürüm özetine katılır
+FORMAT_VERSION = 1
+
+# SQLite'ın tek sorguda kabul ettiği parametre sınırının altında kalan grup boyutu
+_QUERY_BATCH = 500
+
+DEFAULT_RESULTS_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'videobite', 'results.sqlite3')
+
+
+def pipeline_version(files: Iterable[str] = PIPELINE_FILES, directory: str = PYTHON_DIR) -> str:
+    """Pipeline dosyalarının içeriğinden kısa bir sürüm özeti üretir"""
+    digest = hashlib.sha256(f"format:{FORMAT_VERSION}".encode('utf-8'))
+    for name in files:
+        digest.update(b'\0' + name.encode('utf-8') + b'\0')
+        try:
+            with open(os.path.join(directory, name), 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b'missing')
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class SummaryRecord:
+    """Bir videonun saklanan özet sonucu ve türetilmiş yapıları"""
+    video_id: str
+    variant: str
+    result: Dict[str, Any]
+    transcript_text: str
+    processed: Optional[ProcessedTranscript]
+    transcript_summary: Optional[Dict[str, Any]]
+    ranked_terms: List[RankedTerm]
+    updated_at: float
+
+
+def _spans(texts: List[str], source: str) -> Optional[List[int]]:
+    """Metinleri kaynak içinde sırayla bulur ve düz [başlangıç, bitiş, ...] listesi döndürür
+
+    Herhangi biri bulunamazsa None döner; o zaman metinler olduğu gibi saklanır.
+    """
+    spans = []
+    cursor = 0
+    for text in texts:
+        position = source.find(text, cursor)
+        if position < 0:
+            return None
+        cursor = position + len(text)
+        spans += (position, cursor)
+    return spans
+
+
+def _encode_texts(texts: List[str], source: str) -> Dict[str, Any]:
+    spans = _spans(texts, source)
+    return {"spans": spans} if spans is not None else {"texts": texts}
+
+
+def _decode_texts(encoded: Dict[str, Any], source: str) -> List[str]:
+    if "texts" in encoded:
+        return encoded["texts"]
+    spans = encoded["spans"]
+    return [source[spans[i]:spans[i + 1]] for i in range(0, len(spans), 2)]
+
+
+def _encode_array(values: array) -> str:
+    return base64.b64encode(values.tobytes()).decode('ascii')
+
+
+def _decode_array(typecode: str, data: str) -> array:
+    values = array(typecode)
+    values.frombytes(base64.b64decode(data))
+    return values
+
+
+def encode_processed(processed: ProcessedTranscript) -> Dict[str, Any]:
+    """ProcessedTranscript'i JSON'a çevrilebilir, metin tekrarı içermeyen sözlüğe dönüştürür"""
+    segments = processed.segments
+    buffer = segments.buffer
+    return {
+        "full_text": processed.full_text,
+        # Segment tamponu çoğunlukla tam metnin kendisidir; yalnızca farklıysa ayrıca yazılır
+        "segment_text": None if buffer == processed.full_text else buffer,
+        "segment_offsets": _encode_array(segments._offsets),
+        "segment_starts": _encode_array(segments.starts),
+        "segment_durations": _encode_array(segments.durations),
+        "sentences": _encode_texts(processed.sentences, processed.full_text),
+        "paragraphs": _encode_texts(processed.paragraphs, buffer),
+        "language": processed.language,
+        "language_confidence": processed.language_confidence,
+        "word_count": processed.word_count,
+        "duration": processed.duration,
+        "important_terms": processed.important_terms,
+    }
+
+
+def decode_processed(data: Dict[str, Any]) -> ProcessedTranscript:
+    """encode_processed çıktısından ProcessedTranscript'i yeniden kurar"""
+    full_text = data["full_text"]
+    buffer = data["segment_text"] if data["segment_text"] is not None else full_text
+    segments = SegmentStore()
+    segments._offsets = _decode_array('q', data["segment_offsets"])
+    segments.starts = _decode_array('d', data["segment_starts"])
+    segments.durations = _decode_array('d', data["segment_durations"])
+    segments.freeze(buffer)
+    return ProcessedTranscript(
+        full_text=full_text,
+        segments=segments,
+        sentences=_decode_texts(data["sentences"], full_text),
+        language=data["language"],
+        language_confidence=data["language_confidence"],
+        word_count=data["word_count"],
+        duration=data["duration"],
+        important_terms=[tuple(term) for term in data["important_terms"]],
+        paragraphs=_decode_texts(data["paragraphs"], buffer),
+    )
+
+
+class ResultStore:
+    """Özet sonuçlarını ve türetilmiş yapıları SQLite'ta saklayan depo"""
+
+    def __init__(self, path: str = DEFAULT_RESULTS_PATH, version: Optional[str] = None, enabled: bool = True):
+        """
+        Args:
+            path: SQLite dosya yolu
+            version: Pipeline sürümü (varsayılan: pipeline_version())
+            enabled: False ise depo ne okunur ne yazılır
+        """
+        self.path = path
+        self.version = version or pipeline_version()
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                ' video_id TEXT NOT NULL,'
+                ' variant TEXT NOT NULL,'
+                ' pipeline_version TEXT NOT NULL,'
+                ' result TEXT NOT NULL,'
+                ' artifacts BLOB NOT NULL,'
+                ' updated_at REAL NOT NULL,'
+                ' PRIMARY KEY (video_id, variant, pipeline_version)) WITHOUT ROWID'
+            )
+            # Pipeline değiştiyse eski sürümün kayıtları geçersizdir
+            conn.execute('DELETE FROM results WHERE pipeline_version != ?', (self.version,))
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def put(self, video_id: str, variant: str, result: Dict[str, Any], transcript_text: str = '',
+            processed: Optional[ProcessedTranscript] = None, transcript_summary: Optional[Dict[str, Any]] = None,
+            ranked_terms: Optional[List[RankedTerm]] = None) -> None:
+        """Videonun sonucunu ve türetilmiş yapılarını yazar (varsa üzerine)
+
+        Args:
+            video_id: YouTube video ID'si
+            variant: Dil ve özet arka ucu (ör. 'tr' veya 'tr:openai')
+            result: Listelemede döndürülecek sonuç (generate_summary çıktısı, başlık ve kanal)
+            transcript_text: Ham transkript metni
+            processed: İşlenmiş transkript
+            transcript_summary: summarize_transcript çıktısı
+            ranked_terms: TF-IDF ile sıralanmış terimler
+        """
+        if not self.enabled:
+            return
+
+        artifacts = {
+            "transcript_text": transcript_text,
+            "processed": encode_processed(processed) if processed is not None else None,
+            "transcript_summary": transcript_summary,
+            "ranked_terms": [[term.term, term.score, term.count] for term in ranked_terms or []],
+        }
+        blob = zlib.compress(json.dumps(artifacts, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)',
+                    (video_id, variant, self.version, json.dumps(result, ensure_ascii=False), blob, time.time())
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Sonuç deposuna yazılırken hata: {str(e)}", file=sys.stderr)
+
+    def update_result(self, video_id: str, variant: str, result: Dict[str, Any]) -> None:
+        """Türetilmiş yapılara dokunmadan yalnızca sonuç sütununu günceller"""
+        if not self.enabled:
+            return
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    'UPDATE results SET result = ?, updated_at = ?'
+                    ' WHERE video_id = ? AND variant = ? AND pipeline_version = ?',
+                    (json.dumps(result, ensure_ascii=False), time.time(), video_id, variant, self.version)
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Sonuç deposuna yazılırken hata: {str(e)}", file=sys.stderr)
+
+    def get(self, video_id: str, variant: str) -> Optional[SummaryRecord]:
+        """Videonun sonucunu türetilmiş yapılarıyla birlikte döndürür; yoksa None"""
+        if not self.enabled:
+            return None
+
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    'SELECT result, artifacts, updated_at FROM results'
+                    ' WHERE video_id = ? AND variant = ? AND pipeline_version = ?',
+                    (video_id, variant, self.version)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Sonuç deposu okunurken hata: {str(e)}", file=sys.stderr)
+            return None
+        if row is None:
+            return None
+
+        result, blob, updated_at = row
+        artifacts = json.loads(zlib.decompress(blob))
+        return SummaryRecord(
+            video_id=video_id,
+            variant=variant,
+            result=json.loads(result),
+            transcript_text=artifacts["transcript_text"],
+            processed=decode_processed(artifacts["processed"]) if artifacts["processed"] else None,
+            transcript_summary=artifacts["transcript_summary"],
+            ranked_terms=[RankedTerm(term, score, count) for term, score, count in artifacts["ranked_terms"]],
+            updated_at=updated_at,
+        )
+
+    def get_many(self, video_ids: List[str], variant: str) -> Dict[str, Dict[str, Any]]:
+        """Birden çok videonun sonuçlarını döndürür (türetilmiş yapılar okunmaz)
+
+        Args:
+            video_ids: YouTube video ID'leri
+            variant: Dil ve özet arka ucu
+
+        Returns:
+            Depoda bulunan video ID'si -> put ile yazılan sonuç
+        """
+        if not self.enabled or not video_ids:
+            return {}
+
+        results = {}
+        try:
+            with self._lock:
+                conn = self._connection()
+                for offset in range(0, len(video_ids), _QUERY_BATCH):
+                    batch = video_ids[offset:offset + _QUERY_BATCH]
+                    placeholders = ','.join('?' * len(batch))
+                    for video_id, result in conn.execute(
+                        f'SELECT video_id, result FROM results WHERE variant = ? AND pipeline_version = ?'
+                        f' AND video_id IN ({placeholders})',
+                        [variant, self.version, *batch]
+                    ):
+                        results[video_id] = json.loads(result)
+        except sqlite3.Error as e:
+            print(f"Sonuç deposu okunurken hata: {str(e)}", file=sys.stderr)
+        return results
+
+    def clear(self) -> None:
+        """Tüm kayıtları siler"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute('DELETE FROM results')
+            conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Kayıt sayısını ve disk kullanımını döndürür"""
+        result = {"enabled": self.enabled, "pipeline_version": self.version, "entries": 0, "bytes": 0}
+        if self.enabled:
+            with self._lock:
+                entries, size = self._connection().execute(
+                    'SELECT COUNT(*), COALESCE(SUM(LENGTH(result) + LENGTH(artifacts)), 0) FROM results'
+                ).fetchone()
+            result.update(entries=entries, bytes=size)
+        return result
+
+
+_default_store = None
+
+
+def get_result_store() -> ResultStore:
+    """VIDEOBITE_RESULTS_PATH ve VIDEOBITE_RESULTS_DISABLED ile yapılandırılan paylaşılan depoyu döndürür"""
+    global _default_store
+    if _default_store is None:
+        _default_store = ResultStore(
+            path=os.getenv('VIDEOBITE_RESULTS_PATH', DEFAULT_RESULTS_PATH),
+            enabled=os.getenv('VIDEOBITE_RESULTS_DISABLED', '') not in ('1', 'true'),
+        )
+    return _default_store
+
+
+if __name__ == "__main__":
+    # Kullanım: python result_store.py [stats|clear]
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    store = get_result_store()
+    if command == 'clear':
+        store.clear()
+    print(json.dumps(store.stats(), ensure_ascii=False))
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite İş Zamanlayıcısı
+Worker modunda etkileşimli işleri (tek video, arama, depodan okuma) toplu işlerin
+(kanal çalıştırmaları) önüne alan öncelikli kuyruk.
+
+- Her sınıfın kendi kuyruğu vardır; boş bir thread önce etkileşimli kuyruğa bakar.
+- Sınıf içinde adalet: işler anahtara (etkileşimlide kullanıcı, toplu işte kanal)
+  göre ayrı kuyruklarda tutulur ve anahtarlar arasında sırayla (round-robin) seçilir;
+  tek bir kullanıcının veya kanalın yüzlerce işi diğerlerini bekletmez.
+- Toplu işler en fazla `batch_slots` thread kullanır; kalan thread'ler (en az bir tane)
+  kanal çalıştırmaları dakikalarca sürse bile etkileşimli işlere ayrılmış kalır. Bu
+  nedenle zamanlayıcı en az 2 thread ile çalışır; sıralı çalışma için zamanlayıcı
+  kullanılmaz.
+- Kabul denetimi (CoDel benzeri): son `interval` saniyede başlatılan etkileşimli işlerin
+  en kısa kuyruk beklemesi bile `latency_target`'ı aşıyorsa sistem aşırı yüklü sayılır
+  ve yeni toplu işler başlatılmaz (ertelenir). Toplu kuyruk `max_batch_queue`
+  sınırındayken gelen toplu işler reddedilir (SchedulerOverloaded).
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Hashable, Optional
+
+INTERACTIVE = 'interactive'
+BATCH = 'batch'
+PRIORITIES = (INTERACTIVE, BATCH)
+
+# Bekleme süresi yüzdelikleri için sınıf başına tutulan son ölçüm sayısı
+WAIT_WINDOW = 1024
+
+
+class SchedulerOverloaded(Exception):
+    """Toplu iş kuyruğu dolu olduğunda iş reddedilirken fırlatılır"""
+
+
+class _Job:
+    __slots__ = ('function', 'priority', 'key', 'submitted', 'deferred')
+
+    def __init__(self, function: Callable[[], None], priority: str, key: Hashable):
+        self.function = function
+        self.priority = priority
+        self.key = key
+        self.submitted = time.monotonic()
+        self.deferred = False
+
+
+class _FairQueue:
+    """Anahtar başına FIFO kuyruklar; anahtarlar arasında round-robin"""
+
+    def __init__(self):
+        self._queues: "OrderedDict[Hashable, Deque[_Job]]" = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, job: _Job) -> None:
+        queue = self._queues.get(job.key)
+        if queue is None:
+            queue = self._queues[job.key] = deque()
+        queue.append(job)
+        self._size += 1
+
+    def peek(self) -> Optional[_Job]:
+        """Sıradaki anahtarın en eski işi"""
+        for queue in self._queues.values():
+            return queue[0]
+        return None
+
+    def pop(self) -> _Job:
+        key, queue = next(iter(self._queues.items()))
+        job = queue.popleft()
+        # Anahtar işi kaldıysa sıranın sonuna geçer
+        if queue:
+            self._queues.move_to_end(key)
+        else:
+            del self._queues[key]
+        self._size -= 1
+        return job
+
+    def oldest_wait(self, now: float) -> float:
+        if not self._size:
+            return 0.0
+        return now - min(queue[0].submitted for queue in self._queues.values())
+
+    def depth_by_key(self, limit: int = 10) -> Dict[str, int]:
+        largest = sorted(self._queues.items(), key=lambda item: -len(item[1]))[:limit]
+        return {str(key): len(queue) for key, queue in largest}
+
+
+class _ClassStats:
+    __slots__ = ('running', 'started', 'completed', 'failed', 'deferred', 'shed', 'waits')
+
+    def __init__(self):
+        self.running = 0
+        self.started = 0
+        self.completed = 0
+        self.failed = 0
+        self.deferred = 0
+        self.shed = 0
+        self.waits: Deque[float] = deque(maxlen=WAIT_WINDOW)
+
+
+def _percentile(ordered, fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class JobScheduler:
+    """Etkileşimli ve toplu işler için adil, öncelikli ve kabul denetimli thread havuzu"""
+
+    def __init__(self, workers: int = 8, batch_slots: Optional[int] = None, latency_target: float = 2.0,
+                 interval: float = 5.0, max_batch_queue: int = 32):
+        """
+        Args:
+            workers: İşleri çalıştıran thread sayısı (en az 2)
+            batch_slots: Aynı anda çalışabilecek en fazla toplu iş (varsayılan: workers'ın yarısı);
+                1 ile workers - 1 arasına sınırlanır
+            latency_target: Etkileşimli işlerin hedef kuyruk beklemesi (saniye)
+            interval: Aşırı yükün değerlendirildiği pencere (saniye)
+            max_batch_queue: Kuyrukta bekleyebilecek en fazla toplu iş; aşılırsa yeni toplu iş reddedilir
+        """
+        self.workers = max(2, workers)
+        # En az bir thread her zaman etkileşimli işlere kalır
+        requested = batch_slots if batch_slots is not None else self.workers // 2
+        self.batch_slots = min(max(1, requested), self.workers - 1)
+        self.latency_target = latency_target
+        self.interval = interval
+        self.max_batch_queue = max_batch_queue
+        self._queues = {priority: _FairQueue() for priority in PRIORITIES}
+        self._stats = {priority: _ClassStats() for priority in PRIORITIES}
+        # Başlatılan etkileşimli işlerin (başlama zamanı, bekleme) kayıtları; aşırı yük tespiti için
+        self._recent: Deque = deque()
+        self._condition = threading.Condition()
+        self._threads = []
+        self._stopping = False
+
+    def start(self) -> "JobScheduler":
+        with self._condition:
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._run, name=f"videobite-job-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        return self
+
+    def submit(self, function: Callable[[], None], priority: str = INTERACTIVE, key: Hashable = '') -> None:
+        """İşi kuyruğa ekler
+
+        Args:
+            function: Çalıştırılacak iş (sonucu kendisi iletir; dönüş değeri kullanılmaz)
+            priority: INTERACTIVE veya BATCH
+            key: Adalet anahtarı (kullanıcı veya kanal)
+
+        Raises:
+            SchedulerOverloaded: Toplu kuyruk doluysa
+        """
+        if priority not in self._queues:
+            raise ValueError(f"Bilinmeyen öncelik: {priority}")
+        if not self._threads:
+            self.start()
+
+        with self._condition:
+            queue = self._queues[priority]
+            if priority == BATCH and len(queue) >= self.max_batch_queue:
+                self._stats[BATCH].shed += 1
+                raise SchedulerOverloaded(
+                    f"Toplu iş kuyruğu dolu ({len(queue)} iş); daha sonra yeniden deneyin"
+                )
+            queue.push(_Job(function, priority, key))
+            self._condition.notify()
+
+    def _trim_recent(self, now: float) -> Deque:
+        recent = self._recent
+        while recent and now - recent[0][0] > self.interval:
+            recent.popleft()
+        return recent
+
+    def _overloaded(self, now: float) -> bool:
+        """Son pencerede başlayan tüm etkileşimli işler hedeften uzun beklediyse True"""
+        recent = self._trim_recent(now)
+        # Henüz başlatılamamış ama hedefi aşmış bir etkileşimli iş de yükü gösterir
+        if self._queues[INTERACTIVE].oldest_wait(now) > self.latency_target:
+            return True
+        return bool(recent) and min(wait for _, wait in recent) > self.latency_target
+
+    def _next_job(self, now: float) -> Optional[_Job]:
+        if len(self._queues[INTERACTIVE]):
+            return self._queues[INTERACTIVE].pop()
+
+        batch = self._queues[BATCH]
+        if not len(batch) or self._stats[BATCH].running >= self.batch_slots:
+            return None
+        if self._overloaded(now):
+            job = batch.peek()
+            if not job.deferred:
+                job.deferred = True
+                self._stats[BATCH].deferred += 1
+            return None
+        return batch.pop()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if self._stopping:
+                        return
+                    now = time.monotonic()
+                    job = self._next_job(now)
+                    if job is not None:
+                        break
+                    # Ertelenen toplu işler için yük azalınca yeniden bakılır
+                    self._condition.wait(self.interval / 4 if len(self._queues[BATCH]) else None)
+                wait = now - job.submitted
+                stats = self._stats[job.priority]
+                stats.running += 1
+                stats.started += 1
+                stats.waits.append(wait)
+                if job.priority == INTERACTIVE:
+                    self._trim_recent(now).append((now, wait))
+
+            failed = False
+            try:
+                job.function()
+            except Exception:
+                failed = True
+            finally:
+                with self._condition:
+                    stats.running -= 1
+                    stats.completed += 1
+                    stats.failed += failed
+                    # Toplu slot boşaldı; bekleyen bir toplu iş başlayabilir
+                    self._condition.notify()
+
+    def shutdown(self) -> None:
+        """Thread'leri durdurur; kuyrukta kalan işler çalıştırılmaz"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def stats(self) -> Dict[str, object]:
+        """Kuyruk derinlikleri, çalışan işler ve bekleme süresi yüzdelikleri"""
+        with self._condition:
+            now = time.monotonic()
+            result = {
+                "workers": self.workers,
+                "batch_slots": self.batch_slots,
+                "latency_target_ms": round(self.latency_target * 1000, 1),
+                "overloaded": self._overloaded(now),
+            }
+            for priority in PRIORITIES:
+                queue = self._queues[priority]
+                stats = self._stats[priority]
+                ordered = sorted(stats.waits)
+                result[priority] = {
+                    "queued": len(queue),
+                    "running": stats.running,
+                    "started": stats.started,
+                    "completed": stats.completed,
+                    "failed": stats.failed,
+                    "deferred": stats.deferred,
+                    "shed": stats.shed,
+                    "oldest_wait_ms": round(queue.oldest_wait(now) * 1000, 1),
+                    "wait_ms": {
+                        "p50": round(_percentile(ordered, 0.5) * 1000, 1),
+                        "p90": round(_percentile(ordered, 0.9) * 1000, 1),
+                        "p99": round(_percentile(ordered, 0.99) * 1000, 1),
+                        "max": round(ordered[-1] * 1000, 1) if ordered else 0.0,
+                    },
+                    "queued_by_key": queue.depth_by_key(),
+                }
+            return result
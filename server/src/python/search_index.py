@@ -0,0 +1,743 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite Transkript Arama İndeksi
+İşlenmiş transkriptler üzerinde çevrimdışı tam metin arama: "X'ten hangi videolarda,
+hangi saniyede bahsediliyor?" sorusu transkriptleri yeniden çekip taramadan yanıtlanır.
+Kelimeler data_pipeline.TERM_PATTERN ile ayrılır ve dur kelimeleri (get_stop_words) atılır;
+sonuçlar BM25 ile sıralanır ve eşleşen segmentlerin başlangıç zamanlarıyla döndürülür.
+
+İndeks, değişmez "parça" dosyalarından ve bunları listeleyen bir SQLite kataloğundan
+oluşur. Eklenen videolar bellekte biriktirilir ve flush ile yeni bir parçaya yazılır;
+son parça bir öncekinden büyük değilse ikisi birleştirilir, böylece parça sayısı video
+sayısının logaritmasıyla sınırlı kalır. Parça dosyaları mmap ile açılır; sayısal
+sütunlar memoryview ile kopyalanmadan okunur ve terim sözlüğünde ikili arama yapılır.
+
+Bir terimin posting listesi, belge başına delta/varint kodlu (belge farkı, terim
+sıklığı, segment verisinin bayt uzunluğu) üçlüsü ve ardından (segment farkı, sayı)
+çiftlerinden oluşur. BM25 puanı yalnızca ilk üçlüler okunarak hesaplanır; segment
+verisi sadece sonuca giren videolar için çözülür. Parçalar birleştirilirken her terimin
+listesi yeniden kodlanmaz, yalnızca ikinci parçanın ilk belge farkı düzeltilir.
+
+Parça dosyası düzeni: başlık (HEADER), ardından SECTIONS sırasıyla 8 bayta hizalı
+bölümler. Sayısal sütunlar yerel bayt sırasıyla yazılır.
+"""
+
+import argparse
+import heapq
+import json
+import math
+import mmap
+import os
+import sqlite3
+import struct
+import sys
+import threading
+import uuid
+from array import array
+from functools import cached_property
+from collections import Counter
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+from data_pipeline import ProcessedTranscript, TERM_PATTERN, get_stop_words
+
+MAGIC = b'VBSIDX01'
+
+# Bölüm adı -> memoryview tür kodu (None: ham bayt)
+SECTIONS = (
+    ('ids', None),                 # video ID'leri, '\n' ile ayrılmış UTF-8
+    ('document_lengths', 'I'),     # belge başına dur kelimesi dışındaki kelime sayısı
+    ('start_offsets', 'Q'),        # belge i'nin segment başlangıçları: starts[start_offsets[i]:start_offsets[i + 1]]
+    ('starts', 'd'),               # segment başlangıç zamanları (saniye)
+    ('term_offsets', 'Q'),         # terim i: terms[term_offsets[i]:term_offsets[i + 1]]
+    ('terms', None),               # sıralı terimler, UTF-8
+    ('postings_offsets', 'Q'),     # terim i'nin listesi: postings[postings_offsets[i]:postings_offsets[i + 1]]
+    ('document_frequency', 'I'),   # terim başına belge sayısı
+    ('last_document', 'I'),        # terimin geçtiği son belge (birleştirmede delta düzeltmesi için)
+    ('postings', None),
+)
+
+# magic, belge sayısı, terim sayısı, toplam belge uzunluğu, bölüm başına (başlangıç, uzunluk)
+HEADER = struct.Struct('<8sIIQ' + 'QQ' * len(SECTIONS))
+
+# Bellekte biriken video sayısı bu sınıra ulaşınca otomatik flush yapılır
+FLUSH_DOCUMENTS = 256
+
+# BM25 parametreleri
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+DEFAULT_INDEX_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'videobite', 'search')
+
+
+def _encode_varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varint(data: bytes, position: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+
+def _decode_varints(data: bytes) -> List[int]:
+    """Bayt dizisindeki tüm varint değerlerini çözer"""
+    values = []
+    result = 0
+    shift = 0
+    for byte in data:
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            values.append(result)
+            result = 0
+            shift = 0
+        else:
+            shift += 7
+    return values
+
+
+def tokenize(text: str, stop_words: Optional[set] = None) -> List[str]:
+    """Metni indeksleme ve sorgu için kelimelere ayırır (TERM_PATTERN, dur kelimeleri hariç)"""
+    if stop_words is None:
+        stop_words = get_stop_words()
+    return [term for term in TERM_PATTERN.findall(text.lower()) if term not in stop_words]
+
+
+@dataclass
+class SegmentHit:
+    """Sorgu kelimelerinin geçtiği segment"""
+    index: int
+    start: float
+    matches: int
+
+
+@dataclass
+class SearchHit:
+    """BM25 ile puanlanmış video ve eşleşen segmentleri"""
+    video_id: str
+    score: float
+    segments: List[SegmentHit] = field(default_factory=list)
+
+
+class _PartBuilder:
+    """Henüz diske yazılmamış videoların posting listelerini biriktirir"""
+
+    def __init__(self):
+        self.video_ids: List[str] = []
+        self.lengths = array('I')
+        self.start_offsets = array('Q', [0])
+        self.starts = array('d')
+        # terim -> [posting baytları, belge sayısı, son belge]
+        self.postings: Dict[str, list] = {}
+
+    def __len__(self) -> int:
+        return len(self.video_ids)
+
+    def add(self, video_id: str, texts: List[str], starts: List[float], stop_words: set) -> None:
+        document = len(self.video_ids)
+        segments_by_term: Dict[str, List[int]] = {}
+        length = 0
+        for index, text in enumerate(texts):
+            terms = tokenize(text, stop_words)
+            length += len(terms)
+            for term, count in Counter(terms).items():
+                segments_by_term.setdefault(term, []).extend((index, count))
+
+        postings = self.postings
+        for term, pairs in segments_by_term.items():
+            segment_data = bytearray()
+            previous = 0
+            frequency = 0
+            for position in range(0, len(pairs), 2):
+                _encode_varint(pairs[position] - previous, segment_data)
+                _encode_varint(pairs[position + 1], segment_data)
+                previous = pairs[position]
+                frequency += pairs[position + 1]
+
+            entry = postings.get(term)
+            if entry is None:
+                entry = postings[term] = [bytearray(), 0, 0]
+                delta = document
+            else:
+                delta = document - entry[2]
+            data = entry[0]
+            _encode_varint(delta, data)
+            _encode_varint(frequency, data)
+            _encode_varint(len(segment_data), data)
+            data += segment_data
+            entry[1] += 1
+            entry[2] = document
+
+        self.video_ids.append(video_id)
+        self.lengths.append(length)
+        self.starts.extend(starts)
+        self.start_offsets.append(len(self.starts))
+
+    def write(self, path: str) -> int:
+        """Parça dosyasını yazar ve belge sayısını döndürür"""
+        terms = sorted(self.postings)
+        term_blob = bytearray()
+        term_offsets = array('Q', [0])
+        postings_blob = bytearray()
+        postings_offsets = array('Q', [0])
+        frequencies = array('I')
+        last_documents = array('I')
+        for term in terms:
+            data, frequency, last = self.postings[term]
+            term_blob += term.encode('utf-8')
+            term_offsets.append(len(term_blob))
+            postings_blob += data
+            postings_offsets.append(len(postings_blob))
+            frequencies.append(frequency)
+            last_documents.append(last)
+
+        _write_part(path, {
+            'ids': '\n'.join(self.video_ids).encode('utf-8'),
+            'document_lengths': self.lengths,
+            'start_offsets': self.start_offsets,
+            'starts': self.starts,
+            'term_offsets': term_offsets,
+            'terms': term_blob,
+            'postings_offsets': postings_offsets,
+            'document_frequency': frequencies,
+            'last_document': last_documents,
+            'postings': postings_blob,
+        }, len(self.video_ids), len(terms), sum(self.lengths))
+        return len(self.video_ids)
+
+
+def _write_part(path: str, sections: Dict[str, object], document_count: int, term_count: int,
+                total_length: int) -> None:
+    """Bölümleri hizalayarak geçici dosyaya yazar ve atomik olarak yerine taşır"""
+    layout = []
+    offsets = []
+    position = HEADER.size
+    blobs = []
+    for name, _ in SECTIONS:
+        blob = sections[name]
+        data = blob.tobytes() if isinstance(blob, array) else bytes(blob)
+        position += -position % 8
+        layout += (position, len(data))
+        offsets.append(position)
+        blobs.append(data)
+        position += len(data)
+
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, document_count, term_count, total_length, *layout))
+        for offset, data in zip(offsets, blobs):
+            f.write(b'\0' * (offset - f.tell()))
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+
+
+class IndexPart:
+    """mmap ile açılmış, değişmez indeks parçası"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+        magic, self.document_count, self.term_count, self.total_length, *layout = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"Geçersiz indeks parçası: {path}")
+
+        self._views = []
+        for position, (name, typecode) in enumerate(SECTIONS):
+            start, size = layout[2 * position], layout[2 * position + 1]
+            section = view[start:start + size]
+            if typecode is not None:
+                section = section.cast(typecode)
+            self._views.append(section)
+            setattr(self, name, section)
+        # Alt görünümlerden sonra bırakılmalı; mmap açık görünüm varken kapatılamaz
+        self._views.append(view)
+
+    @cached_property
+    def video_ids(self) -> List[str]:
+        """Belge numarası sırasıyla video ID'leri (ilk erişimde çözülür)"""
+        return bytes(self.ids).decode('utf-8').split('\n') if self.document_count else []
+
+    @cached_property
+    def video_id_set(self) -> frozenset:
+        return frozenset(self.video_ids)
+
+    def lookup(self, term: bytes) -> int:
+        """Terimin sözlükteki sırasını döndürür (yoksa -1)"""
+        offsets = self.term_offsets
+        terms = self.terms
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            candidate = terms[offsets[middle]:offsets[middle + 1]].tobytes()
+            if candidate < term:
+                low = middle + 1
+            elif candidate > term:
+                high = middle
+            else:
+                return middle
+        return -1
+
+    def term(self, index: int) -> bytes:
+        return self.terms[self.term_offsets[index]:self.term_offsets[index + 1]].tobytes()
+
+    def postings_bytes(self, index: int) -> bytes:
+        return self.postings[self.postings_offsets[index]:self.postings_offsets[index + 1]].tobytes()
+
+    def segment_starts(self, document: int) -> memoryview:
+        return self.starts[self.start_offsets[document]:self.start_offsets[document + 1]]
+
+    def close(self) -> None:
+        for section in self._views:
+            section.release()
+        self._views = []
+        for name, _ in SECTIONS:
+            setattr(self, name, None)
+        self._map.close()
+        self._file.close()
+
+
+def _term_stream(part: IndexPart, position: int):
+    for index in range(part.term_count):
+        yield part.term(index), position, index
+
+
+def merge_parts(parts: List[IndexPart], path: str) -> int:
+    """Parçaları sırayla tek bir parçada birleştirir ve belge sayısını döndürür
+
+    Belge numaraları parça sırasına göre kaydırılır. Posting listeleri yeniden kodlanmaz;
+    her parçanın listesi olduğu gibi eklenir, yalnızca ilk belge farkı önceki parçanın
+    son belgesine göre yeniden yazılır.
+    """
+    bases = []
+    base = 0
+    for part in parts:
+        bases.append(base)
+        base += part.document_count
+
+    # Terim sözlükleri sıralı olduğundan k yollu birleştirme yeterlidir
+    streams = [_term_stream(part, position) for position, part in enumerate(parts)]
+    term_blob = bytearray()
+    term_offsets = array('Q', [0])
+    postings_blob = bytearray()
+    postings_offsets = array('Q', [0])
+    frequencies = array('I')
+    last_documents = array('I')
+    current = None
+    last = None
+    frequency = 0
+    for term, position, index in heapq.merge(*streams):
+        if term != current:
+            if current is not None:
+                term_blob += current
+                term_offsets.append(len(term_blob))
+                postings_offsets.append(len(postings_blob))
+                frequencies.append(frequency)
+                last_documents.append(last)
+            current = term
+            last = None
+            frequency = 0
+
+        part = parts[position]
+        data = part.postings_bytes(index)
+        first, rest = _decode_varint(data, 0)
+        document = bases[position] + first
+        _encode_varint(document - last if last is not None else document, postings_blob)
+        postings_blob += data[rest:]
+        last = bases[position] + part.last_document[index]
+        frequency += part.document_frequency[index]
+    if current is not None:
+        term_blob += current
+        term_offsets.append(len(term_blob))
+        postings_offsets.append(len(postings_blob))
+        frequencies.append(frequency)
+        last_documents.append(last)
+
+    lengths = array('I')
+    starts = array('d')
+    start_offsets = array('Q', [0])
+    for part in parts:
+        lengths.frombytes(part.document_lengths.tobytes())
+        shift = len(starts)
+        starts.frombytes(part.starts.tobytes())
+        start_offsets.extend(offset + shift for offset in part.start_offsets[1:])
+
+    _write_part(path, {
+        'ids': b'\n'.join(bytes(part.ids) for part in parts),
+        'document_lengths': lengths,
+        'start_offsets': start_offsets,
+        'starts': starts,
+        'term_offsets': term_offsets,
+        'terms': term_blob,
+        'postings_offsets': postings_offsets,
+        'document_frequency': frequencies,
+        'last_document': last_documents,
+        'postings': postings_blob,
+    }, base, len(frequencies), sum(part.total_length for part in parts))
+    return base
+
+
+class SearchIndex:
+    """Parça dosyaları ve SQLite kataloğundan oluşan artımlı BM25 indeksi"""
+
+    def __init__(self, directory: str = DEFAULT_INDEX_DIR, enabled: bool = True,
+                 flush_documents: int = FLUSH_DOCUMENTS):
+        """
+        Args:
+            directory: Parça dosyalarının ve kataloğun dizini
+            enabled: False ise indeks ne okunur ne güncellenir
+            flush_documents: Bellekte biriken video sayısı bu sınıra ulaşınca parça yazılır
+        """
+        self.directory = directory
+        self.enabled = enabled
+        self.flush_documents = flush_documents
+        self._lock = threading.RLock()
+        self._conn = None
+        self._data_version = None
+        self._parts: Dict[str, IndexPart] = {}
+        self._order: List[str] = []
+        self._pending = _PartBuilder()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(self.directory, exist_ok=True)
+            conn = sqlite3.connect(os.path.join(self.directory, 'catalog.sqlite3'), timeout=30,
+                                   check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS parts ('
+                ' name TEXT PRIMARY KEY,'
+                ' position INTEGER NOT NULL,'
+                ' documents INTEGER NOT NULL)'
+            )
+            self._conn = conn
+        return self._conn
+
+    def _refresh(self) -> None:
+        """Katalog başka bir süreçte değiştiyse parça listesini yeniden yükler"""
+        conn = self._connection()
+        version = conn.execute('PRAGMA data_version').fetchone()[0]
+        if version == self._data_version and self._order:
+            return
+        self._load_parts(conn)
+        self._data_version = version
+
+    def _load_parts(self, conn: sqlite3.Connection) -> None:
+        names = [name for name, in conn.execute('SELECT name FROM parts ORDER BY position')]
+        for name in set(self._parts) - set(names):
+            self._parts.pop(name).close()
+        for name in names:
+            if name not in self._parts:
+                self._parts[name] = IndexPart(os.path.join(self.directory, name))
+        self._order = names
+
+    def __contains__(self, video_id: str) -> bool:
+        """Video diske yazılmış bir parçada veya bekleyenler arasında mı"""
+        with self._lock:
+            self._refresh()
+            return (video_id in self._pending.video_ids
+                    or any(video_id in self._parts[name].video_id_set for name in self._order))
+
+    def add(self, video_id: str, processed: ProcessedTranscript) -> bool:
+        """Videonun segmentlerini indekse ekler; zaten indeksliyse atlar
+
+        Eklenen video flush (veya flush_documents sınırı) sonrasında aranabilir olur.
+
+        Args:
+            video_id: YouTube video ID'si
+            processed: İşlenmiş transkript
+
+        Returns:
+            Video yeni eklendiyse True
+        """
+        if not self.enabled:
+            return False
+
+        try:
+            with self._lock:
+                if video_id in self:
+                    return False
+                segments = processed.segments
+                self._pending.add(video_id, list(segments.texts()), segments.starts, get_stop_words())
+                if len(self._pending) >= self.flush_documents:
+                    self.flush()
+                return True
+        except (OSError, sqlite3.Error, ValueError) as e:
+            print(f"Arama indeksine eklenirken hata: {str(e)}", file=sys.stderr)
+            return False
+
+    def flush(self) -> None:
+        """Bekleyen videoları yeni bir parçaya yazar ve gerekirse parçaları birleştirir"""
+        if not self.enabled or not len(self._pending):
+            return
+
+        removed = []
+        try:
+            with self._lock:
+                conn = self._connection()
+                # Aynı dizine yazan süreçler sırayla ilerler
+                conn.execute('BEGIN IMMEDIATE')
+                try:
+                    self._load_parts(conn)
+                    name = f"part-{uuid.uuid4().hex[:16]}.vbi"
+                    documents = self._pending.write(os.path.join(self.directory, name))
+                    position = conn.execute('SELECT COALESCE(MAX(position), 0) + 1 FROM parts').fetchone()[0]
+                    conn.execute('INSERT INTO parts VALUES (?, ?, ?)', (name, position, documents))
+                    rows = conn.execute('SELECT name, documents FROM parts ORDER BY position').fetchall()
+
+                    # Son parça bir öncekinden büyük değilse birleştir (ikili sayaç gibi)
+                    while len(rows) >= 2 and rows[-2][1] <= rows[-1][1]:
+                        merged = f"part-{uuid.uuid4().hex[:16]}.vbi"
+                        sources = [IndexPart(os.path.join(self.directory, row[0])) for row in rows[-2:]]
+                        try:
+                            documents = merge_parts(sources, os.path.join(self.directory, merged))
+                        finally:
+                            for source in sources:
+                                source.close()
+                        conn.executemany('DELETE FROM parts WHERE name = ?', [(row[0],) for row in rows[-2:]])
+                        conn.execute('INSERT INTO parts VALUES (?, ?, ?)', (merged, position, documents))
+                        removed += [row[0] for row in rows[-2:]]
+                        rows = rows[:-2] + [(merged, documents)]
+                    conn.execute('COMMIT')
+                except BaseException:
+                    conn.execute('ROLLBACK')
+                    raise
+                self._pending = _PartBuilder()
+                self._load_parts(conn)
+                self._data_version = conn.execute('PRAGMA data_version').fetchone()[0]
+        except (OSError, sqlite3.Error, ValueError) as e:
+            # Bekleyen videolar bellekte kalır; bir sonraki flush'ta yeniden denenir
+            print(f"Arama indeksi yazılırken hata: {str(e)}", file=sys.stderr)
+            return
+
+        # Diğer süreçlerin açık mmap'leri silinen dosyaları okumaya devam edebilir
+        for name in removed:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def search(self, query: str, limit: int = 10, max_segments: int = 3) -> List[SearchHit]:
+        """Sorguyu BM25 ile puanlar ve en iyi videoları eşleşen segmentleriyle döndürür
+
+        Args:
+            query: Serbest metin sorgu (indekslemeyle aynı şekilde kelimelere ayrılır)
+            limit: Döndürülecek video sayısı
+            max_segments: Video başına döndürülecek en çok eşleşen segment sayısı
+
+        Returns:
+            Puanı azalan sırada sonuçlar
+        """
+        if not self.enabled:
+            return []
+        terms = [term.encode('utf-8') for term in dict.fromkeys(tokenize(query))]
+        if not terms:
+            return []
+
+        with self._lock:
+            self._refresh()
+            parts = [self._parts[name] for name in self._order]
+            document_count = sum(part.document_count for part in parts)
+            if not document_count:
+                return []
+            average_length = sum(part.total_length for part in parts) / document_count
+
+            # Parça başına terim sırası; belge numarası parçalar boyunca tek bir sayıya kaydırılır
+            bases = []
+            base = 0
+            for part in parts:
+                bases.append(base)
+                base += part.document_count
+            lookups = [[part.lookup(term) for part in parts] for term in terms]
+
+            scores: Dict[int, float] = {}
+            # (posting baytları, belge -> segment verisi uzunluğunun konumu); parça ve terim başına bir tane
+            segment_refs: List[Tuple[bytes, Dict[int, int]]] = []
+            for term_lookups in lookups:
+                frequency = sum(part.document_frequency[index]
+                                for part, index in zip(parts, term_lookups) if index >= 0)
+                if not frequency:
+                    continue
+                idf = math.log(1 + (document_count - frequency + 0.5) / (frequency + 0.5))
+                for part, index, part_base in zip(parts, term_lookups, bases):
+                    if index < 0:
+                        continue
+                    data = part.postings_bytes(index)
+                    segment_refs.append((data, self._score_postings(
+                        data, part.document_lengths, part_base, idf, average_length, scores
+                    )))
+
+            top = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+            return [self._hit(document, score, parts, bases, segment_refs, max_segments)
+                    for document, score in top]
+
+    @staticmethod
+    def _score_postings(data: bytes, lengths: memoryview, base: int, idf: float, average_length: float,
+                        scores: Dict[int, float]) -> Dict[int, int]:
+        """Bir parçadaki terim listesinin BM25 katkısını scores'a ekler
+
+        Segment verisi çözülmez, yalnızca konumu kaydedilir. Değerlerin çoğu tek baytlık
+        varint olduğundan bu durum satır içinde ele alınır.
+        """
+        k1 = BM25_K1
+        norm = k1 * (1 - BM25_B)
+        slope = k1 * BM25_B / average_length
+        weight = idf * (k1 + 1)
+        get = scores.get
+        positions = {}
+        document = base
+        position = 0
+        end = len(data)
+        while position < end:
+            delta = data[position]
+            position += 1
+            if delta >= 0x80:
+                delta, position = _decode_varint(data, position - 1)
+            frequency = data[position]
+            position += 1
+            if frequency >= 0x80:
+                frequency, position = _decode_varint(data, position - 1)
+            document += delta
+            scores[document] = get(document, 0.0) + weight * frequency / (
+                frequency + norm + slope * lengths[document - base]
+            )
+            positions[document] = position
+            size = data[position]
+            position += 1
+            if size >= 0x80:
+                size, position = _decode_varint(data, position - 1)
+            position += size
+        return positions
+
+    @staticmethod
+    def _hit(document: int, score: float, parts: List[IndexPart], bases: List[int],
+             segment_refs: List[Tuple[bytes, Dict[int, int]]], max_segments: int) -> SearchHit:
+        position = 0
+        while position + 1 < len(parts) and bases[position + 1] <= document:
+            position += 1
+        part = parts[position]
+        local = document - bases[position]
+
+        matches: Counter = Counter()
+        for data, positions in segment_refs:
+            start = positions.get(document)
+            if start is None:
+                continue
+            size, start = _decode_varint(data, start)
+            values = _decode_varints(data[start:start + size])
+            segment = 0
+            for pair in range(0, len(values), 2):
+                segment += values[pair]
+                matches[segment] += values[pair + 1]
+
+        starts = part.segment_starts(local)
+        best = sorted(matches.items(), key=lambda item: (-item[1], item[0]))[:max_segments]
+        return SearchHit(
+            video_id=part.video_ids[local],
+            score=round(score, 4),
+            segments=[SegmentHit(index=segment, start=round(starts[segment], 2), matches=count)
+                      for segment, count in sorted(best)],
+        )
+
+    def optimize(self) -> None:
+        """Bekleyenleri yazar ve tüm parçaları tek parçada birleştirir"""
+        if not self.enabled:
+            return
+        self.flush()
+        removed = []
+        with self._lock:
+            conn = self._connection()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                rows = conn.execute('SELECT name, position FROM parts ORDER BY position').fetchall()
+                if len(rows) > 1:
+                    merged = f"part-{uuid.uuid4().hex[:16]}.vbi"
+                    sources = [IndexPart(os.path.join(self.directory, name)) for name, _ in rows]
+                    try:
+                        documents = merge_parts(sources, os.path.join(self.directory, merged))
+                    finally:
+                        for source in sources:
+                            source.close()
+                    conn.execute('DELETE FROM parts')
+                    conn.execute('INSERT INTO parts VALUES (?, ?, ?)', (merged, rows[-1][1], documents))
+                    removed = [name for name, _ in rows]
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            self._load_parts(conn)
+        for name in removed:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, object]:
+        """Parça, video ve disk kullanımı bilgilerini döndürür"""
+        result = {"enabled": self.enabled, "parts": 0, "documents": 0, "pending": len(self._pending), "bytes": 0}
+        if self.enabled:
+            with self._lock:
+                self._refresh()
+                parts = [self._parts[name] for name in self._order]
+                result.update(
+                    parts=len(parts),
+                    documents=sum(part.document_count for part in parts),
+                    bytes=sum(os.path.getsize(part.path) for part in parts),
+                )
+        return result
+
+
+_default_index = None
+
+
+def get_search_index() -> SearchIndex:
+    """VIDEOBITE_SEARCH_PATH ve VIDEOBITE_SEARCH_DISABLED ile yapılandırılan paylaşılan indeksi döndürür"""
+    global _default_index
+    if _default_index is None:
+        _default_index = SearchIndex(
+            directory=os.getenv('VIDEOBITE_SEARCH_PATH', DEFAULT_INDEX_DIR),
+            enabled=os.getenv('VIDEOBITE_SEARCH_DISABLED', '') not in ('1', 'true'),
+        )
+    return _default_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Transkript arama indeksi')
+    parser.add_argument('query', nargs='?', default='', help='Aranacak metin')
+    parser.add_argument('--limit', type=int, default=10, help='Döndürülecek video sayısı')
+    parser.add_argument('--stats', action='store_true', help='İndeks istatistiklerini yazdır')
+    parser.add_argument('--optimize', action='store_true', help='Tüm parçaları tek parçada birleştir')
+    args = parser.parse_args()
+
+    index = get_search_index()
+    if args.optimize:
+        index.optimize()
+    if args.stats or args.optimize or not args.query:
+        print(json.dumps(index.stats(), ensure_ascii=False))
+        return
+
+    hits = index.search(args.query, args.limit)
+    print(json.dumps([
+        {"videoId": hit.video_id, "score": hit.score,
+         "segments": [{"index": s.index, "start": s.start, "matches": s.matches} for s in hit.segments]}
+        for hit in hits
+    ], ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite İstek Birleştirme
+Aynı anahtar için eşzamanlı gelen çağrıları tek bir hesaplamada birleştirir (single-flight).
+Çağrı sürerken gelenler yeni bir hesaplama başlatmaz; ilk çağrının sonucunu (veya
+hatasını) bekler ve aynı nesneyi alır. Hesaplama bitince anahtar serbest kalır, yani
+sonuçlar saklanmaz; kalıcılık önbelleğin ve sonuç deposunun işidir.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import instrumentation
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Thread-safe single-flight birleştirici"""
+
+    def __init__(self, enabled: bool = True):
+        """
+        Args:
+            enabled: False ise her çağrı kendi hesaplamasını yapar (karşılaştırma için)
+        """
+        self.enabled = enabled
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._executions = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, function: Callable, *args) -> Tuple[Any, bool]:
+        """Anahtar için süren bir çağrı varsa onun sonucunu bekler, yoksa fonksiyonu çalıştırır
+
+        Args:
+            key: Birleştirme anahtarı (ör. (video_id, dil))
+            function: Sonucu hesaplayan fonksiyon
+            args: Fonksiyonun argümanları
+
+        Returns:
+            (sonuç, paylaşıldı mı); bekleyen çağrılar için ikinci değer True'dur
+        """
+        if not self.enabled:
+            with self._lock:
+                self._executions += 1
+            return function(*args), False
+
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._executions += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self._coalesced += 1
+                leader = False
+
+        if not leader:
+            instrumentation.count('coalesced')
+            with instrumentation.stage('coalesced_wait'):
+                call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = function(*args)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            if call.waiters:
+                instrumentation.count('coalesced_waiters', call.waiters)
+        return call.result, False
+
+    def stats(self) -> Dict[str, int]:
+        """Süren çağrı, gerçek hesaplama ve birleştirilen çağrı sayılarını döndürür"""
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "executions": self._executions,
+                "coalesced": self._coalesced,
+            }
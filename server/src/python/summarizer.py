@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite Çıkarımsal Özetleyici
+ProcessedTranscript cümlelerini seyrek TF-IDF vektörleriyle puanlar ve LLM çağrısı
+gerektirmeden özet ile anahtar noktalar üretir.
+"""
+
+import math
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from data_pipeline import ProcessedTranscript, TERM_PATTERN, get_stop_words
+
+SparseVector = Dict[str, float]
+
+
+def _dot(a: SparseVector, b: SparseVector) -> float:
+    """İki seyrek vektörün iç çarpımı (küçük olan üzerinde döner)"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(term, 0.0) for term, weight in a.items())
+
+
+class ExtractiveSummarizer:
+    """TF-IDF merkez benzerliği ve MMR ile cümle seçen özetleyici"""
+
+    def __init__(self, min_sentence_chars: int = 30, redundancy_weight: float = 0.7,
+                 candidate_factor: int = 4):
+        """
+        Args:
+            min_sentence_chars: Seçilebilecek cümlelerin minimum uzunluğu
+            redundancy_weight: MMR'de alaka ağırlığı (1.0 tekrar cezası uygulamaz)
+            candidate_factor: MMR için istenen cümle sayısının kaç katı adayın değerlendirileceği
+        """
+        self.min_sentence_chars = min_sentence_chars
+        self.redundancy_weight = redundancy_weight
+        self.candidate_factor = candidate_factor
+
+    def _vectorize(self, sentences: List[str]) -> List[SparseVector]:
+        """Cümleleri L2 normlu seyrek TF-IDF vektörlerine dönüştürür"""
+        stop_words = get_stop_words()
+        term_counts = []
+        document_frequency = Counter()
+        for sentence in sentences:
+            counts = Counter(word for word in TERM_PATTERN.findall(sentence.lower()) if word not in stop_words)
+            term_counts.append(counts)
+            document_frequency.update(counts.keys())
+
+        total = len(sentences)
+        idf = {term: math.log((1 + total) / (1 + df)) + 1.0 for term, df in document_frequency.items()}
+
+        vectors = []
+        for counts in term_counts:
+            vector = {term: (1.0 + math.log(count)) * idf[term] for term, count in counts.items()}
+            norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+            if norm:
+                vector = {term: weight / norm for term, weight in vector.items()}
+            vectors.append(vector)
+        return vectors
+
+    def _score(self, sentences: List[str]) -> Tuple[List[SparseVector], List[Tuple[int, float]]]:
+        vectors = self._vectorize(sentences)
+
+        centroid = Counter()
+        for vector in vectors:
+            centroid.update(vector)
+
+        scores = []
+        for index, (sentence, vector) in enumerate(zip(sentences, vectors)):
+            if len(sentence) < self.min_sentence_chars or not vector:
+                continue
+            scores.append((index, _dot(vector, centroid)))
+
+        scores.sort(key=lambda item: item[1], reverse=True)
+        return vectors, scores
+
+    def rank_sentences(self, processed: ProcessedTranscript) -> List[Tuple[int, float]]:
+        """Cümleleri belge merkezine benzerliklerine göre puanlar
+
+        Args:
+            processed: İşlenmiş transkript
+
+        Returns:
+            Puana göre azalan (cümle indeksi, puan) listesi
+        """
+        return self._score(processed.sentences)[1]
+
+    def select(self, processed: ProcessedTranscript, count: int) -> List[int]:
+        """Alakalı ve birbirini tekrar etmeyen cümleleri MMR ile seçer
+
+        Args:
+            processed: İşlenmiş transkript
+            count: Seçilecek cümle sayısı
+
+        Returns:
+            Seçim sırasına göre cümle indeksleri
+        """
+        vectors, ranked = self._score(processed.sentences)
+
+        # Aynı cümle birden çok kez geçiyorsa yalnızca en yüksek puanlısı aday olur
+        seen = set()
+        unique_ranked = []
+        for index, score in ranked:
+            if processed.sentences[index] not in seen:
+                seen.add(processed.sentences[index])
+                unique_ranked.append((index, score))
+        ranked = unique_ranked[:count * self.candidate_factor]
+        if not ranked:
+            return []
+
+        top_score = ranked[0][1] or 1.0
+        relevance = {index: score / top_score for index, score in ranked}
+
+        selected: List[int] = []
+        remaining = [index for index, _ in ranked]
+        while remaining and len(selected) < count:
+            def mmr(candidate: int) -> float:
+                redundancy = max((_dot(vectors[candidate], vectors[chosen]) for chosen in selected), default=0.0)
+                return self.redundancy_weight * relevance[candidate] - (1 - self.redundancy_weight) * redundancy
+
+            best = max(remaining, key=mmr)
+            remaining.remove(best)
+            selected.append(best)
+
+        return selected
+
+    def summarize(self, processed: ProcessedTranscript, max_sentences: int = 5,
+                  key_point_count: int = 0) -> Tuple[str, List[str]]:
+        """Özet ve anahtar noktaları tek seçimle üretir
+
+        Özet cümleleri transkriptteki sırasıyla birleştirilir; anahtar noktalar
+        özette kullanılmayan en önemli cümlelerdir.
+
+        Args:
+            processed: İşlenmiş transkript
+            max_sentences: Özetteki maksimum cümle sayısı
+            key_point_count: Döndürülecek anahtar nokta sayısı
+
+        Returns:
+            (özet metni, anahtar nokta cümleleri); uygun cümle yoksa ("", [])
+        """
+        summary_indices, key_point_indices = self.summarize_indices(processed, max_sentences, key_point_count)
+        summary = " ".join(processed.sentences[index] for index in summary_indices)
+        key_points = [processed.sentences[index] for index in key_point_indices]
+        return summary, key_points
+
+    def summarize_indices(self, processed: ProcessedTranscript, max_sentences: int = 5,
+                          key_point_count: int = 0) -> Tuple[List[int], List[int]]:
+        """summarize ile aynı seçimi cümle indeksleri olarak döndürür
+
+        İndeksler TranscriptTimeIndex ile zaman aralıklarına eşlenebilir.
+
+        Returns:
+            (transkript sırasıyla özet cümle indeksleri, önem sırasıyla anahtar nokta indeksleri)
+        """
+        indices = self.select(processed, max_sentences + key_point_count)
+        return sorted(indices[:max_sentences]), indices[max_sentences:]
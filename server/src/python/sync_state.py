@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite Kanal Senkronizasyon Durumu
+Her kanal için en son görülen yayın zamanını, işlenmiş video ID'lerini ve başarısız
+videoları SQLite'ta saklar. --since_last_run modu bu durumla yalnızca son çalıştırmadan
+sonra yüklenen videoları ve önceki çalıştırmalarda başarısız olanları işler.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_STATE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'videobite', 'sync_state.sqlite3')
+
+# Bu kadar çalıştırmada başarısız olan video artık yeniden denenmez (ör. transkripti yok)
+MAX_RETRY_ATTEMPTS = 5
+
+
+class ChannelSyncState:
+    """Kanal başına kalıcı senkronizasyon durumu"""
+
+    def __init__(self, path: str = DEFAULT_STATE_PATH):
+        """
+        Args:
+            path: SQLite dosya yolu
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS channels ('
+                ' channel_id TEXT PRIMARY KEY,'
+                ' last_published_at TEXT,'
+                ' last_run_at REAL NOT NULL)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS processed_videos ('
+                ' channel_id TEXT NOT NULL,'
+                ' video_id TEXT NOT NULL,'
+                ' published_at TEXT,'
+                ' processed_at REAL NOT NULL,'
+                ' PRIMARY KEY (channel_id, video_id))'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS failed_videos ('
+                ' channel_id TEXT NOT NULL,'
+                ' video_id TEXT NOT NULL,'
+                ' title TEXT,'
+                ' published_at TEXT,'
+                ' channel_title TEXT,'
+                ' attempts INTEGER NOT NULL,'
+                ' failed_at REAL NOT NULL,'
+                ' PRIMARY KEY (channel_id, video_id))'
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, channel_id: str) -> Optional[Dict[str, object]]:
+        """Kanalın durumunu döndürür; kanal daha önce senkronize edilmediyse None
+
+        Returns:
+            {"last_published_at", "last_run_at", "processed_count", "failed_count"} sözlüğü
+        """
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                'SELECT last_published_at, last_run_at FROM channels WHERE channel_id = ?', (channel_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            processed_count = conn.execute(
+                'SELECT COUNT(*) FROM processed_videos WHERE channel_id = ?', (channel_id,)
+            ).fetchone()[0]
+            failed_count = conn.execute(
+                'SELECT COUNT(*) FROM failed_videos WHERE channel_id = ?', (channel_id,)
+            ).fetchone()[0]
+        return {
+            "last_published_at": row[0], "last_run_at": row[1],
+            "processed_count": processed_count, "failed_count": failed_count,
+        }
+
+    def is_processed(self, channel_id: str, video_id: str) -> bool:
+        """Video bu kanal için daha önce başarıyla işlendiyse True"""
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT 1 FROM processed_videos WHERE channel_id = ? AND video_id = ?', (channel_id, video_id)
+            ).fetchone()
+        return row is not None
+
+    def failed_videos(self, channel_id: str) -> List[Dict[str, str]]:
+        """Yeniden denenecek başarısız videoları en yeniden eskiye döndürür
+
+        MAX_RETRY_ATTEMPTS kez başarısız olan videolar dahil edilmez.
+
+        Returns:
+            get_channel_videos kayıtlarıyla aynı anahtarlı sözlükler
+        """
+        with self._lock:
+            rows = self._connection().execute(
+                'SELECT video_id, title, published_at, channel_title FROM failed_videos'
+                ' WHERE channel_id = ? AND attempts < ? ORDER BY published_at DESC',
+                (channel_id, MAX_RETRY_ATTEMPTS)
+            ).fetchall()
+        return [
+            {"video_id": video_id, "title": title, "published_at": published_at, "channel_title": channel_title}
+            for video_id, title, published_at, channel_title in rows
+        ]
+
+    def mark_failed(self, channel_id: str, videos: Iterable[Dict[str, str]]) -> None:
+        """Başarısız videoları kaydeder; daha önce kayıtlıysa deneme sayısı artırılır
+
+        Args:
+            channel_id: YouTube kanal ID'si
+            videos: get_channel_videos kayıtları
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.executemany(
+                    'INSERT INTO failed_videos VALUES (?, ?, ?, ?, ?, 1, ?)'
+                    ' ON CONFLICT(channel_id, video_id) DO UPDATE SET'
+                    ' attempts = attempts + 1, failed_at = excluded.failed_at',
+                    [
+                        (channel_id, video['video_id'], video.get('title'), video.get('published_at'),
+                         video.get('channel_title'), now)
+                        for video in videos
+                    ]
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Senkronizasyon durumu kaydedilirken hata: {str(e)}", file=sys.stderr)
+
+    def mark_processed(self, channel_id: str, videos: Iterable[Dict[str, str]], advance: bool = True) -> None:
+        """İşlenen videoları kaydeder, başarısızlar listesinden çıkarır ve kanalın son yayın zamanını ilerletir
+
+        Args:
+            channel_id: YouTube kanal ID'si
+            videos: 'video_id' ve 'published_at' anahtarlı video kayıtları
+            advance: False ise son yayın zamanı değişmez (ör. liste önceki sınıra ulaşmadıysa
+                aradaki yüklemeler henüz işlenmemiştir)
+        """
+        now = time.time()
+        videos = list(videos)
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.executemany(
+                    'INSERT OR REPLACE INTO processed_videos VALUES (?, ?, ?, ?)',
+                    [(channel_id, video['video_id'], video.get('published_at'), now) for video in videos]
+                )
+                conn.executemany(
+                    'DELETE FROM failed_videos WHERE channel_id = ? AND video_id = ?',
+                    [(channel_id, video['video_id']) for video in videos]
+                )
+                newest = None
+                if advance:
+                    # Sınıra kadar tüm yüklemeler işlendi veya başarısız olarak kaydedildi; önceki
+                    # kesilmiş çalıştırmaların işlediği daha yeni videolar da sayılır (ISO 8601
+                    # zaman damgaları metin olarak doğru sıralanır)
+                    newest = conn.execute(
+                        'SELECT MAX(published_at) FROM processed_videos WHERE channel_id = ?', (channel_id,)
+                    ).fetchone()[0]
+                conn.execute(
+                    'INSERT INTO channels VALUES (?, ?, ?) ON CONFLICT(channel_id) DO UPDATE SET'
+                    ' last_published_at = NULLIF(MAX(COALESCE(last_published_at, \'\'),'
+                    ' COALESCE(excluded.last_published_at, \'\')), \'\'),'
+                    ' last_run_at = excluded.last_run_at',
+                    (channel_id, newest, now)
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Senkronizasyon durumu kaydedilirken hata: {str(e)}", file=sys.stderr)
+
+    def reset(self, channel_id: str) -> None:
+        """Kanalın durumunu siler; bir sonraki çalıştırma baştan senkronize eder"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute('DELETE FROM processed_videos WHERE channel_id = ?', (channel_id,))
+            conn.execute('DELETE FROM failed_videos WHERE channel_id = ?', (channel_id,))
+            conn.execute('DELETE FROM channels WHERE channel_id = ?', (channel_id,))
+            conn.commit()
+
+
+_default_state = None
+
+
+def get_sync_state() -> ChannelSyncState:
+    """VIDEOBITE_SYNC_STATE_PATH ile yapılandırılan paylaşılan durum örneğini döndürür"""
+    global _default_state
+    if _default_state is None:
+        _default_state = ChannelSyncState(os.getenv('VIDEOBITE_SYNC_STATE_PATH', DEFAULT_STATE_PATH))
+    return _default_state
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite TF-IDF Terim Çıkarıcı
+Transkriptteki tek kelimelik ve iki kelimelik terimleri, işlenen tüm transkriptler
+boyunca artımlı olarak güncellenen kalıcı bir belge frekansı (DF) tablosuna göre
+TF-IDF ile puanlar. Böylece her videoda geçen genel kelimeler geri planda kalır,
+videoya özgü terimler öne çıkar.
+
+Sayma, kelimeler belge içi tamsayı ID'lere çevrildikten sonra ID listeleri üzerinde
+map ve Counter ile yapılır; iki kelimelik terimler iki ID'den tek bir tamsayı
+anahtara paketlenir. En iyi k terim heapq ile seçilir.
+"""
+
+import heapq
+import math
+import os
+import re
+import sqlite3
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from itertools import islice, repeat
+from operator import add, mul
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from data_pipeline import ProcessedTranscript, TERM_PATTERN, get_stop_words
+
+# Terimler ve aralarında atlanan her şey (noktalama dizileri, sayılar, kısa veya karışık kelimeler);
+# terim olmayan belirteçler ayraçtır, iki kelimelik terim bunların veya dur kelimelerinin üzerinden kurulmaz
+TOKEN_PATTERN = re.compile(TERM_PATTERN.pattern + r'|[^\s\w]+|\w+')
+
+# Kesme işaretiyle ayrılan ekler (YouTube'un) ayraç sayılmaz, sayımdan önce atılır
+APOSTROPHE_SUFFIX = re.compile(r"(?<=\w)['’]\w+")
+
+# İki kelimelik terimin aday sayılması için belgede en az geçme sayısı
+MIN_BIGRAM_COUNT = 2
+
+# SQLite'ın tek sorguda kabul ettiği parametre sınırının altında kalan grup boyutu
+_QUERY_BATCH = 500
+
+DEFAULT_DF_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'videobite', 'document_frequency.sqlite3')
+
+
+@dataclass
+class RankedTerm:
+    """TF-IDF ile puanlanmış terim"""
+    term: str
+    score: float
+    count: int
+
+
+@dataclass
+class TermCounts:
+    """Tek bir belgenin tamsayı ID'ler üzerinden terim sayıları
+
+    unigrams kelime ID'si, bigrams first * stride + second anahtarıyla sayılır.
+    """
+    vocabulary: List[str]
+    unigrams: Counter
+    bigrams: Counter
+    stride: int
+
+    def terms(self) -> Dict[str, int]:
+        """Tüm terimleri ve sayılarını döndürür"""
+        vocabulary = self.vocabulary
+        counts = {vocabulary[key]: count for key, count in self.unigrams.items()}
+        for key, count in self.bigrams.items():
+            first, second = divmod(key, self.stride)
+            counts[f"{vocabulary[first]} {vocabulary[second]}"] = count
+        return counts
+
+
+def count_terms(text: str, stop_words: Optional[set] = None) -> TermCounts:
+    """Metindeki tek ve iki kelimelik terimleri sayar
+
+    Farklı kelimeler ilk görüldükleri sırayla tamsayı ID alır; dur kelimeleri ve terimler
+    arasında atlanan belirteçler (noktalama, sayılar, kısa kelimeler) ortak bir ayraç
+    ID'sine (V, kelime sayısı) eşlenir. Ardışık ID
+    çiftleri a * (V + 1) + b anahtarına paketlenir. Tüm eşleme ve sayma adımları map ve
+    Counter ile C düzeyinde, Python döngüsü olmadan yapılır; ayraç içeren çiftler yalnızca
+    farklı anahtarlar üzerinde elenir.
+
+    Args:
+        text: İşlenecek metin (iki kelimelik terimler cümle sınırını aşmaz)
+        stop_words: Dur kelimeleri (varsayılan: NLTK İngilizce ve Türkçe listesi)
+
+    Returns:
+        Terim sayıları
+    """
+    if stop_words is None:
+        stop_words = get_stop_words()
+
+    tokens = TOKEN_PATTERN.findall(APOSTROPHE_SUFFIX.sub('', text.lower()))
+    distinct = dict.fromkeys(tokens)
+    vocabulary = [token for token in distinct if token not in stop_words and TERM_PATTERN.fullmatch(token)]
+    size = len(vocabulary)
+    stride = size + 1
+
+    # Önce tüm belirteçler ayraç ID'sine (size) eşlenir, ardından kelimelerin ID'leri yazılır
+    index = dict.fromkeys(distinct, size)
+    index.update(zip(vocabulary, range(size)))
+    ids = list(map(index.__getitem__, tokens))
+
+    unigrams = Counter(ids)
+    unigrams.pop(size, None)
+
+    pairs = Counter(map(add, map(mul, ids, repeat(stride)), islice(ids, 1, None)))
+    bigrams = Counter({
+        key: count for key, count in pairs.items()
+        if key // stride != size and key % stride != size
+    })
+    return TermCounts(vocabulary=vocabulary, unigrams=unigrams, bigrams=bigrams, stride=stride)
+
+
+class DocumentFrequencyTable:
+    """Dil başına belge frekanslarını SQLite'ta tutan artımlı tablo"""
+
+    def __init__(self, path: str = DEFAULT_DF_PATH, enabled: bool = True):
+        """
+        Args:
+            path: SQLite dosya yolu
+            enabled: False ise tablo ne okunur ne güncellenir (her terimin DF'i 1 sayılır)
+        """
+        self.path = path
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS document_frequency ('
+                ' language TEXT NOT NULL,'
+                ' term TEXT NOT NULL,'
+                ' df INTEGER NOT NULL,'
+                ' PRIMARY KEY (language, term)) WITHOUT ROWID'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS documents ('
+                ' language TEXT NOT NULL,'
+                ' document_id TEXT NOT NULL,'
+                ' PRIMARY KEY (language, document_id)) WITHOUT ROWID'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS corpus ('
+                ' language TEXT PRIMARY KEY,'
+                ' document_count INTEGER NOT NULL)'
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def add_document(self, document_id: str, language: str, terms: Iterable[str]) -> bool:
+        """Belgenin terimlerini DF tablosuna ekler; aynı belge ikinci kez sayılmaz
+
+        Args:
+            document_id: Belge kimliği (ör. video ID'si)
+            language: Belge dili
+            terms: Belgede geçen farklı terimler
+
+        Returns:
+            Belge yeni eklendiyse True
+        """
+        if not self.enabled:
+            return False
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                inserted = conn.execute(
+                    'INSERT OR IGNORE INTO documents VALUES (?, ?)', (language, document_id)
+                ).rowcount
+                if not inserted:
+                    return False
+                conn.executemany(
+                    'INSERT INTO document_frequency VALUES (?, ?, 1)'
+                    ' ON CONFLICT(language, term) DO UPDATE SET df = df + 1',
+                    ((language, term) for term in terms)
+                )
+                conn.execute(
+                    'INSERT INTO corpus VALUES (?, 1)'
+                    ' ON CONFLICT(language) DO UPDATE SET document_count = document_count + 1',
+                    (language,)
+                )
+                conn.commit()
+                return True
+        except sqlite3.Error as e:
+            print(f"Belge frekansı güncellenirken hata: {str(e)}", file=sys.stderr)
+            return False
+
+    def document_count(self, language: str) -> int:
+        """Dildeki belge sayısı"""
+        if not self.enabled:
+            return 0
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT document_count FROM corpus WHERE language = ?', (language,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def frequencies(self, language: str, terms: List[str]) -> Dict[str, int]:
+        """Verilen terimlerin belge frekanslarını döndürür (tabloda olmayanlar dahil edilmez)"""
+        if not self.enabled or not terms:
+            return {}
+        result = {}
+        with self._lock:
+            conn = self._connection()
+            for offset in range(0, len(terms), _QUERY_BATCH):
+                batch = terms[offset:offset + _QUERY_BATCH]
+                placeholders = ','.join('?' * len(batch))
+                result.update(conn.execute(
+                    f'SELECT term, df FROM document_frequency WHERE language = ? AND term IN ({placeholders})',
+                    [language, *batch]
+                ))
+        return result
+
+
+class TermExtractor:
+    """Tek ve iki kelimelik terimleri TF-IDF ile sıralayan çıkarıcı"""
+
+    def __init__(self, df_table: Optional[DocumentFrequencyTable] = None, min_bigram_count: int = MIN_BIGRAM_COUNT):
+        """
+        Args:
+            df_table: Belge frekansı tablosu (varsayılan: paylaşılan tablo)
+            min_bigram_count: İki kelimelik terimin aday olması için belgede en az geçme sayısı
+        """
+        self.df_table = df_table if df_table is not None else get_df_table()
+        self.min_bigram_count = min_bigram_count
+
+    def rank(self, processed: ProcessedTranscript, top_n: int = 20,
+             document_id: Optional[str] = None) -> List[RankedTerm]:
+        """Transkriptin terimlerini TF-IDF puanına göre sıralar
+
+        document_id verilirse belge önce DF tablosuna eklenir (her belge bir kez sayılır);
+        böylece derlem her işlenen transkriptle büyür. Puan, alt doğrusal TF ile
+        yumuşatılmış IDF'nin çarpımıdır: (1 + log tf) * (log((1 + N) / (1 + df)) + 1).
+
+        Args:
+            processed: İşlenmiş transkript
+            top_n: Döndürülecek terim sayısı
+            document_id: DF tablosuna eklenecek belge kimliği (ör. video ID'si)
+
+        Returns:
+            Puanı azalan sırada terimler
+        """
+        counts = count_terms(processed.full_text)
+        terms = counts.terms()
+        if not terms:
+            return []
+
+        language = processed.language
+        if document_id is not None:
+            self.df_table.add_document(document_id, language, terms)
+
+        candidates = {term: count for term, count in terms.items()
+                      if ' ' not in term or count >= self.min_bigram_count}
+        document_count = self.df_table.document_count(language)
+        frequencies = self.df_table.frequencies(language, list(candidates))
+
+        def score(item: Tuple[str, int]) -> float:
+            term, count = item
+            idf = math.log((1 + document_count) / (1 + frequencies.get(term, 1))) + 1
+            return (1 + math.log(count)) * idf
+
+        # Eşit puanlarda metinde önce geçen terim önde kalır (nlargest kararlıdır)
+        top = heapq.nlargest(top_n, candidates.items(), key=score)
+        return [RankedTerm(term=term, score=round(score((term, count)), 4), count=count) for term, count in top]
+
+
+_default_df_table = None
+_default_extractor = None
+
+
+def get_df_table() -> DocumentFrequencyTable:
+    """VIDEOBITE_DF_PATH ve VIDEOBITE_DF_DISABLED ile yapılandırılan paylaşılan tabloyu döndürür"""
+    global _default_df_table
+    if _default_df_table is None:
+        _default_df_table = DocumentFrequencyTable(
+            path=os.getenv('VIDEOBITE_DF_PATH', DEFAULT_DF_PATH),
+            enabled=os.getenv('VIDEOBITE_DF_DISABLED', '') not in ('1', 'true'),
+        )
+    return _default_df_table
+
+
+def get_extractor() -> TermExtractor:
+    """Paylaşılan DF tablosunu kullanan çıkarıcıyı döndürür"""
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = TermExtractor(get_df_table())
+    return _default_extractor
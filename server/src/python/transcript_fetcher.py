@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite Transkript Çekici
+Transkript listesi, dil seçimi, çeviri ve indirme adımlarını tek bir bağlantı havuzu
+üzerinden yürütür. 429/5xx yanıtları ve bağlantı hataları jitter'lı üstel geri çekilme
+ile yeniden denenir; aynı sunucuya giden eşzamanlı istek sayısı sınırlandırılır.
+
+AsyncTranscriptFetcher birden fazla videonun transkriptini asyncio ile eşzamanlı çeker;
+böylece videolar arasındaki ağ gidiş-dönüşleri üst üste biner.
+"""
+
+import asyncio
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from youtube_transcript_api._transcripts import TranscriptListFetcher
+
+import instrumentation
+
+# Geçici kabul edilip yeniden denenen HTTP durum kodları
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class PooledSession(requests.Session):
+    """Keep-alive bağlantı havuzlu, yeniden denemeli ve sunucu başına eşzamanlılık sınırlı oturum
+
+    youtube_transcript_api'nin beklediği requests.Session arayüzünü korur; Data API
+    çağrıları ve transkript istekleri aynı havuzu paylaşabilir.
+    """
+
+    def __init__(self, pool_size: int = 16, per_host_limit: int = 8, max_retries: int = 4,
+                 backoff_base: float = 0.5, backoff_max: float = 8.0):
+        """
+        Args:
+            pool_size: Sunucu başına açık tutulacak en fazla bağlantı
+            per_host_limit: Aynı sunucuya aynı anda gönderilebilecek en fazla istek
+            max_retries: Bir istek için en fazla yeniden deneme sayısı
+            backoff_base: İlk yeniden denemeden önceki en uzun bekleme (saniye)
+            backoff_max: Bekleme süresinin üst sınırı (saniye)
+        """
+        super().__init__()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+        self.per_host_limit = per_host_limit
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_limits_lock = threading.Lock()
+
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._host_limits_lock:
+            semaphore = self._host_limits.get(host)
+            if semaphore is None:
+                semaphore = self._host_limits[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return semaphore
+
+    def backoff(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Yeniden denemeden önce beklenecek süreyi döndürür (tam jitter)
+
+        Sunucu sayısal bir Retry-After başlığı gönderdiyse o süreye uyulur.
+        """
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def request(self, method, url, *args, **kwargs):
+        semaphore = self._host_limit(url)
+        attempt = 0
+        while True:
+            response = None
+            try:
+                with semaphore:
+                    response = super().request(method, url, *args, **kwargs)
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+                response.close()
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+
+            # Semafor bekleme öncesinde bırakıldı; sunucu kotası diğer isteklere kalır
+            instrumentation.count('retries')
+            time.sleep(self.backoff(attempt, response))
+            attempt += 1
+
+
+def fetch_transcript(session: requests.Session, video_id: str, language: str = 'tr') -> Tuple[List[dict], str]:
+    """Tek bir videonun transkriptini verilen oturumla çeker
+
+    İstenen dil yoksa İngilizce transkript çevrilir; o da olmazsa mevcut ilk transkript kullanılır.
+
+    Args:
+        session: Bağlantı havuzu olarak kullanılacak oturum
+        video_id: YouTube video ID'si
+        language: İstenen transkript dili
+
+    Returns:
+        (segmentler, transkriptin gerçek dil kodu)
+    """
+    with instrumentation.stage('transcript.list'):
+        transcript_list = TranscriptListFetcher(session).fetch(video_id)
+
+    # Belirtilen dilde transkript var mı kontrol et
+    try:
+        transcript = transcript_list.find_transcript([language])
+    except Exception:
+        # Belirtilen dilde transkript yoksa, mevcut transkriptlerden birini al ve çevir
+        try:
+            transcript = transcript_list.find_transcript(['en'])
+            transcript = transcript.translate(language)
+        except Exception as e:
+            print(f"Transkript çevirisi yapılamadı: {str(e)}", file=sys.stderr)
+            # Çeviri yapılamazsa mevcut dilde devam et
+            available_transcripts = list(transcript_list)
+            if not available_transcripts:
+                raise Exception("Hiç transkript bulunamadı")
+            transcript = available_transcripts[0]
+
+    with instrumentation.stage('transcript.fetch'):
+        segments = transcript.fetch()
+    return segments, transcript.language_code
+
+
+class AsyncTranscriptFetcher:
+    """Birden fazla videonun transkriptini paylaşılan oturumla eşzamanlı çeker"""
+
+    def __init__(self, session: Optional[requests.Session] = None, concurrency: int = 8):
+        """
+        Args:
+            session: Paylaşılacak oturum (verilmezse PooledSession oluşturulur)
+            concurrency: Aynı anda işlenen en fazla video
+        """
+        self.session = session if session is not None else PooledSession()
+        self.concurrency = max(1, concurrency)
+
+    async def fetch(self, video_id: str, language: str = 'tr', rate_limiter=None) -> Tuple[List[dict], str]:
+        """Tek bir videonun transkriptini çeker; hata durumunda istisna fırlatır"""
+        loop = asyncio.get_running_loop()
+        if rate_limiter is not None:
+            await loop.run_in_executor(None, instrumentation.propagate(rate_limiter.acquire))
+        # HTTP istemcisi bloklayıcı olduğundan çağrı havuzdaki bir thread'de yürür
+        return await loop.run_in_executor(
+            None, instrumentation.propagate(fetch_transcript), self.session, video_id, language
+        )
+
+    async def fetch_all(self, video_ids: Iterable[str], language: str = 'tr', rate_limiter=None,
+                        concurrency: Optional[int] = None) -> Dict[str, Union[Tuple[List[dict], str], Exception]]:
+        """Videoların transkriptlerini eşzamanlı çeker
+
+        Args:
+            video_ids: Transkripti çekilecek video ID'leri
+            language: İstenen transkript dili
+            rate_limiter: Her video öncesi acquire() çağrılacak hız sınırlayıcı
+            concurrency: Bu çağrı için eşzamanlılık (verilmezse self.concurrency)
+
+        Returns:
+            video_id -> (segmentler, dil kodu) veya hata nesnesi
+        """
+        limit = asyncio.Semaphore(max(1, concurrency or self.concurrency))
+
+        async def run(video_id):
+            async with limit:
+                return await self.fetch(video_id, language, rate_limiter)
+
+        video_ids = list(dict.fromkeys(video_ids))
+        outcomes = await asyncio.gather(*(run(video_id) for video_id in video_ids), return_exceptions=True)
+        return dict(zip(video_ids, outcomes))
+
+    def fetch_many(self, video_ids: Iterable[str], language: str = 'tr', rate_limiter=None,
+                   concurrency: Optional[int] = None) -> Dict[str, Union[Tuple[List[dict], str], Exception]]:
+        """fetch_all'ın senkron kodu için sarmalayıcısı; kendi olay döngüsünü çalıştırır"""
+        video_ids = list(video_ids)
+        if not video_ids:
+            return {}
+
+        async def run():
+            # Varsayılan executor'ı eşzamanlılığa göre boyutlandır
+            loop = asyncio.get_running_loop()
+            loop.set_default_executor(ThreadPoolExecutor(max_workers=max(1, concurrency or self.concurrency)))
+            return await self.fetch_all(video_ids, language, rate_limiter, concurrency)
+
+        return asyncio.run(run())
@@ -4,18 +4,62 @@
 import json
 import argparse
 import sys
+import io
 import re
 import os
-import requests
+import math
 from typing import Dict, List, Any
 from dotenv import load_dotenv
 import time
-from youtube_transcript_api import YouTubeTranscriptApi
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from youtube_transcript_api.formatters import TextFormatter
+from rate_limiter import TokenBucket
+from cache import get_cache
+from transcript_fetcher import AsyncTranscriptFetcher, PooledSession, fetch_transcript
+import instrumentation
+from data_pipeline import TranscriptProcessor
+from summarizer import ExtractiveSummarizer
+from chunked_summarizer import ChunkedSummarizer, get_backend
+from fingerprint import compute_fingerprint, get_index as get_fingerprint_index
+from sync_state import get_sync_state
+from result_store import get_result_store
+from search_index import get_search_index
+from single_flight import SingleFlight
+from scheduler import BATCH, INTERACTIVE, PRIORITIES, JobScheduler, SchedulerOverloaded
 
 # .env dosyasından API anahtarını yükle
 load_dotenv()
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
+YOUTUBE_API_BASE_URL = os.getenv("YOUTUBE_API_BASE_URL", "https://www.googleapis.com/youtube/v3")
+
+# Transkript işleme ve yerel özetleme (worker modunda süreç boyunca tekrar kullanılır)
+transcript_processor = TranscriptProcessor()
+extractive_summarizer = ExtractiveSummarizer()
+
+# --summary_backend verildiğinde özet metni map-reduce ile bu özetleyiciden alınır
+chunked_summarizer = None
+
+# videos.list tek çağrıda en fazla 50 ID kabul eder
+VIDEOS_LIST_BATCH_SIZE = 50
+
+# Data API ve transkript istekleri için bağlantı havuzlu, yeniden denemeli tek oturum
+http_session = PooledSession(pool_size=16, per_host_limit=8)
+http_session.hooks['response'].append(
+    lambda response, *args, **kwargs: instrumentation.count('bytes_fetched', len(response.content))
+)
+
+# Kanal işlemede transkriptleri eşzamanlı çeken motor
+transcript_fetcher = AsyncTranscriptFetcher(http_session)
+
+# --metrics_file verildiğinde ölçümlerin yazılacağı hedef
+metrics_sink = None
+
+# Worker'da aynı (video, dil) için eşzamanlı istekler tek bir özetlemeyi paylaşır
+summary_flights = SingleFlight()
+
+# Worker modunda işleri öncelik ve adalete göre çalıştıran zamanlayıcı (main'de kurulur)
+job_scheduler = None
 
 def extract_video_id(url):
     """YouTube URL'sinden video ID'sini çıkarır."""
@@ -23,10 +67,13 @@ def extract_video_id(url):
     match = re.search(pattern, url)
     return match.group(1) if match else None
 
-def get_channel_videos(channel_id=None, max_results=10):
+def get_channel_videos(channel_id=None, max_results=10, rate_limiter=None, stop_at=None, skip=None):
     """
     Belirtilen kanal ID'si için en son videoları çeker.
     Channel ID verilmezse, URL'den ID çıkarma işlemi yapılır.
+    rate_limiter verilirse sayfa istekleri onunla sınırlandırılır.
+    stop_at verilirse, True döndürdüğü ilk videoda (ör. son senkronizasyondan eski) sayfalama durur.
+    skip verilirse True döndürdüğü videolar (ör. daha önce işlenmiş) listeye alınmaz, sayfalama sürer.
     """
     if not YOUTUBE_API_KEY:
         print("Hata: YOUTUBE_API_KEY bulunamadı. Lütfen .env dosyasını kontrol edin.", file=sys.stderr)
@@ -36,24 +83,29 @@ def get_channel_videos(channel_id=None, max_results=10):
         print("Kanal ID'si belirtilmedi. Sadece tek video için işlem yapılıyor.")
         return []
     
-    url = 'https://www.googleapis.com/youtube/v3/search'
+    url = f"{YOUTUBE_API_BASE_URL}/search"
     video_records = []
     page_token = None
+    reached_seen = False
     
     try:
         # Sayfalama ile videoları çekelim
-        while len(video_records) < max_results:
+        while len(video_records) < max_results and not reached_seen:
             params = {
                 "key": YOUTUBE_API_KEY,
                 "channelId": channel_id,
                 "part": ["snippet", "id"],
                 "order": "date",
-                "maxResults": min(50, max_results - len(video_records)),
+                # Atlanan videolar sayılmadığından skip ile tam sayfalar istenir
+                "maxResults": 50 if skip is not None else min(50, max_results - len(video_records)),
                 "pageToken": page_token
             }
             
-            response = requests.get(url, params=params)
-            response_data = response.json()
+            if rate_limiter:
+                rate_limiter.acquire()
+            with instrumentation.stage('youtube_api.search'):
+                response = http_session.get(url, params=params)
+                response_data = response.json()
             
             if 'items' not in response_data:
                 break
@@ -68,16 +120,25 @@ def get_channel_videos(channel_id=None, max_results=10):
                     'published_at': item['snippet']['publishedAt'],
                     'channel_title': item['snippet']['channelTitle']
                 }
+                # Sonuçlar yeniden eskiye sıralı; görülmüş ilk videodan sonrası da görülmüştür
+                if stop_at is not None and stop_at(video_record):
+                    reached_seen = True
+                    break
+                if skip is not None and skip(video_record):
+                    continue
                 video_records.append(video_record)
+                if len(video_records) >= max_results:
+                    break
             
             # Bir sonraki sayfa için token varsa devam et
-            if 'nextPageToken' in response_data and len(video_records) < max_results:
+            if 'nextPageToken' in response_data and len(video_records) < max_results and not reached_seen:
                 page_token = response_data['nextPageToken']
             else:
                 break
-                
-            # API limitlerini aşmamak için kısa bir bekleme
-            time.sleep(0.1)
+            
+            # Sınırlayıcı yoksa API limitlerini aşmamak için kısa bir bekleme
+            if not rate_limiter:
+                time.sleep(0.1)
                 
         return video_records
         
@@ -85,81 +146,259 @@ def get_channel_videos(channel_id=None, max_results=10):
         print(f"Kanal videoları alınırken hata: {str(e)}", file=sys.stderr)
         return []
 
+def parse_video_item(video_data):
+    """videos.list yanıtındaki tek bir öğeyi video detayları sözlüğüne dönüştürür."""
+    snippet = video_data['snippet']
+    
+    return {
+        'title': snippet['title'],
+        'channel_title': snippet['channelTitle'],
+        'description': snippet['description'],
+        'published_at': snippet['publishedAt'],
+        'tags': snippet.get('tags', []),
+        'category_id': snippet.get('categoryId', ''),
+        'duration': video_data['contentDetails'].get('duration', ''),
+        'view_count': video_data['statistics'].get('viewCount', '0'),
+        'like_count': video_data['statistics'].get('likeCount', '0')
+    }
+
 def get_video_details(video_id):
     """YouTube Data API v3 kullanarak video detaylarını alır."""
     if not YOUTUBE_API_KEY:
         print("Hata: YOUTUBE_API_KEY bulunamadı. Lütfen .env dosyasını kontrol edin.", file=sys.stderr)
         sys.exit(1)
+    
+    cache = get_cache()
+    cached = cache.get('details', video_id)
+    if cached is not None:
+        return cached
         
-    url = f"https://www.googleapis.com/youtube/v3/videos?part=snippet,contentDetails,statistics&id={video_id}&key={YOUTUBE_API_KEY}"
+    params = {
+        "part": "snippet,contentDetails,statistics",
+        "id": video_id,
+        "key": YOUTUBE_API_KEY
+    }
     
     try:
-        response = requests.get(url)
-        data = response.json()
+        with instrumentation.stage('youtube_api.videos'):
+            response = http_session.get(f"{YOUTUBE_API_BASE_URL}/videos", params=params)
+            data = response.json()
         
         if not data.get('items'):
             print(f"Hata: Video bulunamadı (ID: {video_id})", file=sys.stderr)
             sys.exit(1)
             
-        video_data = data['items'][0]
-        snippet = video_data['snippet']
-        
-        return {
-            'title': snippet['title'],
-            'channel_title': snippet['channelTitle'],
-            'description': snippet['description'],
-            'published_at': snippet['publishedAt'],
-            'tags': snippet.get('tags', []),
-            'category_id': snippet.get('categoryId', ''),
-            'duration': video_data['contentDetails'].get('duration', ''),
-            'view_count': video_data['statistics'].get('viewCount', '0'),
-            'like_count': video_data['statistics'].get('likeCount', '0')
-        }
+        video_details = parse_video_item(data['items'][0])
+        cache.set('details', video_id, video_details)
+        return video_details
     except Exception as e:
         print(f"Hata: Video detayları alınırken bir sorun oluştu: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
-def get_video_transcript(video_id, language='tr'):
-    """Video transkriptini çeker."""
-    try:
-        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+def get_videos_details(video_ids, rate_limiter=None):
+    """
+    Birden fazla videonun detaylarını ceil(N/50) videos.list çağrısıyla alır.
+    Video ID'sinden detaylara bir sözlük döndürür; bulunamayan videolar sözlükte yer almaz.
+    """
+    if not YOUTUBE_API_KEY:
+        print("Hata: YOUTUBE_API_KEY bulunamadı. Lütfen .env dosyasını kontrol edin.", file=sys.stderr)
+        sys.exit(1)
+    
+    cache = get_cache()
+    details = {}
+    unique_ids = []
+    for video_id in dict.fromkeys(video_ids):
+        cached = cache.get('details', video_id)
+        if cached is not None:
+            details[video_id] = cached
+        else:
+            unique_ids.append(video_id)
+    
+    for batch_index in range(math.ceil(len(unique_ids) / VIDEOS_LIST_BATCH_SIZE)):
+        batch = unique_ids[batch_index * VIDEOS_LIST_BATCH_SIZE:(batch_index + 1) * VIDEOS_LIST_BATCH_SIZE]
+        params = {
+            "part": "snippet,contentDetails,statistics",
+            "id": ",".join(batch),
+            "key": YOUTUBE_API_KEY,
+            "maxResults": VIDEOS_LIST_BATCH_SIZE
+        }
         
-        # Belirtilen dilde transkript var mı kontrol et
         try:
-            transcript = transcript_list.find_transcript([language])
-        except:
-            # Belirtilen dilde transkript yoksa, mevcut transkriptlerden birini al ve çevir
-            try:
-                transcript = transcript_list.find_transcript(['en'])
-                transcript = transcript.translate(language)
-            except Exception as e:
-                print(f"Transkript çevirisi yapılamadı: {str(e)}", file=sys.stderr)
-                # Çeviri yapılamazsa mevcut dilde devam et
-                available_transcripts = list(transcript_list._transcripts.keys())
-                if available_transcripts:
-                    transcript = transcript_list.find_transcript([available_transcripts[0]])
-                else:
-                    raise Exception("Hiç transkript bulunamadı")
-        
-        formatter = TextFormatter()
-        transcript_json = transcript.fetch()
-        transcript_text = formatter.format_transcript(transcript_json)
-        
-        return {
-            "text": transcript_text,
-            "segments": transcript_json
-        }
+            if rate_limiter:
+                rate_limiter.acquire()
+            with instrumentation.stage('youtube_api.videos'):
+                response = http_session.get(f"{YOUTUBE_API_BASE_URL}/videos", params=params)
+                data = response.json()
+            
+            for item in data.get('items', []):
+                details[item['id']] = parse_video_item(item)
+                cache.set('details', item['id'], details[item['id']])
+        except Exception as e:
+            print(f"Video detayları toplu alınırken hata: {str(e)}", file=sys.stderr)
+    
+    return details
+
+def transcript_result(segments):
+    """Transkript segmentlerini metin ve segment listesi içeren sözlüğe çevirir."""
+    return {
+        "text": TextFormatter().format_transcript(segments),
+        "segments": segments
+    }
+
+def get_video_transcript(video_id, language='tr'):
+    """Video transkriptini çeker. İstenen dildeki transkriptler önbellekten okunur."""
+    cache = get_cache()
+    cached_segments = cache.get('transcript', video_id, language)
+    if cached_segments is not None:
+        return transcript_result(cached_segments)
+    
+    try:
+        transcript_json, language_code = fetch_transcript(http_session, video_id, language)
     except Exception as e:
         print(f"Transkript alınırken hata: {str(e)}", file=sys.stderr)
         return {"text": "", "segments": []}
+    
+    # Yalnızca istenen dildeki (özgün veya çevrilmiş) transkriptleri sakla
+    if transcript_json and language_code == language:
+        cache.set('transcript', video_id, transcript_json, language)
+    
+    return transcript_result(transcript_json)
+
+def get_videos_transcripts(video_ids, language='tr', rate_limiter=None, concurrency=None):
+    """
+    Birden fazla videonun transkriptini eşzamanlı çeker.
+    Önbellekte olmayanlar tek olay döngüsünde birlikte istenir; video_id -> transkript döndürür.
+    """
+    cache = get_cache()
+    transcripts = {}
+    missing_ids = []
+    for video_id in video_ids:
+        cached_segments = cache.get('transcript', video_id, language)
+        if cached_segments is not None:
+            transcripts[video_id] = transcript_result(cached_segments)
+        else:
+            missing_ids.append(video_id)
+    
+    for video_id, outcome in transcript_fetcher.fetch_many(missing_ids, language, rate_limiter, concurrency).items():
+        if isinstance(outcome, Exception):
+            print(f"Transkript alınırken hata ({video_id}): {str(outcome)}", file=sys.stderr)
+            transcripts[video_id] = {"text": "", "segments": []}
+            continue
+        
+        transcript_json, language_code = outcome
+        if transcript_json and language_code == language:
+            cache.set('transcript', video_id, transcript_json, language)
+        transcripts[video_id] = transcript_result(transcript_json)
+    
+    return transcripts
 
-def generate_summary(video_details, transcript):
-    """Video detayları ve transkripte göre özet oluşturur."""
+def summary_variant(language):
+    """Farklı özet arka uçlarının sonuçları birbirinin yerine kullanılmasın diye dil ve arka ucu birleştirir."""
+    return language if chunked_summarizer is None else f"{language}:{chunked_summarizer.backend.name}"
+
+def build_highlights(processed, entries):
+    """
+    (tür, cümle indeksi) çiftlerini bu videonun zaman aralıklarıyla vurgulara çevirir.
+    """
+    highlights = []
+    time_index = transcript_processor.time_index(processed)
+    for kind, index in entries:
+        start, end = time_index.sentence_time(index)
+        highlights.append({
+            "type": kind,
+            "text": processed.sentences[index],
+            "start": round(start, 2),
+            "end": round(end, 2)
+        })
+    return highlights
+
+def summarize_transcript(processed, video_id=None, language=''):
+    """
+    İşlenmiş transkriptten özet, anahtar nokta cümleleri ve zaman damgalı vurgular üretir.
+    Aynı veya çok benzer bir transkript daha önce özetlendiyse (yeniden yükleme, derleme)
+    o sonuç parmak izi indeksinden yeniden kullanılır.
+    """
+    fingerprint_index = get_fingerprint_index()
+    variant = summary_variant(language)
+    fingerprint = None
+    if video_id and fingerprint_index.enabled:
+        with instrumentation.stage('dedup'):
+            fingerprint = compute_fingerprint(processed)
+            duplicate = fingerprint_index.find(fingerprint, variant, exclude_video_id=video_id)
+        if duplicate is not None:
+            duplicate_id, similarity, payload = duplicate
+            instrumentation.count('dedup_hits')
+            # Özet ve anahtar noktalar yeniden kullanılır; vurguların zamanları diğer videoya ait
+            # olduğundan cümleler bu transkriptte yeniden bulunur, bulunamayanlar atlanır
+            positions = {}
+            for index, sentence in enumerate(processed.sentences):
+                positions.setdefault(sentence, index)
+            entries = [
+                (highlight["type"], positions[highlight["text"]])
+                for highlight in payload.get("highlights", []) if highlight["text"] in positions
+            ]
+            return {
+                "summary": payload["summary"],
+                "keyPoints": payload["keyPoints"],
+                "highlights": build_highlights(processed, entries),
+                "duplicateOf": {"videoId": duplicate_id, "similarity": round(similarity, 3)}
+            }
+    
+    with instrumentation.stage('summarize'):
+        summary_indices, key_point_indices = extractive_summarizer.summarize_indices(processed, 5, 5)
+    summary = ' '.join(processed.sentences[index] for index in summary_indices)
+    if chunked_summarizer is not None:
+        # Uzun transkriptler bağlam penceresine sığan parçalar halinde özetlenir
+        chunked_summary = chunked_summarizer.summarize(processed).summary
+        if chunked_summary:
+            summary = chunked_summary
+            # Birleştirilmiş özet transkript cümlelerinden oluşmaz; "summary" vurguları
+            # döndürülen özette olmayan cümlelere işaret ederdi
+            summary_indices = []
+    
+    # Özet ve anahtar nokta cümlelerini videodaki zaman aralıklarıyla eşle
+    highlights = build_highlights(
+        processed,
+        [("summary", index) for index in summary_indices] + [("keyPoint", index) for index in key_point_indices]
+    )
+    
+    result = {
+        "summary": summary,
+        "keyPoints": [processed.sentences[index] for index in key_point_indices],
+        "highlights": highlights
+    }
+    if fingerprint is not None and summary:
+        fingerprint_index.add(video_id, variant, fingerprint, result)
+    return result
+
+def generate_summary(video_details, transcript, video_id=None, language='', record=None):
+    """
+    Video detayları ve transkripte göre özet oluşturur.
+    video_id verilirse transkript kopya tespiti için parmak izi indeksine, sonuç ve
+    türetilmiş yapılar da sonuç deposuna kaydedilir. record (sonuç deposundan okunan
+    kayıt) verilirse transkript yeniden işlenmez; transcript bu durumda kullanılmaz.
+    """
     title = video_details['title']
     channel = video_details['channel_title']
     description = video_details['description']
     tags = video_details.get('tags', [])
-    transcript_text = transcript.get('text', '')
+    
+    # Transkripti cümlelere ayır ve en önemli cümleleri seç
+    transcript_key_points = []
+    highlights = []
+    duplicate_of = None
+    processed = None
+    transcript_summary = None
+    ranked_terms = None
+    if record is not None:
+        transcript_text = record.transcript_text
+        processed = record.processed
+        transcript_summary = record.transcript_summary
+        ranked_terms = record.ranked_terms
+    else:
+        transcript_text = transcript.get('text', '')
+        if transcript.get('segments'):
+            processed = transcript_processor.process(transcript['segments'])
     
     # Transkript yoksa açıklamadan özet oluştur
     if not transcript_text:
@@ -171,9 +410,20 @@ def generate_summary(video_details, transcript):
         else:
             summary = short_desc
     else:
-        # Transkriptten özet oluştur - şimdilik ilk birkaç cümleyi al
-        transcript_sentences = transcript_text.split('.')
-        summary = '.'.join(transcript_sentences[:min(5, len(transcript_sentences))]) + '.'
+        # Transkriptten çıkarımsal özet oluştur (TF-IDF ile puanlanan en önemli 5 cümle)
+        summary = ''
+        if processed:
+            if transcript_summary is None:
+                transcript_summary = summarize_transcript(processed, video_id, language)
+            summary = transcript_summary["summary"]
+            transcript_key_points = transcript_summary["keyPoints"]
+            highlights = transcript_summary["highlights"]
+            duplicate_of = transcript_summary.get("duplicateOf")
+            if not summary:
+                summary = ' '.join(processed.sentences[:5])
+        if not summary:
+            transcript_sentences = transcript_text.split('.')
+            summary = '.'.join(transcript_sentences[:min(5, len(transcript_sentences))]) + '.'
         
         # Özet çok kısaysa genel bir bilgi ekle
         if len(summary) < 100:
@@ -193,12 +443,9 @@ def generate_summary(video_details, transcript):
         if len(para) > 30:
             key_points.append(para.strip())
     
-    # Transkriptten anahtar noktalar çıkar
-    if transcript_text:
-        transcript_parts = transcript_text.split('.')
-        for i in range(0, len(transcript_parts), len(transcript_parts) // 5):
-            if i < len(transcript_parts) and transcript_parts[i] and len(transcript_parts[i]) > 30:
-                key_points.append(transcript_parts[i].strip() + '.')
+    # Transkriptten anahtar noktalar çıkar (özette kullanılmayan en önemli cümleler)
+    for point in transcript_key_points:
+        key_points.append(point)
     
     # İzlenme ve beğeni sayılarını ekle
     if int(video_details['view_count']) > 1000:
@@ -249,12 +496,450 @@ def generate_summary(video_details, transcript):
                 if len(important_terms) >= 5:
                     break
     
-    return {
+    # Yer kalırsa transkripte özgü terimleri (derlem genelinde TF-IDF) ekle
+    if processed:
+        if ranked_terms is None:
+            ranked_terms = processed.ranked_terms(document_id=video_id)
+        for ranked in ranked_terms:
+            if len(important_terms) >= 5:
+                break
+            if ranked.term not in [existing.lower() for existing in important_terms.keys()]:
+                important_terms[ranked.term] = f"Transkriptte {ranked.count} kez geçen bir terim"
+    
+    result = {
         "summary": summary,
         "keyPoints": key_points,
         "importantTerms": important_terms,
+        "highlights": highlights,
         "transcript": transcript_text[:500] + "..." if len(transcript_text) > 500 else transcript_text
     }
+    if duplicate_of:
+        result["duplicateOf"] = duplicate_of
+    
+    # Transkripti olmayan videolar saklanmaz; altyazı sonradan eklenebilir
+    if video_id and processed:
+        store = get_result_store()
+        stored_result = dict(result, title=title, channelTitle=channel)
+        if record is None:
+            store.put(video_id, summary_variant(language), stored_result, transcript_text,
+                      processed, transcript_summary, ranked_terms)
+        elif record.result != stored_result:
+            # Yalnızca video detaylarından gelen kısımlar (izlenme, etiketler) değişti
+            store.update_result(video_id, summary_variant(language), stored_result)
+        # Zaten indeksli videolar atlanır; depodan gelen sonuçlar da indekste yoksa eklenir
+        get_search_index().add(video_id, processed)
+    return result
+
+def summarize_video(video_id, language='tr'):
+    """Tek bir video için özet sonucunu (tek video çıktı biçiminde) oluşturur."""
+    # YouTube API ile video detaylarını al
+    video_details = get_video_details(video_id)
+    
+    # Sonuç depoda varsa transkript alınmaz ve yeniden işlenmez
+    record = get_result_store().get(video_id, summary_variant(language))
+    transcript = get_video_transcript(video_id, language) if record is None else None
+    
+    # Video detaylarına göre özet oluştur
+    summary_result = generate_summary(video_details, transcript, video_id, language, record)
+    get_search_index().flush()
+    return video_result(video_id, video_details['title'], video_details['channel_title'], summary_result)
+
+def summarize_video_shared(video_id, language='tr'):
+    """
+    summarize_video'yu aynı (video, dil) için süren bir özetleme varsa onunla birleştirerek çalıştırır.
+    Bekleyen istekler detay, transkript veya özet için ayrı istek yapmaz; aynı sonucu alır.
+    """
+    result, _ = summary_flights.do((video_id, language), summarize_video, video_id, language)
+    return result
+
+def video_result(video_id, title, channel_title, summary_result):
+    """generate_summary çıktısını tek video çıktı biçimine çevirir."""
+    result = {
+        "videoId": video_id,
+        "title": title,
+        "channelTitle": channel_title,
+        "summary": summary_result["summary"],
+        "keyPoints": summary_result["keyPoints"],
+        "importantTerms": summary_result["importantTerms"],
+        "highlights": summary_result["highlights"],
+        "transcriptExcerpt": summary_result["transcript"]
+    }
+    if "duplicateOf" in summary_result:
+        result["duplicateOf"] = summary_result["duplicateOf"]
+    return result
+
+def stored_summaries(video_ids, language='tr'):
+    """
+    Sonuç deposundaki özetleri tek sorguda, tek video çıktı biçiminde döndürür.
+    Depoda olmayan videolar atlanır; hiçbir ağ isteği veya yeniden işleme yapılmaz.
+    """
+    stored = get_result_store().get_many(list(video_ids), summary_variant(language))
+    return [
+        video_result(video_id, stored[video_id]["title"], stored[video_id]["channelTitle"], stored[video_id])
+        for video_id in video_ids if video_id in stored
+    ]
+
+def search_transcripts(query, limit=10, language='tr'):
+    """
+    Transkript arama indeksinde sorguyu BM25 ile arar; her sonuç eşleşen segmentlerin
+    başlangıç zamanlarını içerir. Başlıklar sonuç deposundan tek sorguda eklenir.
+    """
+    hits = get_search_index().search(query, limit)
+    stored = get_result_store().get_many([hit.video_id for hit in hits], summary_variant(language))
+    results = []
+    for hit in hits:
+        result = {
+            "videoId": hit.video_id,
+            "score": hit.score,
+            "segments": [
+                {"index": segment.index, "start": segment.start, "matches": segment.matches}
+                for segment in hit.segments
+            ]
+        }
+        if hit.video_id in stored:
+            result["title"] = stored[hit.video_id]["title"]
+            result["channelTitle"] = stored[hit.video_id]["channelTitle"]
+        results.append(result)
+    return results
+
+def summarize_channel_video(video, language='tr', rate_limiter=None, video_details=None, transcript=None):
+    """
+    Kanal listesindeki tek bir videoyu işler; hata durumunda None döndürür.
+    video_details veya transcript önceden toplu olarak alındıysa tekrar istek yapılmaz.
+    """
+    video_id = video['video_id']
+    try:
+        # Video detaylarını al
+        if video_details is None:
+            if rate_limiter:
+                rate_limiter.acquire()
+            video_details = get_video_details(video_id)
+        # Sonuç depoda yoksa transkript al
+        record = get_result_store().get(video_id, summary_variant(language))
+        if record is None and transcript is None:
+            if rate_limiter:
+                rate_limiter.acquire()
+            transcript = get_video_transcript(video_id, language)
+        # Özet oluştur
+        summary_result = generate_summary(video_details, transcript, video_id, language, record)
+        
+        # Video bilgilerini ekle
+        result = {
+            "video_id": video_id,
+            "title": video_details['title'],
+            "channel_title": video_details['channel_title'],
+            "summary": summary_result["summary"],
+            "keyPoints": summary_result["keyPoints"],
+            "importantTerms": summary_result["importantTerms"],
+            "highlights": summary_result["highlights"],
+            "transcript_excerpt": summary_result["transcript"]
+        }
+        if "duplicateOf" in summary_result:
+            result["duplicate_of"] = summary_result["duplicateOf"]
+        return result
+    except Exception as e:
+        print(f"Video işlenirken hata ({video_id}): {str(e)}", file=sys.stderr)
+        return None
+
+def iter_channel(channel_id, max_videos=10, language='tr', workers=4, rate_limit=4.0, since_last_run=False):
+    """
+    Kanalın son videolarını en fazla `workers` eşzamanlı iş ile işler ve her video
+    tamamlandığı anda bir olay üretir (tamamlanma sırasıyla, liste sırasıyla değil).
+    API çağrıları saniyede `rate_limit` istekle sınırlandırılır.
+    since_last_run verilirse sayfalama son senkronizasyon sınırından (son işlenen yayın zamanı)
+    eski ilk videoda durur, daha önce işlenmiş videolar atlanır ve yalnızca yeni yüklemeler
+    özetlenir; önceki çalıştırmalarda başarısız olan videolar `max_videos` sınırına kadar
+    yenilerin ardından yeniden denenir. Başarılı ve başarısız videolar tüm olaylar
+    tüketildiğinde kaydedilir. Sınır yalnızca liste ona ulaştıysa ilerletilir; `max_videos`
+    yeni yüklemelerin tamamına yetmediyse kalanlar bir sonraki çalıştırmada işlenir.
+    
+    Olaylar:
+        {"type": "start", "channel_id": ..., "total": N}
+        {"type": "result", "index": i, "completed": k, "total": N, "video": {...}}
+        {"type": "error", "index": i, "completed": k, "total": N, "video_id": ..., "error": "..."}
+        {"type": "done", "total": N, "succeeded": s, "failed": f}
+    """
+    workers = max(1, workers)
+    rate_limiter = TokenBucket(rate_limit, capacity=workers)
+    sync_state = get_sync_state()
+    # ISO 8601 zaman damgaları metin olarak doğru sıralanır
+    boundary = (sync_state.get(channel_id) or {}).get("last_published_at") or ''
+    # İlk senkronizasyonda liste başlangıç noktasıdır; sonrakilerde sınır, aradaki tüm
+    # yüklemeler listelendiyse ilerletilir
+    reached_boundary = [not boundary]
+    
+    def older_than_boundary(video):
+        if (video['published_at'] or '') < boundary:
+            reached_boundary[0] = True
+            return True
+        return False
+    
+    if since_last_run:
+        # İşlenmiş videolar durdurmaz, atlanır: önceki çalıştırma max_videos'ta kesildiyse
+        # işlenen en yeni yüklemeler listenin başındadır ve kalanlar onların ardından gelir
+        videos = get_channel_videos(
+            channel_id, max_videos, rate_limiter, older_than_boundary,
+            lambda video: sync_state.is_processed(channel_id, video['video_id'])
+        )
+    else:
+        videos = get_channel_videos(channel_id, max_videos, rate_limiter)
+        reached_boundary[0] = reached_boundary[0] or any(
+            (video['published_at'] or '') <= boundary for video in videos
+        )
+    if since_last_run:
+        # Sayfalama sınırın gerisinde kalan başarısız videolara ulaşmaz; bunlar kayıttan eklenir
+        listed = {video['video_id'] for video in videos}
+        retries = [video for video in sync_state.failed_videos(channel_id) if video['video_id'] not in listed]
+        videos += retries[:max(0, max_videos - len(videos))]
+    total = len(videos)
+    yield {"type": "start", "channel_id": channel_id, "total": total}
+    if not videos:
+        # Yeni video yoksa da liste sınıra ulaştıysa sınır ilerletilir
+        sync_state.mark_processed(channel_id, [], advance=reached_boundary[0])
+        yield {"type": "done", "total": 0, "succeeded": 0, "failed": 0}
+        return
+    
+    # Tüm detayları tek tek değil, 50'lik gruplar halinde al
+    details_by_id = get_videos_details([video['video_id'] for video in videos], rate_limiter)
+    
+    # Sonucu depoda olan videoların transkriptleri çekilmez (tek sorguda kontrol edilir)
+    stored = get_result_store().get_many(list(details_by_id), summary_variant(language))
+    
+    # Transkriptleri eşzamanlı çek; videolar arasındaki gidiş-dönüşler üst üste biner
+    transcripts_by_id = get_videos_transcripts(
+        [video_id for video_id in details_by_id if video_id not in stored], language, rate_limiter, workers
+    )
+    
+    def process(video):
+        video_details = details_by_id.get(video['video_id'])
+        if video_details is None:
+            print(f"Hata: Video bulunamadı (ID: {video['video_id']})", file=sys.stderr)
+            return None
+        return summarize_channel_video(
+            video, language, rate_limiter, video_details, transcripts_by_id.get(video['video_id'])
+        )
+    
+    succeeded = []
+    completed = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(instrumentation.propagate(process), video): index
+            for index, video in enumerate(videos)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            completed += 1
+            result = future.result()
+            if result is None:
+                yield {
+                    "type": "error", "index": index, "completed": completed, "total": total,
+                    "video_id": videos[index]['video_id'], "error": "Video işlenemedi (ayrıntılar stderr'de)"
+                }
+                continue
+            succeeded.append(videos[index])
+            yield {"type": "result", "index": index, "completed": completed, "total": total, "video": result}
+    
+    # Kanaldaki yeni transkriptler tek parça olarak yazılır
+    get_search_index().flush()
+    
+    # Başarısız videolar ayrıca kaydedilir; bir sonraki --since_last_run çalıştırmasında yeniden denenir
+    succeeded_ids = {video['video_id'] for video in succeeded}
+    sync_state.mark_failed(channel_id, [video for video in videos if video['video_id'] not in succeeded_ids])
+    sync_state.mark_processed(channel_id, succeeded, advance=reached_boundary[0])
+    yield {"type": "done", "total": total, "succeeded": len(succeeded), "failed": total - len(succeeded)}
+
+def process_channel(channel_id, max_videos=10, language='tr', workers=4, rate_limit=4.0, since_last_run=False):
+    """
+    Kanalın son videolarını işler (bkz. iter_channel).
+    Sonuçlar kanal listesindeki sırayla döndürülür.
+    """
+    results = {}
+    for event in iter_channel(channel_id, max_videos, language, workers, rate_limit, since_last_run):
+        if event["type"] == "result":
+            results[event["index"]] = event["video"]
+    return [results[index] for index in sorted(results)]
+
+def stream_channel(out, channel_id, max_videos=10, language='tr', workers=4, rate_limit=4.0, since_last_run=False):
+    """
+    Kanal olaylarını (bkz. iter_channel) tamamlandıkça `out` akışına satır satır JSON
+    (NDJSON) olarak yazar ve her satırdan sonra boşaltır. Başarılı video sayısını döndürür.
+    """
+    succeeded = 0
+    for event in iter_channel(channel_id, max_videos, language, workers, rate_limit, since_last_run):
+        if event["type"] == "done":
+            succeeded = event["succeeded"]
+        out.write(json.dumps(event, ensure_ascii=False) + "\n")
+        out.flush()
+    return succeeded
+
+def run_instrumented(timings, labels, function, *args):
+    """
+    Fonksiyonu ölçümleme etkinse bir Recorder ile çalıştırır.
+    (sonuç, zamanlama bloğu) döndürür; ölçümleme kapalıysa blok None'dır.
+    """
+    if not timings and metrics_sink is None:
+        return function(*args), None
+    
+    recorder = instrumentation.Recorder()
+    with instrumentation.recording(recorder):
+        with instrumentation.stage('total'):
+            result = function(*args)
+    snapshot = recorder.snapshot()
+    if metrics_sink is not None:
+        metrics_sink.record(snapshot, **labels)
+    return result, snapshot
+
+def handle_job(job, timings=False):
+    """
+    Worker modunda gelen tek bir işi çalıştırır.
+    
+    İş biçimi: {"id": ..., "url" | "video_id" | "channel_id" | "stored_video_ids" | "search": ..., "language": ...,
+    "max_videos": ..., "since_last_run": ..., "limit": ...}
+    "stored_video_ids" listesi için yalnızca sonuç deposundaki özetler döndürülür.
+    "search" sorgusu transkript arama indeksinde aranır ({"results": [...]}).
+    {"worker_stats": true} işi istek birleştirme ve zamanlayıcı sayaçlarını döndürür
+    ({"singleFlight": {...}, "scheduler": {...}}).
+    Aynı video için eşzamanlı tek video işleri tek bir özetlemede birleştirilir.
+    Yanıt biçimi: {"id": ..., "ok": true, "result": {...}} veya {"id": ..., "ok": false, "error": "..."}
+    İşte "timings": true verilirse (veya worker --timings ile başlatıldıysa) yanıta "timings" bloğu eklenir.
+    """
+    job_id = job.get('id')
+    language = job.get('language') or 'tr'
+    timings = bool(job.get('timings', timings))
+    try:
+        if job.get('worker_stats'):
+            result = {
+                "singleFlight": summary_flights.stats(),
+                "scheduler": job_scheduler.stats() if job_scheduler is not None else None
+            }
+            timing_block = None
+        elif job.get('stored_video_ids') is not None:
+            videos, timing_block = run_instrumented(
+                timings, {"job_id": job_id}, stored_summaries, job['stored_video_ids'], language
+            )
+            result = {"videos": videos}
+        elif job.get('search') is not None:
+            results, timing_block = run_instrumented(
+                timings, {"job_id": job_id}, search_transcripts, job['search'], int(job.get('limit', 10)), language
+            )
+            result = {"results": results}
+        elif job.get('channel_id'):
+            videos, timing_block = run_instrumented(
+                timings,
+                {"job_id": job_id, "channel_id": job['channel_id']},
+                process_channel,
+                job['channel_id'],
+                int(job.get('max_videos', 10)),
+                language,
+                int(job.get('workers', 4)),
+                float(job.get('rate_limit', 4.0)),
+                bool(job.get('since_last_run', False))
+            )
+            result = {"videos": videos}
+        else:
+            video_id = job.get('video_id') or extract_video_id(job.get('url') or '')
+            if not video_id:
+                raise Exception("Geçerli bir YouTube video ID'si alınamadı.")
+            result, timing_block = run_instrumented(
+                timings, {"job_id": job_id, "video_id": video_id}, summarize_video_shared, video_id, language
+            )
+        
+        response = {"id": job_id, "ok": True, "result": result}
+        if timings:
+            response["timings"] = timing_block
+        return response
+    except SystemExit:
+        # Yardımcı fonksiyonlar CLI için sys.exit çağırıyor; worker bu durumda kapanmamalı
+        return {"id": job_id, "ok": False, "error": "İş tamamlanamadı (ayrıntılar stderr'de)"}
+    except Exception as e:
+        print(f"İş işlenirken hata ({job_id}): {str(e)}", file=sys.stderr)
+        return {"id": job_id, "ok": False, "error": str(e)}
+
+def job_priority(job):
+    """
+    İşin zamanlayıcı sınıfını ve adalet anahtarını döndürür.
+    Kanal çalıştırmaları kanal başına adil paylaşılan toplu işlerdir; diğerleri kullanıcı
+    ("user") başına adil paylaşılan etkileşimli işlerdir. "priority" alanı sınıfı değiştirir.
+    """
+    priority = job.get('priority')
+    if priority not in PRIORITIES:
+        priority = BATCH if job.get('channel_id') else INTERACTIVE
+    if priority == BATCH and job.get('channel_id'):
+        return priority, f"channel:{job['channel_id']}"
+    return priority, f"user:{job.get('user') or ''}"
+
+def serve(input_stream, output_stream, timings=False, scheduler=None):
+    """
+    Satır satır JSON işleri okur ve her biri için tek satırlık JSON yanıt yazar.
+    Süreç açık kaldığı sürece import'lar ve yüklenen veriler tekrar kullanılır.
+    scheduler verilirse işler öncelik sırasıyla eşzamanlı çalışır; yanıtlar tamamlanma
+    sırasıyla yazılır ve "id" alanıyla eşleştirilir. Verilmezse işler sırayla çalışır.
+    Akış bitince kuyruktaki işlerin tamamlanması beklenir.
+    """
+    write_lock = threading.Lock()
+    outstanding = threading.Condition()
+    pending = [0]
+    
+    def respond(response):
+        with write_lock:
+            output_stream.write(json.dumps(response, ensure_ascii=False) + "\n")
+            output_stream.flush()
+    
+    def run(job):
+        try:
+            respond(handle_job(job, timings))
+        finally:
+            with outstanding:
+                pending[0] -= 1
+                outstanding.notify_all()
+    
+    for line in input_stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+            if not isinstance(job, dict):
+                raise ValueError("İş bir JSON nesnesi olmalı")
+        except ValueError as e:
+            respond({"id": None, "ok": False, "error": f"Geçersiz iş: {str(e)}"})
+            continue
+        # İstatistik işleri kuyruğu beklemez; yük altında da yanıt verir
+        if scheduler is None or job.get('worker_stats'):
+            respond(handle_job(job, timings))
+            continue
+        
+        priority, key = job_priority(job)
+        with outstanding:
+            pending[0] += 1
+        try:
+            scheduler.submit(lambda job=job: run(job), priority, key)
+        except SchedulerOverloaded as e:
+            with outstanding:
+                pending[0] -= 1
+            respond({"id": job.get('id'), "ok": False, "error": str(e), "shed": True})
+    
+    with outstanding:
+        outstanding.wait_for(lambda: pending[0] == 0)
+
+def serve_unix_socket(socket_path, timings=False, scheduler=None):
+    """
+    Worker'ı bir Unix soketi üzerinden sunar; her bağlantı kendi iş akışına sahiptir.
+    Tüm bağlantılar aynı zamanlayıcıyı paylaşır, böylece öncelik ve adalet süreç geneldir.
+    """
+    import socketserver
+    
+    class JobHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            reader = io.TextIOWrapper(self.rfile, encoding='utf-8')
+            writer = io.TextIOWrapper(self.wfile, encoding='utf-8', write_through=True)
+            serve(reader, writer, timings, scheduler)
+    
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    with socketserver.ThreadingUnixStreamServer(socket_path, JobHandler) as server:
+        print(f"Worker dinleniyor: {socket_path}", file=sys.stderr)
+        server.serve_forever()
 
 def main():
     # Argüman parser ayarları
@@ -263,11 +948,78 @@ def main():
     parser.add_argument('--video_id', type=str, help='YouTube video ID\'si')
     parser.add_argument('--channel_id', type=str, help='YouTube kanal ID\'si')
     parser.add_argument('--max_videos', type=int, default=10, help='Kanaldan alınacak maksimum video sayısı')
+    parser.add_argument('--since_last_run', '--since-last-run', action='store_true', help='Kanalda yalnızca son çalıştırmadan sonra yüklenen videoları işle')
     parser.add_argument('--language', type=str, default='tr', help='Transkript dili (varsayılan: tr)')
     parser.add_argument('--title', type=str, default='', help='Video başlığı (opsiyonel)')
+    parser.add_argument('--workers', type=int, default=4, help='Kanal işlenirken eşzamanlı video sayısı (varsayılan: 4)')
+    parser.add_argument('--rate_limit', type=float, default=4.0, help='Saniyedeki maksimum YouTube isteği, 0 sınırsız (varsayılan: 4)')
+    parser.add_argument('--no_cache', action='store_true', help='Disk önbelleğini atla')
+    parser.add_argument('--no_result_store', action='store_true', help='Özet sonuç deposunu atla')
+    parser.add_argument('--no_search_index', action='store_true', help='Transkript arama indeksini güncelleme')
+    parser.add_argument('--no_dedup', action='store_true', help='Kopya/yakın kopya transkript tespitini atla')
+    parser.add_argument('--output_format', type=str, default='json', choices=['json', 'ndjson'], help='Kanal çıktısı: tek JSON belgesi veya her video tamamlandıkça satır satır JSON (varsayılan: json)')
+    parser.add_argument('--timings', action='store_true', help='JSON çıktısına aşama bazlı zamanlama bloğu ekle')
+    parser.add_argument('--metrics_file', type=str, default='', help='Ölçümlerin yazılacağı dosya')
+    parser.add_argument('--metrics_format', type=str, default='jsonl', choices=['jsonl', 'prom'], help='Ölçüm dosyası biçimi (varsayılan: jsonl)')
+    parser.add_argument('--summary_backend', type=str, default='extractive', choices=['extractive', 'local', 'openai'], help='Özet metni için arka uç; extractive dışındakiler map-reduce ile parça parça özetler (varsayılan: extractive)')
+    parser.add_argument('--max_chunk_tokens', type=int, default=3000, help='Map-reduce özetlemede parça başına token bütçesi (varsayılan: 3000)')
+    parser.add_argument('--serve', action='store_true', help='Kalıcı worker modu: stdin\'den satır satır JSON iş okur')
+    parser.add_argument('--serve_concurrency', type=int, default=8, help='Worker modunda eşzamanlı çalışan iş sayısı, 1 sıralı ve zamanlayıcısız (varsayılan: 8)')
+    parser.add_argument('--batch_slots', type=int, default=0, help='Worker modunda aynı anda çalışabilecek en fazla toplu (kanal) iş, 0 eşzamanlılığın yarısı; en az 1 thread etkileşimli işlere ayrılır, yani en fazla eşzamanlılık - 1 (varsayılan: 0)')
+    parser.add_argument('--latency_target', type=float, default=2.0, help='Etkileşimli işlerin hedef kuyruk beklemesi; aşılırsa yeni toplu işler ertelenir (saniye, varsayılan: 2)')
+    parser.add_argument('--max_batch_queue', type=int, default=32, help='Kuyrukta bekleyebilecek en fazla toplu iş; dolunca yenileri reddedilir (varsayılan: 32)')
+    parser.add_argument('--no_coalesce', action='store_true', help='Aynı video için eşzamanlı istekleri birleştirme')
+    parser.add_argument('--socket', type=str, default='', help='Worker modunda stdin yerine dinlenecek Unix soket yolu')
     
     args = parser.parse_args()
     
+    if args.no_cache:
+        get_cache().enabled = False
+    
+    if args.no_dedup:
+        get_fingerprint_index().enabled = False
+    
+    if args.no_result_store:
+        get_result_store().enabled = False
+    
+    if args.no_search_index:
+        get_search_index().enabled = False
+    
+    if args.no_coalesce:
+        summary_flights.enabled = False
+    
+    if args.summary_backend != 'extractive':
+        global chunked_summarizer
+        chunked_summarizer = ChunkedSummarizer(
+            get_backend(args.summary_backend, args.language),
+            max_chunk_tokens=args.max_chunk_tokens,
+            concurrency=args.workers
+        )
+    
+    if args.metrics_file:
+        global metrics_sink
+        metrics_sink = instrumentation.MetricsSink(args.metrics_file, args.metrics_format)
+    
+    if args.serve:
+        # Yanıt kanalını koru; yardımcı fonksiyonların print çıktıları stderr'e gitsin
+        protocol_out = sys.stdout
+        sys.stdout = sys.stderr
+        global job_scheduler
+        # Eşzamanlılık 1 ise işler eskisi gibi sırayla çalışır; tek thread'li bir zamanlayıcıda
+        # kanal çalıştırması etkileşimli işleri bekletirdi
+        if args.serve_concurrency > 1:
+            job_scheduler = JobScheduler(
+                workers=args.serve_concurrency,
+                batch_slots=args.batch_slots or None,
+                latency_target=args.latency_target,
+                max_batch_queue=args.max_batch_queue
+            ).start()
+        if args.socket:
+            serve_unix_socket(args.socket, args.timings, job_scheduler)
+        else:
+            serve(sys.stdin, protocol_out, args.timings, job_scheduler)
+        sys.exit(0)
+    
     # URL veya video_id veya channel_id olmalı
     if not args.url and not args.video_id and not args.channel_id:
         print("Hata: URL, video_id veya channel_id parametrelerinden biri gereklidir.", file=sys.stderr)
@@ -275,37 +1027,37 @@ def main():
     
     results = []
     
+    # Akış modunda her video tamamlandığında bir satır yazılır; sonuçlar bellekte toplanmaz
+    if args.channel_id and args.output_format == 'ndjson':
+        _, timing_block = run_instrumented(
+            args.timings,
+            {"channel_id": args.channel_id},
+            stream_channel,
+            sys.stdout,
+            args.channel_id,
+            args.max_videos,
+            args.language,
+            args.workers,
+            args.rate_limit,
+            args.since_last_run
+        )
+        if args.timings:
+            print(json.dumps({"type": "timings", "timings": timing_block}, ensure_ascii=False), flush=True)
+        sys.exit(0)
+    
     # Kanal ID'si verilmişse, kanalın videolarını işle
     if args.channel_id:
-        videos = get_channel_videos(args.channel_id, args.max_videos)
-        for video in videos:
-            video_id = video['video_id']
-            try:
-                # Video detaylarını al
-                video_details = get_video_details(video_id)
-                # Transkript al
-                transcript = get_video_transcript(video_id, args.language)
-                # Özet oluştur
-                summary_result = generate_summary(video_details, transcript)
-                
-                # Video bilgilerini ekle
-                result = {
-                    "video_id": video_id,
-                    "title": video_details['title'],
-                    "channel_title": video_details['channel_title'],
-                    "summary": summary_result["summary"],
-                    "keyPoints": summary_result["keyPoints"],
-                    "importantTerms": summary_result["importantTerms"],
-                    "transcript_excerpt": summary_result["transcript"]
-                }
-                results.append(result)
-                
-                # API limitlerini aşmamak için kısa bir bekleme
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"Video işlenirken hata ({video_id}): {str(e)}", file=sys.stderr)
-                continue
+        results, timing_block = run_instrumented(
+            args.timings,
+            {"channel_id": args.channel_id},
+            process_channel,
+            args.channel_id,
+            args.max_videos,
+            args.language,
+            args.workers,
+            args.rate_limit,
+            args.since_last_run
+        )
     else:
         # Video ID'sini belirle
         video_id = args.video_id if args.video_id else extract_video_id(args.url)
@@ -314,25 +1066,12 @@ def main():
             sys.exit(1)
         
         try:
-            # YouTube API ile video detaylarını al
-            video_details = get_video_details(video_id)
-            
-            # Transkript al
-            transcript = get_video_transcript(video_id, args.language)
-            
-            # Video detaylarına göre özet oluştur
-            summary_result = generate_summary(video_details, transcript)
-            
             # Tek video için sonucu hazırla
-            result = {
-                "videoId": video_id,
-                "title": video_details['title'],
-                "channelTitle": video_details['channel_title'],
-                "summary": summary_result["summary"],
-                "keyPoints": summary_result["keyPoints"],
-                "importantTerms": summary_result["importantTerms"],
-                "transcriptExcerpt": summary_result["transcript"]
-            }
+            result, timing_block = run_instrumented(
+                args.timings, {"video_id": video_id}, summarize_video, video_id, args.language
+            )
+            if args.timings:
+                result["timings"] = timing_block
             
             # JSON olarak çıktı ver
             print(json.dumps(result, ensure_ascii=False))
@@ -342,9 +1081,12 @@ def main():
             print(f"Hata oluştu: {str(e)}", file=sys.stderr)
             sys.exit(1)
     
-    # Kanal için birden fazla video sonucu varsa
-    if results:
-        print(json.dumps({"videos": results}, ensure_ascii=False))
+    # Kanal için birden fazla video sonucu varsa; artımlı modda yeni video yoksa boş liste döner
+    if results or args.since_last_run:
+        output = {"videos": results}
+        if args.timings:
+            output["timings"] = timing_block
+        print(json.dumps(output, ensure_ascii=False))
         sys.exit(0)
 
 if __name__ == "__main__":
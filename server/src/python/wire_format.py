@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+VideoBite İkili Aktarım Biçimi
+Python betiklerinin Node tarafına döndürdüğü büyük sonuçlar (tam transkript, paragraflar,
+segmentler) için uzunluk önekli ikili çerçeve. Tek bir JSON belgesinde tam metin ve
+ondan türetilen paragraflar/segmentler ayrı ayrı kaçışlanıp iki kez yazılırken, çerçevede
+metin bir kez ham UTF-8 olarak taşınır; yapı içindeki uzun metinler bu bölüme bayt
+ofseti olarak işaret eder.
+
+Çerçeve düzeni (tamsayılar big-endian):
+
+    2 bayt  b'VB'
+    1 bayt  başlık kodlayıcısı: b'J' (JSON) veya b'M' (msgpack)
+    4 bayt  başlık uzunluğu
+    4 bayt  metin bölümü uzunluğu
+    ...     başlık: sonucun kendisi; metin bölümünde geçen dizeler {"$s": [başlangıç, bitiş]}
+    ...     metin bölümü (UTF-8)
+
+Metin bölümü olan çerçevelerde, sonucun kendisindeki tek anahtarlı ve anahtarı "$s",
+"$$s", ... olan nesnelerin anahtarına bir "$" eklenir; çözücü bir "$" çıkarır. Böylece
+{"$s": [1, 2]} biçimli gerçek veriler ofsetlerle karışmaz.
+
+Akış ardışık çerçevelerden oluşur. msgpack yalnızca kuruluysa kullanılabilir; Node
+tarafındaki çözücü (utils/wireFormat.ts) JSON başlıklarını okur.
+"""
+
+import json
+import struct
+from typing import Any, BinaryIO, Iterator, Optional, Tuple
+
+MAGIC = b'VB'
+PREFIX = struct.Struct('>2scII')
+
+CODECS = {'json': b'J', 'msgpack': b'M'}
+
+# Bu uzunluktan kısa dizeler metin bölümünde aranmaz; ofset gösterimi kazanç sağlamaz
+MIN_SHARED_CHARS = 24
+
+SPAN_KEY = '$s'
+ESCAPE_CHAR = '$'
+
+# Paketleyicinin içine inmesi gereken türler; diğer değerler (sayılar, None) olduğu gibi kalır
+_PACKED_TYPES = (str, dict, list, tuple)
+
+
+class WireFormatError(ValueError):
+    """Çerçeve okunamadığında fırlatılır"""
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise WireFormatError("msgpack kodlayıcısı için 'msgpack' paketi kurulu olmalı")
+    return msgpack
+
+
+class _SpanPacker:
+    """Yapıdaki uzun dizeleri metin bölümündeki bayt aralıklarıyla değiştirir"""
+
+    def __init__(self, text: bytes):
+        self.text = text
+        # Paragraflar ve segmentler metinde sırayla geçer; arama son eşleşmeden devam eder
+        self.cursor = 0
+
+    def pack(self, value: Any) -> Any:
+        packed = _PACKED_TYPES
+        if isinstance(value, str):
+            if len(value) < MIN_SHARED_CHARS:
+                return value
+            data = value.encode('utf-8')
+            position = self.text.find(data, self.cursor)
+            if position < 0:
+                position = self.text.find(data)
+                if position < 0:
+                    return value
+            self.cursor = position + len(data)
+            return {SPAN_KEY: [position, self.cursor]}
+        # Skaler değerler için fonksiyon çağrısı yapılmaz; segment listelerinde maliyetin çoğu budur
+        if isinstance(value, dict):
+            result = {key: self.pack(item) if isinstance(item, packed) else item for key, item in value.items()}
+            if len(result) == 1:
+                key, = result
+                if _is_span_key(key):
+                    # Ofset nesnesiyle karışmasın diye kaçışlanır
+                    return {ESCAPE_CHAR + key: result[key]}
+            return result
+        if isinstance(value, (list, tuple)):
+            return [self.pack(item) if isinstance(item, packed) else item for item in value]
+        return value
+
+
+def _is_span_key(key: Any) -> bool:
+    """"$s" ve kaçışlanmış biçimleri ("$$s", "$$$s", ...) için True"""
+    return isinstance(key, str) and key.endswith(SPAN_KEY) and key.lstrip(ESCAPE_CHAR) == 's'
+
+
+def _span_resolver(text: bytes):
+    """Çözücünün her nesne için çağırdığı, ofset nesnelerini metne çeviren ve kaçışı geri alan kanca"""
+    def resolve(value: dict) -> Any:
+        if len(value) == 1:
+            span = value.get(SPAN_KEY)
+            if span is not None:
+                return text[span[0]:span[1]].decode('utf-8')
+            key, = value
+            if key != SPAN_KEY and _is_span_key(key):
+                return {key[1:]: value[key]}
+        return value
+    return resolve
+
+
+def encode_frame(value: Any, shared_text: str = '', codec: str = 'json') -> bytes:
+    """Değeri tek bir çerçeveye kodlar
+
+    Args:
+        value: JSON'a çevrilebilir sonuç
+        shared_text: Yapıdaki dizelerin çoğunun içinde geçtiği metin (ör. tam transkript);
+            bir kez yazılır, MIN_SHARED_CHARS ve üzeri uzunluktaki eşleşen dizeler ofsete çevrilir
+        codec: Başlık kodlayıcısı ('json' veya 'msgpack')
+
+    Returns:
+        Çerçeve baytları
+    """
+    if codec not in CODECS:
+        raise WireFormatError(f"Bilinmeyen kodlayıcı: {codec}")
+
+    text = shared_text.encode('utf-8')
+    header_value = _SpanPacker(text).pack(value) if text else value
+    if codec == 'msgpack':
+        header = _msgpack().packb(header_value, use_bin_type=True)
+    else:
+        header = json.dumps(header_value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return PREFIX.pack(MAGIC, CODECS[codec], len(header), len(text)) + header + text
+
+
+def decode_frame(data: bytes, offset: int = 0) -> Tuple[Any, int]:
+    """Verilen konumdaki çerçeveyi çözer
+
+    Args:
+        data: Bir veya daha fazla çerçeve içeren baytlar
+        offset: Çerçevenin başlangıcı
+
+    Returns:
+        (çözülmüş değer, sonraki çerçevenin başlangıcı)
+    """
+    if len(data) - offset < PREFIX.size:
+        raise WireFormatError("Eksik çerçeve öneki")
+    magic, codec, header_length, text_length = PREFIX.unpack_from(data, offset)
+    if magic != MAGIC:
+        raise WireFormatError("Geçersiz çerçeve imzası")
+    header_start = offset + PREFIX.size
+    text_start = header_start + header_length
+    end = text_start + text_length
+    if len(data) < end:
+        raise WireFormatError("Eksik çerçeve gövdesi")
+
+    header = data[header_start:text_start]
+    # Ofsetler çözücünün nesne kancasıyla, ayrı bir Python geçişi olmadan metne çevrilir
+    hook = _span_resolver(data[text_start:end]) if text_length else None
+    if codec == CODECS['json']:
+        value = json.loads(header, object_hook=hook)
+    elif codec == CODECS['msgpack']:
+        value = _msgpack().unpackb(header, raw=False, object_hook=hook)
+    else:
+        raise WireFormatError(f"Bilinmeyen kodlayıcı baytı: {codec!r}")
+    return value, end
+
+
+def write_frame(out: BinaryIO, value: Any, shared_text: str = '', codec: str = 'json') -> None:
+    """Çerçeveyi ikili akışa yazar ve akışı boşaltır"""
+    out.write(encode_frame(value, shared_text, codec))
+    out.flush()
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> Optional[bytes]:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            if remaining == size:
+                return None
+            raise WireFormatError("Akış çerçeve ortasında bitti")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+def read_frames(stream: BinaryIO) -> Iterator[Any]:
+    """İkili akıştaki çerçeveleri sırayla çözer"""
+    while True:
+        prefix = _read_exactly(stream, PREFIX.size)
+        if prefix is None:
+            return
+        _, _, header_length, text_length = PREFIX.unpack(prefix)
+        body = _read_exactly(stream, header_length + text_length) or b''
+        value, _ = decode_frame(prefix + body)
+        yield value
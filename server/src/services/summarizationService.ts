@@ -1,86 +1,258 @@
-import { spawn } from 'child_process';
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
 import path from 'path';
+import readline from 'readline';
 import config from '../config/config';
 import logger from '../utils/logger';
 
+interface SummaryHighlight {
+  type: 'summary' | 'keyPoint';
+  text: string;
+  start: number;
+  end: number;
+}
+
 interface SummaryResult {
   summary: string;
   keyPoints: string[];
   importantTerms: Record<string, string>;
+  highlights?: SummaryHighlight[];
+  duplicateOf?: { videoId: string; similarity: number };
+}
+
+interface WorkerResponse {
+  id: number;
+  ok: boolean;
+  result?: any;
+  error?: string;
+}
+
+interface PendingJob {
+  resolve: (value: any) => void;
+  reject: (reason: Error) => void;
 }
 
 /**
- * Harici bir Python betiğini çalıştırarak YouTube videosu için özet oluşturur
- * @param videoUrl YouTube video URL'si
- * @param language Transkript dili (varsayılan: tr)
- * @returns Video özeti ve anahtar noktaları
+ * `video_summary.py --serve` ile çalışan kalıcı Python worker'ı.
+ * Tek bir sıcak süreç, her istek için yorumlayıcı başlatma ve import maliyetini ortadan kaldırır.
  */
-export const generateVideoSummary = (videoUrl: string, language: string = 'tr'): Promise<any> => {
-  return new Promise((resolve, reject) => {
-    const pythonScriptPath = path.join(__dirname, '../python/video_summary.py');
-    
-    logger.info(`Python betiği çalıştırılıyor: ${pythonScriptPath}`);
-    
-    // Uygun ortama göre Python yorumlayıcısı seç
-    const pythonExecutable = config.isProd ? 'python3' : 'python';
-    
-    // YouTube videosu için özet oluşturmak üzere Python betiğini çalıştır
-    const pythonProcess = spawn(pythonExecutable, [
-      pythonScriptPath,
-      '--url', videoUrl,
-      '--language', language,
-    ]);
-    
-    let dataString = '';
-    let errorString = '';
-    
-    // Standart çıktıdan gelen veriyi topla
-    pythonProcess.stdout.on('data', (data) => {
-      dataString += data.toString();
+class PythonSummaryWorker {
+  private process: ChildProcessWithoutNullStreams | null = null;
+  private pending = new Map<number, PendingJob>();
+  private nextId = 1;
+
+  constructor(private scriptPath: string, private pythonExecutable: string) {}
+
+  private start(): ChildProcessWithoutNullStreams {
+    logger.info(`Python worker başlatılıyor: ${this.scriptPath}`);
+
+    const workerProcess = spawn(this.pythonExecutable, [this.scriptPath, '--serve']);
+
+    // Her satır tek bir iş yanıtıdır
+    const lines = readline.createInterface({ input: workerProcess.stdout });
+    lines.on('line', (line) => {
+      let response: WorkerResponse;
+      try {
+        response = JSON.parse(line);
+      } catch (err) {
+        logger.error(`Worker yanıtı ayrıştırılamadı: ${line}`);
+        return;
+      }
+
+      const job = this.pending.get(response.id);
+      if (!job) {
+        return;
+      }
+      this.pending.delete(response.id);
+
+      if (response.ok) {
+        job.resolve(response.result);
+      } else {
+        job.reject(new Error(`Python işlemi başarısız oldu: ${response.error}`));
+      }
     });
-    
-    // Hata çıktısını topla
-    pythonProcess.stderr.on('data', (data) => {
-      errorString += data.toString();
-      logger.error(`Python betiği hata çıktısı: ${data.toString()}`);
+
+    workerProcess.stderr.on('data', (data) => {
+      logger.error(`Python worker hata çıktısı: ${data.toString()}`);
     });
-    
-    // İşlem tamamlandığında
-    pythonProcess.on('close', (code) => {
-      if (code !== 0) {
-        logger.error(`Python işlemi başarısız oldu, çıkış kodu: ${code}`);
-        logger.error(`Hata: ${errorString}`);
-        return reject(new Error(`Python işlemi başarısız oldu: ${errorString}`));
+
+    // Worker kapanırsa bekleyen işleri reddet; sonraki istek yeni bir worker başlatır
+    workerProcess.on('close', (code) => {
+      logger.error(`Python worker sonlandı, çıkış kodu: ${code}`);
+      this.failPending(new Error(`Python worker sonlandı, çıkış kodu: ${code}`));
+      if (this.process === workerProcess) {
+        this.process = null;
       }
-      
-      try {
-        // Python'dan dönen JSON veriyi ayrıştır
-        const result = JSON.parse(dataString);
-        logger.info('Video özeti başarıyla oluşturuldu');
-        resolve(result);
-      } catch (err) {
-        logger.error(`JSON ayrıştırma hatası: ${err}`);
-        logger.error(`Alınan veri: ${dataString}`);
-        reject(new Error('Python betiğinden dönen veri ayrıştırılamadı'));
+    });
+
+    // Kapanmış bir worker'a yazmak süreci çökertmesin
+    workerProcess.stdin.on('error', (err) => {
+      logger.error(`Python worker'a yazılırken hata: ${err}`);
+    });
+
+    workerProcess.on('error', (err) => {
+      logger.error(`Python worker çalıştırılırken hata: ${err}`);
+      this.failPending(new Error(`Python işlemi çalıştırılırken hata: ${err.message}`));
+      if (this.process === workerProcess) {
+        this.process = null;
       }
     });
-    
-    // Beklenmeyen bir hata durumunda
-    pythonProcess.on('error', (err) => {
-      logger.error(`Python işlemi çalıştırılırken hata: ${err}`);
-      reject(new Error(`Python işlemi çalıştırılırken hata: ${err.message}`));
+
+    return workerProcess;
+  }
+
+  private failPending(error: Error): void {
+    for (const job of this.pending.values()) {
+      job.reject(error);
+    }
+    this.pending.clear();
+  }
+
+  /**
+   * Worker'a bir iş gönderir ve yanıtını bekler
+   * @param job İş parametreleri (url, video_id, channel_id, language...)
+   * @returns Python tarafının döndürdüğü sonuç
+   */
+  public submit(job: Record<string, unknown>): Promise<any> {
+    if (!this.process) {
+      this.process = this.start();
+    }
+
+    const id = this.nextId++;
+    return new Promise((resolve, reject) => {
+      this.pending.set(id, { resolve, reject });
+      this.process!.stdin.write(JSON.stringify({ ...job, id }) + '\n');
     });
-  });
+  }
+}
+
+const summaryWorker = new PythonSummaryWorker(
+  path.join(__dirname, '../python/video_summary.py'),
+  // Uygun ortama göre Python yorumlayıcısı seç
+  config.isProd ? 'python3' : 'python'
+);
+
+/**
+ * Kalıcı Python worker'ı kullanarak YouTube videosu için özet oluşturur
+ * @param videoUrl YouTube video URL'si
+ * @param language Transkript dili (varsayılan: tr)
+ * @param userId İsteği yapan kullanıcı; worker kuyruğunda kullanıcılar arasında adil sıra için
+ * @returns Video özeti ve anahtar noktaları
+ */
+export const generateVideoSummary = async (
+  videoUrl: string,
+  language: string = 'tr',
+  userId?: string
+): Promise<any> => {
+  logger.info(`Python worker'a özet işi gönderiliyor: ${videoUrl}`);
+
+  const result = await summaryWorker.submit({ url: videoUrl, language, user: userId });
+  logger.info('Video özeti başarıyla oluşturuldu');
+  return result;
 };
 
+/**
+ * Python sonuç deposundaki özetleri tek sorguda okur (yeniden işleme veya ağ isteği yapılmaz)
+ * @param videoIds YouTube video ID'leri
+ * @param language Özet dili (varsayılan: tr)
+ * @returns Depoda bulunan videoların özetleri; bulunmayanlar atlanır
+ */
+export const getStoredVideoSummaries = async (videoIds: string[], language: string = 'tr'): Promise<any[]> => {
+  if (videoIds.length === 0) {
+    return [];
+  }
+
+  const result = await summaryWorker.submit({ stored_video_ids: videoIds, language });
+  return result.videos;
+};
+
+/**
+ * Python worker'ının istek birleştirme ve iş zamanlayıcısı sayaçları
+ */
+export interface SummaryWorkerStats {
+  singleFlight: {
+    inFlight: number;
+    executions: number;
+    coalesced: number;
+  };
+  // Sınıf (interactive/batch) başına kuyruk derinliği, bekleme süresi yüzdelikleri, ertelenen ve reddedilen işler
+  scheduler: Record<string, any> | null;
+}
+
+/**
+ * Worker'ın istek birleştirme ve kuyruk istatistiklerini döndürür (iş kuyruğunu beklemez)
+ * @returns Birleştirilen istek sayıları ve zamanlayıcı kuyruk durumu (worker başladığından beri)
+ */
+export const getSummaryWorkerStats = async (): Promise<SummaryWorkerStats> => {
+  const result = await summaryWorker.submit({ worker_stats: true });
+  const { in_flight: inFlight, executions, coalesced } = result.singleFlight;
+  return { singleFlight: { inFlight, executions, coalesced }, scheduler: result.scheduler };
+};
+
+/**
+ * Transkript arama indeksindeki eşleşmenin segmenti
+ */
+export interface TranscriptSearchSegment {
+  index: number;
+  start: number;
+  matches: number;
+}
+
+/**
+ * Transkript arama sonucu (BM25 puanına göre sıralı)
+ */
+export interface TranscriptSearchResult {
+  videoId: string;
+  score: number;
+  segments: TranscriptSearchSegment[];
+  title?: string;
+  channelTitle?: string;
+}
+
+/**
+ * İşlenmiş transkriptler üzerinde çevrimdışı tam metin arama yapar (transkriptler yeniden çekilmez)
+ * @param query Aranacak metin
+ * @param limit Döndürülecek video sayısı (varsayılan: 10)
+ * @param language Başlıkların okunacağı özet dili (varsayılan: tr)
+ * @returns Videolar ve eşleşen segmentlerin başlangıç zamanları (saniye)
+ */
+export const searchTranscripts = async (
+  query: string,
+  limit: number = 10,
+  language: string = 'tr'
+): Promise<TranscriptSearchResult[]> => {
+  if (!query.trim()) {
+    return [];
+  }
+
+  const result = await summaryWorker.submit({ search: query, limit, language });
+  return result.results;
+};
+
+/**
+ * Python betiğinin `--output_format ndjson` modunda satır satır yazdığı kanal olayları
+ */
+export type ChannelStreamEvent =
+  | { type: 'start'; channel_id: string; total: number }
+  | { type: 'result'; index: number; completed: number; total: number; video: any }
+  | { type: 'error'; index: number; completed: number; total: number; video_id: string; error: string }
+  | { type: 'done'; total: number; succeeded: number; failed: number };
+
 /**
  * Bir YouTube kanalındaki videoları ve özetleri getirir
  * @param channelId YouTube kanal ID'si
  * @param maxVideos Maksimum video sayısı (varsayılan: 10)
  * @param language Transkript dili (varsayılan: tr)
- * @returns Kanal videoları ve özetleri
+ * @param sinceLastRun Yalnızca son çalıştırmadan sonra yüklenen videoları işle (varsayılan: false)
+ * @param onEvent Verilirse her video tamamlandığında çağrılır; sonuçlar bellekte toplanmaz
+ * @returns Kanal videoları ve özetleri (onEvent verildiyse yalnızca sayılar)
  */
-export const getChannelVideoSummaries = (channelId: string, maxVideos: number = 10, language: string = 'tr'): Promise<any> => {
+export const getChannelVideoSummaries = (
+  channelId: string,
+  maxVideos: number = 10,
+  language: string = 'tr',
+  sinceLastRun: boolean = false,
+  onEvent?: (event: ChannelStreamEvent) => void
+): Promise<any> => {
   return new Promise((resolve, reject) => {
     const pythonScriptPath = path.join(__dirname, '../python/video_summary.py');
     
@@ -89,20 +261,44 @@ export const getChannelVideoSummaries = (channelId: string, maxVideos: number =
     // Uygun ortama göre Python yorumlayıcısı seç
     const pythonExecutable = config.isProd ? 'python3' : 'python';
     
-    // Kanal videolarını getirmek için Python betiğini çalıştır
-    const pythonProcess = spawn(pythonExecutable, [
+    // Kanal videolarını getirmek için Python betiğini satır satır JSON çıktısıyla çalıştır
+    const args = [
       pythonScriptPath,
       '--channel_id', channelId,
       '--max_videos', maxVideos.toString(),
       '--language', language,
-    ]);
+      '--output_format', 'ndjson',
+    ];
+    if (sinceLastRun) {
+      args.push('--since_last_run');
+    }
+    const pythonProcess = spawn(pythonExecutable, args);
     
-    let dataString = '';
+    const videos: { index: number; video: any }[] = [];
+    let done: Extract<ChannelStreamEvent, { type: 'done' }> | null = null;
     let errorString = '';
     
-    // Standart çıktıdan gelen veriyi topla
-    pythonProcess.stdout.on('data', (data) => {
-      dataString += data.toString();
+    // Her satır tek bir olaydır; tamamlanan videolar hemen iletilir
+    const lines = readline.createInterface({ input: pythonProcess.stdout });
+    lines.on('line', (line) => {
+      let event: ChannelStreamEvent;
+      try {
+        event = JSON.parse(line);
+      } catch (err) {
+        logger.error(`Kanal olayı ayrıştırılamadı: ${line}`);
+        return;
+      }
+      
+      if (event.type === 'done') {
+        done = event;
+      } else if (event.type === 'error') {
+        logger.error(`Kanal videosu işlenemedi (${event.video_id}): ${event.error}`);
+      } else if (event.type === 'result' && !onEvent) {
+        videos.push({ index: event.index, video: event.video });
+      }
+      if (onEvent) {
+        onEvent(event);
+      }
     });
     
     // Hata çıktısını topla
@@ -119,16 +315,17 @@ export const getChannelVideoSummaries = (channelId: string, maxVideos: number =
         return reject(new Error(`Python işlemi başarısız oldu: ${errorString}`));
       }
       
-      try {
-        // Python'dan dönen JSON veriyi ayrıştır
-        const result = JSON.parse(dataString);
-        logger.info(`Kanal için ${result.videos?.length || 0} video özeti başarıyla oluşturuldu`);
-        resolve(result);
-      } catch (err) {
-        logger.error(`JSON ayrıştırma hatası: ${err}`);
-        logger.error(`Alınan veri: ${dataString}`);
-        reject(new Error('Python betiğinden dönen veri ayrıştırılamadı'));
+      if (!done) {
+        return reject(new Error('Python betiği kanal akışını tamamlamadı'));
+      }
+      
+      logger.info(`Kanal için ${done.succeeded} video özeti başarıyla oluşturuldu`);
+      if (onEvent) {
+        return resolve(done);
       }
+      // Olaylar tamamlanma sırasıyla gelir; kanal listesindeki sıraya geri diz
+      videos.sort((a, b) => a.index - b.index);
+      resolve({ videos: videos.map((entry) => entry.video) });
     });
     
     // Beklenmeyen bir hata durumunda
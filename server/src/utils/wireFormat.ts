@@ -0,0 +1,94 @@
+/**
+ * Python betiklerinin `--output_format binary` ile yazdığı uzunluk önekli çerçevelerin çözücüsü
+ * (biçim için bkz. python/wire_format.py). Tam metin çerçevede bir kez ham UTF-8 olarak
+ * taşınır; başlıktaki `{"$s": [başlangıç, bitiş]}` nesneleri bu bölümdeki bayt aralıklarıdır.
+ * Sonucun kendisindeki tek anahtarlı `"$s"`, `"$$s"`, ... nesneleri kodlanırken bir `$` ile
+ * kaçışlanır; çözücü bu `$`'ı çıkarır.
+ */
+
+const MAGIC = 'VB';
+const PREFIX_SIZE = 11;
+const SPAN_KEY = '$s';
+const ESCAPE_CHAR = '$';
+
+// Kaçışlanmış ofset anahtarları: "$$s", "$$$s", ...
+const ESCAPED_SPAN_KEY = /^\$\$+s$/;
+
+export interface DecodedFrame<T = any> {
+  value: T;
+  next: number;
+}
+
+const resolveSpans = (value: any, text: Buffer): any => {
+  if (Array.isArray(value)) {
+    for (let i = 0; i < value.length; i++) {
+      value[i] = resolveSpans(value[i], text);
+    }
+    return value;
+  }
+  if (value !== null && typeof value === 'object') {
+    const keys = Object.keys(value);
+    if (keys.length === 1) {
+      const span = value[SPAN_KEY];
+      if (span !== undefined && span !== null) {
+        return text.toString('utf8', span[0], span[1]);
+      }
+      if (ESCAPED_SPAN_KEY.test(keys[0])) {
+        return { [keys[0].slice(ESCAPE_CHAR.length)]: resolveSpans(value[keys[0]], text) };
+      }
+    }
+    for (const key of keys) {
+      value[key] = resolveSpans(value[key], text);
+    }
+  }
+  return value;
+};
+
+/**
+ * Verilen konumdaki çerçeveyi çözer
+ * @param data Bir veya daha fazla çerçeve içeren tampon
+ * @param offset Çerçevenin başlangıcı
+ * @returns Çözülmüş değer ve sonraki çerçevenin başlangıcı
+ */
+export const decodeFrame = <T = any>(data: Buffer, offset: number = 0): DecodedFrame<T> => {
+  if (data.length - offset < PREFIX_SIZE) {
+    throw new Error('Eksik çerçeve öneki');
+  }
+  if (data.toString('latin1', offset, offset + 2) !== MAGIC) {
+    throw new Error('Geçersiz çerçeve imzası');
+  }
+
+  const codec = data.toString('latin1', offset + 2, offset + 3);
+  const headerLength = data.readUInt32BE(offset + 3);
+  const textLength = data.readUInt32BE(offset + 7);
+  const headerStart = offset + PREFIX_SIZE;
+  const textStart = headerStart + headerLength;
+  const end = textStart + textLength;
+  if (data.length < end) {
+    throw new Error('Eksik çerçeve gövdesi');
+  }
+  if (codec !== 'J') {
+    // msgpack başlıkları Python tarafında isteğe bağlıdır; Node yalnızca JSON başlıklarını okur
+    throw new Error(`Desteklenmeyen çerçeve kodlayıcısı: ${codec}`);
+  }
+
+  const header = JSON.parse(data.toString('utf8', headerStart, textStart));
+  const value = textLength > 0 ? resolveSpans(header, data.subarray(textStart, end)) : header;
+  return { value, next: end };
+};
+
+/**
+ * Tampondaki tüm çerçeveleri sırayla çözer
+ * @param data Ardışık çerçeveler
+ * @returns Çözülmüş değerler
+ */
+export const decodeFrames = <T = any>(data: Buffer): T[] => {
+  const values: T[] = [];
+  let offset = 0;
+  while (offset < data.length) {
+    const frame = decodeFrame<T>(data, offset);
+    values.push(frame.value);
+    offset = frame.next;
+  }
+  return values;
+};
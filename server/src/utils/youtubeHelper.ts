@@ -3,6 +3,7 @@ import logger from './logger';
 import config from '../config/config';
 import { spawn } from 'child_process';
 import path from 'path';
+import { decodeFrame } from './wireFormat';
 
 // YouTube transcript API için interface tanımlaması
 interface TranscriptSegment {
@@ -47,52 +48,80 @@ export const getVideoDetails = async (videoId: string) => {
   }
 };
 
+// İşlenmiş transkript (python/data_pipeline.py format_transcript_for_openai çıktısı)
+interface ProcessedTranscript {
+  title: string;
+  statistics: Record<string, string | number>;
+  important_terms: Record<string, number>;
+  full_text: string;
+  paragraphs: string[];
+}
+
+// get_transcript.py'yi ikili çerçeve çıktısıyla çalıştırır ve çerçeveyi çözer
+const runTranscriptScript = (args: string[]): Promise<any> => {
+  return new Promise((resolve, reject) => {
+    const pythonScriptPath = path.join(__dirname, '../python/get_transcript.py');
+    const pythonProcess = spawn('python', [pythonScriptPath, ...args, '--output_format', 'binary']);
+
+    // Çıktı metin olarak birleştirilmez; tam metin çerçevede ham UTF-8 baytlardır
+    const chunks: Buffer[] = [];
+    let scriptError = '';
+
+    pythonProcess.stdout.on('data', (data: Buffer) => {
+      chunks.push(data);
+    });
+
+    pythonProcess.stderr.on('data', (data) => {
+      scriptError += data.toString();
+    });
+
+    pythonProcess.on('close', (code) => {
+      if (code !== 0) {
+        logger.error(`Python transcript script error: ${scriptError}`);
+        reject(new Error(`Python transcript script failed: ${scriptError}`));
+        return;
+      }
+
+      try {
+        resolve(decodeFrame(Buffer.concat(chunks)).value);
+      } catch (err) {
+        logger.error(`Python transcript output parse error: ${err}`);
+        reject(new Error(`Failed to parse transcript output: ${err}`));
+      }
+    });
+
+    pythonProcess.on('error', (err) => {
+      reject(new Error(`Python transcript script could not start: ${err.message}`));
+    });
+  });
+};
+
 // YouTube video transkript alma - Python script kullanarak
 export const getYoutubeTranscript = async (videoId: string, language = 'tr') => {
-  return new Promise<{ text: string, segments: TranscriptSegment[] }>((resolve, reject) => {
-    try {
-      const pythonScriptPath = path.join(__dirname, '../python/get_transcript.py');
-      
-      // Python process'i başlat
-      const pythonProcess = spawn('python', [pythonScriptPath, videoId, language]);
-      
-      let scriptOutput = '';
-      let scriptError = '';
-      
-      // Python çıktısını topla
-      pythonProcess.stdout.on('data', (data) => {
-        scriptOutput += data.toString();
-      });
-      
-      // Python hata mesajlarını topla
-      pythonProcess.stderr.on('data', (data) => {
-        scriptError += data.toString();
-      });
-      
-      // İşlem tamamlandığında
-      pythonProcess.on('close', (code) => {
-        if (code !== 0) {
-          logger.error(`Python transcript script error: ${scriptError}`);
-          reject(new Error(`Python transcript script failed: ${scriptError}`));
-          return;
-        }
-        
-        try {
-          const result = JSON.parse(scriptOutput);
-          resolve({
-            text: result.fullTranscript,
-            segments: result.segments
-          });
-        } catch (err) {
-          logger.error(`Python transcript output parse error: ${err}`);
-          reject(new Error(`Failed to parse transcript output: ${err}`));
-        }
-      });
-    } catch (error: any) {
-      logger.error(`YouTube transkript alınırken hata: ${error.message}`);
-      reject(new Error('Video transkripti alınamadı: ' + error.message));
+  try {
+    const result = await runTranscriptScript([videoId, language]);
+    return {
+      text: result.fullTranscript as string,
+      segments: result.segments as TranscriptSegment[]
+    };
+  } catch (error: any) {
+    logger.error(`YouTube transkript alınırken hata: ${error.message}`);
+    throw new Error('Video transkripti alınamadı: ' + error.message);
+  }
+};
+
+// Temizlenmiş, cümle/paragraflara ayrılmış transkripti ve istatistiklerini alma
+export const getProcessedTranscript = async (videoId: string, language = 'tr'): Promise<ProcessedTranscript> => {
+  try {
+    const result = await runTranscriptScript([videoId, language, '--processed']);
+    if (result.error) {
+      throw new Error(result.error);
     }
-  });
+    return result as ProcessedTranscript;
+  } catch (error: any) {
+    logger.error(`İşlenmiş transkript alınırken hata: ${error.message}`);
+    throw new Error('İşlenmiş transkript alınamadı: ' + error.message);
+  }
 };
 
 // YouTube URL geçerliliğini kontrol et